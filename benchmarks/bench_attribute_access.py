@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for the attribute access of plugins.
+
+Compares the current GwBasePattern, which wraps activate() and deactivate() during class creation, with the former
+implementation, which intercepted every attribute access via __getattribute__.
+
+Usage::
+
+    python benchmarks/bench_attribute_access.py
+"""
+import timeit
+
+from groundwork import App
+from groundwork.patterns import GwBasePattern
+
+
+class BenchPlugin(GwBasePattern):
+    def __init__(self, app, **kwargs):
+        self.name = kwargs.get("name", self.__class__.__name__)
+        super(BenchPlugin, self).__init__(app, **kwargs)
+
+    def activate(self):
+        pass
+
+    def deactivate(self):
+        pass
+
+
+class LegacyBenchPlugin(BenchPlugin):
+    """
+    Uses the __getattribute__ implementation of groundwork <= 0.1.16.
+    """
+    def __getattribute__(self, name):
+        attr = object.__getattribute__(self, name)
+        if hasattr(attr, '__call__'):
+            if hasattr(attr, "__name__"):
+                if attr.__name__ == "activate":
+                    def newfunc(*args, **kwargs):
+                        self._pre_activate_injection()
+                        result = attr(*args, **kwargs)
+                        self._post_activate_injection()
+                        return result
+                    return newfunc
+                elif attr.__name__ == "deactivate":
+                    def newfunc(*args, **kwargs):
+                        self._pre_deactivate_injection()
+                        result = attr(*args, **kwargs)
+                        self._post_deactivate_injection()
+                        return result
+                    return newfunc
+
+        return attr
+
+
+# Benchmarked plugins by label. The timers import them from this module, because timeit.Timer supports
+# the parameter globals only on Python >= 3.5.
+PLUGINS = {}
+
+
+def main(number=500000):
+    app = App()
+    PLUGINS["current"] = BenchPlugin(app, name="current")
+    PLUGINS["legacy"] = LegacyBenchPlugin(app, name="legacy")
+
+    print("%-20s %12s %12s %8s" % ("attribute", "legacy [ns]", "current [ns]", "speedup"))
+    for attribute in ["app", "log", "signals", "name", "activate"]:
+        durations = {}
+        for label in ["current", "legacy"]:
+            timer = timeit.Timer("plugin.%s" % attribute,
+                                 setup="from %s import PLUGINS; plugin = PLUGINS[%r]" % (__name__, label))
+            durations[label] = min(timer.repeat(repeat=5, number=number)) / number * 1e9
+        print("%-20s %12.1f %12.1f %7.1fx" % (attribute, durations["legacy"], durations["current"],
+                                              durations["legacy"] / durations["current"]))
+
+
+if __name__ == "__main__":
+    main()
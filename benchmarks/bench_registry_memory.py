@@ -0,0 +1,127 @@
+"""
+Memory benchmark for the records of the application level registries.
+
+Registers 100k signals, receivers, commands, documents, threads, shared objects, recipes and plugin classes and
+reports the allocated bytes per record (measured by tracemalloc, including the registry entry) and the size of
+a single record object.
+
+Usage::
+
+    python benchmarks/bench_registry_memory.py [amount]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+from groundwork import App
+from groundwork.patterns import GwCommandsPattern, GwDocumentsPattern, GwRecipesPattern, GwSharedObjectsPattern, \
+    GwThreadsPattern
+
+
+class BenchPlugin(GwCommandsPattern, GwDocumentsPattern, GwRecipesPattern, GwSharedObjectsPattern,
+                  GwThreadsPattern):
+    def __init__(self, app, **kwargs):
+        self.name = "BenchPlugin"
+        super(BenchPlugin, self).__init__(app, **kwargs)
+
+    def activate(self):
+        pass
+
+    def deactivate(self):
+        pass
+
+    def receive(self, plugin, **kwargs):
+        pass
+
+
+def _register_signals(app, plugin, amount):
+    for i in range(amount):
+        app.signals.register("signal_%s" % i, plugin, "Benchmark signal")
+    return app.signals.signals
+
+
+def _register_receivers(app, plugin, amount):
+    app.signals.register("bench_signal", plugin, "Benchmark signal")
+    for i in range(amount):
+        app.signals.connect("receiver_%s" % i, "bench_signal", plugin.receive, plugin, "Benchmark receiver")
+    return app.signals.receivers
+
+
+def _register_commands(app, plugin, amount):
+    for i in range(amount):
+        app.commands.register("command_%s" % i, "Benchmark command", plugin.receive, plugin=plugin)
+    return app.commands._commands
+
+
+def _register_documents(app, plugin, amount):
+    for i in range(amount):
+        app.documents.register("document_%s" % i, "Content", plugin, "Benchmark document")
+    return app.documents.documents
+
+
+def _register_threads(app, plugin, amount):
+    for i in range(amount):
+        app.threads.register("thread_%s" % i, plugin.receive, plugin, "Benchmark thread")
+    return app.threads.threads
+
+
+def _register_shared_objects(app, plugin, amount):
+    for i in range(amount):
+        app.shared_objects.register("shared_object_%s" % i, "Benchmark shared object", i, plugin)
+    return app.shared_objects._shared_objects
+
+
+def _register_recipes(app, plugin, amount):
+    path = os.path.abspath(os.path.dirname(__file__))
+    for i in range(amount):
+        app.recipes.register("recipe_%s" % i, path, plugin, "Benchmark recipe")
+    return app.recipes.recipes
+
+
+def _register_plugin_classes(app, plugin, amount):
+    for i in range(amount):
+        app.plugins.classes.register_class(BenchPlugin, "plugin_class_%s" % i)
+    return app.plugins.classes._classes
+
+
+REGISTRIES = [
+    ("Signal", _register_signals),
+    ("Receiver", _register_receivers),
+    ("Command", _register_commands),
+    ("Document", _register_documents),
+    ("Thread", _register_threads),
+    ("SharedObject", _register_shared_objects),
+    ("Recipe", _register_recipes),
+    ("PluginClass", _register_plugin_classes),
+]
+
+
+def _record_size(record):
+    size = sys.getsizeof(record)
+    if hasattr(record, "__dict__"):
+        size += sys.getsizeof(record.__dict__)
+    return size
+
+
+def main(amount=100000):
+    print("%-14s %16s %14s" % ("record", "bytes/record", "object size"))
+    for name, register in REGISTRIES:
+        app = App(plugins=[BenchPlugin])
+        app.plugins.activate(["BenchPlugin"])
+        plugin = app.plugins.get("BenchPlugin")
+        gc.collect()
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        registry = register(app, plugin, amount)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        record = registry[sorted(registry.keys())[-1]]
+        print("%-14s %16.1f %14d" % (name, float(after - before) / amount, _record_size(record)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
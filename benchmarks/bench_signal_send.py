@@ -0,0 +1,71 @@
+"""
+Benchmark for sending signals.
+
+Sends a signal with 10 connected receivers (8 for all senders, 2 for a specific sender) and reports the duration
+per send, also with enabled dispatch metrics. Also reports the duration per payload for send_many() with 100 payloads
+per call.
+
+Usage::
+
+    python benchmarks/bench_signal_send.py
+"""
+import timeit
+
+from groundwork import App
+from groundwork.patterns import GwBasePattern
+
+
+class BenchPlugin(GwBasePattern):
+    def __init__(self, app, **kwargs):
+        self.name = kwargs.get("name", "BenchPlugin")
+        super(BenchPlugin, self).__init__(app, **kwargs)
+
+    def activate(self):
+        self.signals.register("bench_signal", "Benchmark signal")
+        for i in range(8):
+            self.signals.connect("bench_receiver_%s" % i, "bench_signal", self.receive, "Benchmark receiver")
+
+    def deactivate(self):
+        pass
+
+    def receive(self, plugin, **kwargs):
+        return kwargs
+
+
+class Sender(object):
+    name = "Sender"
+
+
+def main(number=100000):
+    app = App(plugins=[BenchPlugin])
+    app.plugins.activate(["BenchPlugin"])
+    plugin = app.plugins.get("BenchPlugin")
+    # blinker calls a function only once, even if it was connected several times. So we need different functions.
+    for i in range(8):
+        app.signals.connect("bench_function_receiver_%s" % i, "bench_signal",
+                            (lambda plugin, **kwargs: kwargs), plugin, "Benchmark receiver")
+    for i in range(2):
+        app.signals.connect("bench_sender_receiver_%s" % i, "bench_signal",
+                            (lambda plugin, **kwargs: kwargs), plugin, "Benchmark receiver", sender=plugin)
+    other = Sender()
+
+    print("%-30s %12s" % ("case", "us/send"))
+    for case, sender in [("specific sender", plugin), ("other sender", other)]:
+        timer = timeit.Timer(lambda sender=sender: app.signals.send("bench_signal", sender, value=1))
+        duration = min(timer.repeat(repeat=5, number=number)) / number * 1e6
+        print("%-30s %12.2f (%s receivers)" % (case, duration, len(app.signals.send("bench_signal", sender))))
+
+    app.signals.enable_stats()
+    timer = timeit.Timer(lambda: app.signals.send("bench_signal", other, value=1))
+    duration = min(timer.repeat(repeat=5, number=number)) / number * 1e6
+    print("%-30s %12.2f" % ("other sender, stats enabled", duration))
+    app.signals.disable_stats()
+
+    payloads = [{"value": value} for value in range(100)]
+    timer = timeit.Timer(lambda: app.signals.send_many("bench_signal", other, payloads))
+    duration = min(timer.repeat(repeat=5, number=number // 100)) / number * 1e6
+    print("%-30s %12.2f" % ("send_many (per payload)", duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ import os
 
 from groundwork.configuration.configmanager import ConfigManager
 from groundwork.pluginmanager import PluginManager
+from groundwork.scheduler import Scheduler
 from groundwork.signals import SignalsApplication
 
 
@@ -69,6 +70,10 @@ class App(object):
         #: Name of the application. Is configurable by parameter "APP_NAME" of a configuration file.
         self.name = self.config.get("APP_NAME", None) or "NoName App"
 
+        #: Instance of :class:`~groundwork.scheduler.Scheduler`. Executes delayed function calls of the whole
+        #: application by a single background thread.
+        self.scheduler = Scheduler()
+
         #: Instance of :class:`~groundwork.signals.SignalsApplication`. Provides functions to register and fire
         # signals or receivers on application level.
         self.signals = SignalsApplication(app=self)
@@ -89,6 +94,34 @@ class App(object):
         if plugins is not None:
             self.plugins.classes.register(plugins)
 
+    def shutdown(self, timeout=None):
+        """
+        Stops all background work of the application.
+
+        First the threads of all plugins get stopped in reverse activation order of the plugins,
+        see :func:`~groundwork.patterns.gw_threads_pattern.ThreadsListApplication.stop`.
+        Afterwards the thread and process pools, the signal executors and the scheduler get shut down.
+
+        Plugins stay active. Background work, which is started later again, starts the needed pools again.
+
+        :param timeout: Maximum seconds to wait for the threads of each plugin.
+                        Default is the configuration parameter GROUNDWORK_THREADS_STOP_TIMEOUT.
+        :return: List of names of threads, which did not stop within the timeout
+        """
+        not_stopped = []
+        threads = getattr(self, "threads", None)
+        if threads is not None:
+            not_stopped = threads.stop(timeout=timeout)
+            # Do not block on threads, which ignore their cancellation token
+            threads.shutdown(wait=len(not_stopped) == 0)
+        self.signals.shutdown(wait=len(not_stopped) == 0)
+        self.scheduler.shutdown()
+        if not_stopped:
+            self.log.warning("Application shut down, but threads are still running: %s" % ", ".join(not_stopped))
+        else:
+            self.log.info("Application shut down")
+        return not_stopped
+
     def _configure_logging(self, logger_dict=None):
         """
         Configures the logging module with a given dictionary, which in most cases was loaded from a configuration
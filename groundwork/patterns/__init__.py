@@ -1,6 +1,16 @@
 from groundwork.patterns.gw_base_pattern import GwBasePattern
-from groundwork.patterns.gw_commands_pattern import GwCommandsPattern
-from groundwork.patterns.gw_shared_objects_pattern import GwSharedObjectsPattern
-from groundwork.patterns.gw_documents_pattern import GwDocumentsPattern
-from groundwork.patterns.gw_recipes_pattern import GwRecipesPattern
-from groundwork.patterns.gw_threads_pattern import GwThreadsPattern
+from groundwork.util import gw_lazy_attributes
+
+# Patterns are imported on first access only, because most of them need heavy third party libraries,
+# which are not needed by every application.
+_patterns = {
+    "GwCommandsPattern": "groundwork.patterns.gw_commands_pattern",
+    "GwSharedObjectsPattern": "groundwork.patterns.gw_shared_objects_pattern",
+    "GwDocumentsPattern": "groundwork.patterns.gw_documents_pattern",
+    "GwRecipesPattern": "groundwork.patterns.gw_recipes_pattern",
+    "GwThreadsPattern": "groundwork.patterns.gw_threads_pattern",
+}
+
+__all__ = ["GwBasePattern"] + list(_patterns.keys())
+
+__getattr__, __dir__ = gw_lazy_attributes(__name__, _patterns)
@@ -9,12 +9,76 @@
 import sys
 import os
 import logging
+import functools
 
-from groundwork.patterns.exceptions import PluginAttributeMissing, PluginActivateMissing, PluginDeactivateMissing, \
-    PluginDependencyLoop
+from future.utils import with_metaclass
 
+from groundwork.patterns.exceptions import PluginAttributeMissing, PluginActivateMissing, PluginDeactivateMissing
 
-class GwBasePattern(object):
+
+class GwBasePatternMeta(type):
+    """
+    Metaclass of :class:`GwBasePattern`.
+
+    Wraps the functions activate() and deactivate() of each plugin and pattern class once during class creation.
+    So the base pattern can execute its own routines (e.g. sending the signals plugin_activate_pre and
+    plugin_activate_post) before and after the routines of a plugin, without the need of a call
+    like super().activate() by the plugin developer.
+    """
+    _injections = {
+        "activate": ("_pre_activate_injection", "_post_activate_injection"),
+        "deactivate": ("_pre_deactivate_injection", "_post_deactivate_injection"),
+    }
+
+    def __new__(mcs, name, bases, namespace):
+        for function_name, (pre_injection, post_injection) in mcs._injections.items():
+            function = namespace.get(function_name, None)
+            if function is not None and hasattr(function, '__call__'):
+                namespace[function_name] = _inject(function, pre_injection, post_injection)
+        return super(GwBasePatternMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+def _inject(function, pre_injection, post_injection):
+    """
+    Returns a wrapper of function, which calls the given pre and post injection functions of the plugin.
+
+    If the wrapped function gets called by an already running, wrapped function of the same plugin (e.g. by
+    super().activate()), the injections are not executed a second time.
+
+    The original function is available as __wrapped__ of the wrapper. without_injections of the wrapper calls the
+    original function as running, wrapped function. So nested calls of wrapped functions do not execute the
+    injections either. It's used, if the injections get executed separately (e.g. by a parallel plugin activation).
+    """
+    running_flag = "_%s_running" % function.__name__
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if self.__dict__.get(running_flag, False):
+            return function(self, *args, **kwargs)
+        self.__dict__[running_flag] = True
+        try:
+            getattr(self, pre_injection)()
+            result = function(self, *args, **kwargs)
+            getattr(self, post_injection)()
+        finally:
+            self.__dict__[running_flag] = False
+        return result
+
+    def without_injections(self, *args, **kwargs):
+        previous = self.__dict__.get(running_flag, False)
+        self.__dict__[running_flag] = True
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            self.__dict__[running_flag] = previous
+
+    # functools.wraps of Python 2 does not set __wrapped__
+    wrapper.__wrapped__ = function
+    wrapper.without_injections = without_injections
+    return wrapper
+
+
+class GwBasePattern(with_metaclass(GwBasePatternMeta, object)):
     """
     Base pattern class for all plugins and patterns.
 
@@ -88,36 +152,6 @@ class GwBasePattern(object):
         # for doing this job.
         self.app.plugins._register_initialisation(self)
 
-    # def __getattribute__(self, name):
-    def __getattribute__(self, name):
-        """
-        Catches all calls on class attributes, but cares only for activate() and deactivate().
-
-        If the plugin gets activated or deactivated, the base class can perform extra work.
-        So there is no need for a plugin developer to call something like super().activate() for
-        his/her plugin. This gets done automatically.
-        """
-
-        attr = object.__getattribute__(self, name)
-        if hasattr(attr, '__call__'):
-            if hasattr(attr, "__name__"):
-                if attr.__name__ == "activate":
-                    def newfunc(*args, **kwargs):
-                        self._pre_activate_injection()
-                        result = attr(*args, **kwargs)
-                        self._post_activate_injection()
-                        return result
-                    return newfunc
-                elif attr.__name__ == "deactivate":
-                    def newfunc(*args, **kwargs):
-                        self._pre_deactivate_injection()
-                        result = attr(*args, **kwargs)
-                        self._post_deactivate_injection()
-                        return result
-                    return newfunc
-
-        return attr
-
     def activate(self):
         """
         Must be overwritten by the plugin class itself.
@@ -176,46 +210,14 @@ class GwBasePattern(object):
 
     def _load_needed_plugins(self):
         """
-        Checks if this plugins needs other plugins to work and tries to activate them
-        :return: True, if all needed plugins are or got activated. Otherwise False
-        """
-        global plugin_recursive_store
-        if "plugin_recursive_store" not in globals():
-            plugin_recursive_store = []
+        Checks if this plugins needs other plugins to work and tries to activate them.
 
-        if self.name in plugin_recursive_store:
-            self.log.warning("Plugin dependency loop detected: %s already checked and dependencies got activated" %
-                             self.name)
-            if self.app.strict:
-                raise PluginDependencyLoop("Plugin dependency loop detected: %s already checked and dependencies "
-                                           "got activated" % self.name)
-            return False
-        else:
-            plugin_recursive_store.append(self.name)
+        The dependencies get resolved by the plugin manager, which activates all needed plugins (and their needed
+        plugins) in the correct order. See :func:`groundwork.pluginmanager.PluginManager.activate`.
 
-        if not hasattr(self, "needed_plugins"):
-            pass
-        elif not isinstance(self.needed_plugins, tuple) and not isinstance(self.needed_plugins, list):
-            raise TypeError("needed_plugins must be a tuple or a list")
-        elif len(self.needed_plugins) > 0:
-            try:
-                for needed_plugin in self.needed_plugins:
-                    if not isinstance(needed_plugin, str):
-                        raise TypeError("Plugin name must be a string, got %s" % type(needed_plugin).__name__)
-                    # Check, if a plugin with this name got already activated
-                    plugin = self.app.plugins.get(needed_plugin)
-                    if plugin is not None and not plugin.active:
-                        plugin.activate()
-                    # If not, check if a plugin_class with this name is available and activate it
-                    plugin_class = self.app.plugins.classes.get(needed_plugin)
-                    if plugin_class is not None:
-                        plugin_class(self.app, needed_plugin)
-            except Exception:
-                plugin_recursive_store.remove(self.name)
-                return False
-
-        plugin_recursive_store.remove(self.name)
-        return True
+        :return: True, if all needed plugins are or got activated. Otherwise False
+        """
+        return self.app.plugins._activate_needed_plugins(self)
 
 
 class SignalsPlugin:
@@ -245,7 +247,8 @@ class SignalsPlugin:
         for signal in signals:
             self.unregister(signal)
 
-    def register(self, signal, description):
+    def register(self, signal, description, threaded=False, queued=False, queue_size=1000, overflow="block",
+                 history=None, coalesce=None, debounce=False, merge=None):
         """
         Registers a new signal.
         Only registered signals are allowed to be send.
@@ -253,25 +256,47 @@ class SignalsPlugin:
         :param signal: Unique name of the signal
         :param description: Description of the reason or use case, why this signal is needed.
                             Used for documentation.
+        :param threaded: If True, all receivers of this signal get executed by the thread pool of the application.
+        :param queued: If True, send() only puts the signal into a queue and returns immediately.
+                       The receivers get called by a background thread.
+        :param queue_size: Maximum amount of queued, but not yet delivered signals. Used only, if queued is True.
+        :param overflow: Policy, if the queue is full. One of "block", "drop_oldest" or "drop_newest".
+        :param history: Amount of last sends, which are stored in the send history of the signal. 0 means no history.
+                        If None, the configuration parameter GROUNDWORK_SIGNALS_HISTORY is used.
+        :param coalesce: If set, sends get merged into one combined send per sender. A number is the time window in
+                         seconds, True means the combined send gets delivered by :func:`flush` only.
+        :param debounce: If True, each send restarts the coalescing window.
+        :param merge: Function merge(previous_kwargs, kwargs), which combines the keyword arguments of coalesced sends.
         """
-        return self.__app.signals.register(signal, self._plugin, description)
+        return self.__app.signals.register(signal, self._plugin, description, threaded, queued, queue_size, overflow,
+                                           history, coalesce, debounce, merge)
 
     def unregister(self, signal):
         return self.__app.signals.unregister(signal)
 
-    def connect(self, receiver, signal, function, description, sender=None):
+    def connect(self, receiver, signal, function, description, sender=None, threaded=False, batch_function=None,
+                weak=False, priority=0):
         """
         Connect a receiver to a signal
 
         :param receiver: Name of the receiver
         :type receiver: str
-        :param signal: Name of the signal. Must already be registered!
+        :param signal: Name of the signal or a pattern like "db.*", which matches the names of multiple signals.
         :type signal: str
         :param function: Callable functions, which shall be executed, of signal is send.
         :param description: Description of the reason or use case, why this connection is needed.
                             Used for documentation.
+        :param sender: If set, only signals from this sender will be send to ths receiver.
+        :param threaded: If True, the function gets executed by the thread pool of the application.
+        :param batch_function: Optional function, which gets called by send_many() with the sender and the whole
+                               list of payloads, instead of calling function for each payload.
+        :param weak: If True, the receiver references function, plugin and sender weakly only and gets disconnected
+                     automatically, if one of them gets garbage collected.
+        :param priority: Receivers with a higher priority get called first. If a receiver returns
+                         :data:`groundwork.signals.STOP`, receivers with lower priority are not called.
         """
-        return self.__app.signals.connect(receiver, signal, function, self._plugin, description, sender)
+        return self.__app.signals.connect(receiver, signal, function, self._plugin, description, sender, threaded,
+                                          batch_function, weak, priority)
 
     def disconnect(self, receiver):
         """
@@ -291,6 +316,45 @@ class SignalsPlugin:
         """
         return self.__app.signals.send(signal, plugin=self._plugin, **kwargs)
 
+    def send_many(self, signal, payloads):
+        """
+        Sends a signal once per given payload. Receivers get resolved only once.
+        See :func:`groundwork.signals.SignalsApplication.send_many`.
+
+        :param signal: Name of the signal
+        :type signal: str
+        :param payloads: list of dictionaries. Each dictionary contains the keyword arguments for a single send.
+        :return: list of tuples (function, result), one per receiver
+        """
+        return self.__app.signals.send_many(signal, self._plugin, payloads)
+
+    def flush(self, signal=None):
+        """
+        Delivers the pending sends of coalesced signals immediately.
+        See :func:`groundwork.signals.SignalsApplication.flush`.
+
+        :param signal: Name of the signal. If None, all coalesced signals of this plugin get flushed.
+        :return: list of tuples (function, return value)
+        """
+        if signal is not None:
+            return self.__app.signals.flush(signal)
+        answers = []
+        for name in self.get().keys():
+            answers.extend(self.__app.signals.flush(name))
+        return answers
+
+    def send_async(self, signal, max_concurrency=None, **kwargs):
+        """
+        Sends a signal for the given plugin and awaits coroutine receivers concurrently.
+        See :func:`groundwork.signals.SignalsApplication.send_async`.
+
+        :param signal: Name of the signal
+        :type signal: str
+        :param max_concurrency: Maximum amount of receivers, which are executed at the same time. None means no limit.
+        :return: awaitable, which returns a list of tuples (function, return value)
+        """
+        return self.__app.signals.send_async(signal, plugin=self._plugin, max_concurrency=max_concurrency, **kwargs)
+
     def get(self, signal=None):
         """
         Returns a single signal or a dictionary of signals for this plugin.
@@ -2,6 +2,7 @@ import logging
 import click
 
 from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.util import Registry
 
 
 class GwCommandsPattern(GwBasePattern):
@@ -69,7 +70,8 @@ class CommandsListPlugin:
                                     signal="plugin_deactivate_post",
                                     function=self.__deactivate_commands,
                                     description="Deactivate commands for %s" % self.plugin.name,
-                                    sender=self.plugin)
+                                    sender=self.plugin,
+                                    weak=True)
         self.log.debug("Plugin commands initialised")
 
     def __deactivate_commands(self, plugin, *args, **kwargs):
@@ -113,7 +115,7 @@ class CommandsListApplication():
     def __init__(self, app):
         self.app = app
         self.log = logging.getLogger(__name__)
-        self._commands = {}
+        self._commands = Registry()
         self.log.info("Application commands initialised")
         self._click_root_command = click.Group()
 
@@ -137,29 +139,7 @@ class CommandsListApplication():
         :type plugin: instance of GwBasePattern
         :return: None, single command or dict of commands
         """
-        if plugin is not None:
-            if name is None:
-                command_list = {}
-                for key in self._commands.keys():
-                    if self._commands[key].plugin == plugin:
-                        command_list[key] = self._commands[key]
-                return command_list
-            else:
-                if name in self._commands.keys():
-                    if self._commands[name].plugin == plugin:
-                        return self._commands[name]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if name is None:
-                return self._commands
-            else:
-                if name in self._commands.keys():
-                    return self._commands[name]
-                else:
-                    return None
+        return self._commands.find(name, plugin)
 
     def register(self, command, description, function, params=[], plugin=None):
         """
@@ -202,7 +182,9 @@ class CommandsListApplication():
             self.log.debug("Command %s got unregistered" % command)
 
 
-class Command:
+class Command(object):
+    __slots__ = ("command", "description", "parameters", "plugin", "function", "click_command")
+
     def __init__(self, command, description, parameters, function, plugin):
         self.command = command
         self.description = description
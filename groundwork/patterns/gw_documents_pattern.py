@@ -5,6 +5,7 @@ Groundwork documentation support module.
 import logging
 
 from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.util import Registry
 
 
 class GwDocumentsPattern(GwBasePattern):
@@ -55,7 +56,8 @@ class DocumentsListPlugin:
                                      signal="plugin_deactivate_post",
                                      function=self.__deactivate_documents,
                                      description="Deactivate documents for %s" % self._plugin.name,
-                                     sender=self._plugin)
+                                     sender=self._plugin,
+                                     weak=True)
         self.__log.debug("Plugin documents initialised")
 
     def __deactivate_documents(self, plugin, *args, **kwargs):
@@ -89,7 +91,7 @@ class DocumentsListApplication:
     def __init__(self, app):
         self.__app = app
         self.__log = logging.getLogger(__name__)
-        self.documents = {}
+        self.documents = Registry()
         self.__log.info("Application documents initialised")
 
     def register(self, name, content, plugin, description=None):
@@ -136,32 +138,10 @@ class DocumentsListApplication:
         :param plugin: Plugin object, under which the document was registered
         :type plugin: GwBasePattern
         """
-        if plugin is not None:
-            if document is None:
-                documents_list = {}
-                for key in self.documents.keys():
-                    if self.documents[key].plugin == plugin:
-                        documents_list[key] = self.documents[key]
-                return documents_list
-            else:
-                if document in self.documents.keys():
-                    if self.documents[document].plugin == plugin:
-                        return self.documents[document]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if document is None:
-                return self.documents
-            else:
-                if document in self.documents.keys():
-                    return self.documents[document]
-                else:
-                    return None
+        return self.documents.find(document, plugin)
 
 
-class Document:
+class Document(object):
     """
     Groundwork document class. Used to store name, file_path, alias and plugin.
 
@@ -175,6 +155,8 @@ class Document:
     :type plugin: GwBasePattern
     :param description: short description of document
     """
+    __slots__ = ("name", "content", "plugin", "description")
+
     def __init__(self, name, content, plugin, description=None):
         self.name = name
         self.content = content
@@ -10,9 +10,9 @@ Based on cookiecutter: https://github.com/audreyr/cookiecutter/
 """
 import os
 import logging
-from cookiecutter.main import cookiecutter
 
 from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.util import Registry
 
 
 class GwRecipesPattern(GwBasePattern):
@@ -49,7 +49,8 @@ class RecipesListPlugin:
                                      signal="plugin_deactivate_post",
                                      function=self.__deactivate_recipes,
                                      description="Deactivate recipes for %s" % self._plugin.name,
-                                     sender=self._plugin)
+                                     sender=self._plugin,
+                                     weak=True)
         self.__log.debug("Plugin recipes initialised")
 
     def __deactivate_recipes(self, plugin, *args, **kwargs):
@@ -112,7 +113,7 @@ class RecipesListApplication:
     """
     def __init__(self, app):
         self.__app = app
-        self.recipes = {}
+        self.recipes = Registry()
         self.__log = logging.getLogger(__name__)
         self.__log.info("Application recipes initialised")
 
@@ -160,29 +161,7 @@ class RecipesListApplication:
         :param plugin: Plugin object, under which the recipe was registered
         :type plugin: GwBasePattern
         """
-        if plugin is not None:
-            if recipe is None:
-                recipes_list = {}
-                for key in self.recipes.keys():
-                    if self.recipes[key].plugin == plugin:
-                        recipes_list[key] = self.recipes[key]
-                return recipes_list
-            else:
-                if recipe in self.recipes.keys():
-                    if self.recipes[recipe].plugin == plugin:
-                        return self.recipes[recipe]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if recipe is None:
-                return self.recipes
-            else:
-                if recipe in self.recipes.keys():
-                    return self.recipes[recipe]
-                else:
-                    return None
+        return self.recipes.find(recipe, plugin)
 
     def build(self, recipe, plugin=None, no_input=False, extra_context=None):
         """
@@ -208,7 +187,7 @@ class RecipesListApplication:
         recipe_obj.build(no_input, extra_context)
 
 
-class Recipe:
+class Recipe(object):
     """
     A recipe is an existing folder, which will be handled by the underlying cookiecutter library as template folder.
 
@@ -220,6 +199,8 @@ class Recipe:
     :param:pre_hook: Function to call before recipe installation
     :param:post_hook: Function to call after recipe installation
     """
+    __slots__ = ("name", "path", "plugin", "description", "final_words", "pre_hook", "post_hook")
+
     def __init__(self, name, path, plugin, description="", final_words="",
                  pre_hook=None, post_hook=None):
         self.name = name
@@ -232,7 +213,6 @@ class Recipe:
         self.final_words = final_words
         self.pre_hook = pre_hook
         self.post_hook = post_hook
-        self.__log = logging.getLogger(__name__)
 
     def build(self, output_dir=None, no_input=False, extra_context=None, **kwargs):
         """
@@ -264,6 +244,10 @@ class Recipe:
         if self.pre_hook is not None and not self.pre_hook():
             raise HooksException('Pre-hook failure')
 
+        # cookiecutter is imported here and not on module level, because its import takes a lot of time and
+        # it is only needed, if a recipe gets really build.
+        from cookiecutter.main import cookiecutter
+
         target = cookiecutter(self.path,
                               output_dir=output_dir,
                               no_input=no_input,
@@ -1,4 +1,5 @@
 from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.util import Registry
 
 
 class GwSharedObjectsPattern(GwBasePattern):
@@ -52,7 +53,8 @@ class SharedObjectsListPlugin:
                                     signal="plugin_deactivate_post",
                                     function=self.__deactivate_shared_objects,
                                     description="Deactivate documents for %s" % self.plugin.name,
-                                    sender=self.plugin)
+                                    sender=self.plugin,
+                                    weak=True)
 
         self.log.debug("Shared objects for plugin %s initialised" % self.plugin.name)
 
@@ -121,7 +123,7 @@ class SharedObjectsListApplication:
         """
         self.app = app
         self.log = app.log
-        self._shared_objects = {}
+        self._shared_objects = Registry()
         self.log.debug("Application shared objects initialised")
 
     def get(self, name=None, plugin=None):
@@ -133,29 +135,7 @@ class SharedObjectsListApplication:
         :param plugin: Plugin, which has registered the requested shared object
         :type plugin: GwBasePattern instance or None
         """
-        if plugin is not None:
-            if name is None:
-                shared_objects_list = {}
-                for key in self._shared_objects.keys():
-                    if self._shared_objects[key].plugin == plugin:
-                        shared_objects_list[key] = self._shared_objects[key]
-                return shared_objects_list
-            else:
-                if name in self._shared_objects.keys():
-                    if self._shared_objects[name].plugin == plugin:
-                        return self._shared_objects[name]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if name is None:
-                return self._shared_objects
-            else:
-                if name in self._shared_objects.keys():
-                    return self._shared_objects[name]
-                else:
-                    return None
+        return self._shared_objects.find(name, plugin)
 
     def access(self, name):
         """
@@ -205,11 +185,13 @@ class SharedObjectsListApplication:
             self.log.debug("Shared object %s got unregistered" % shared_object)
 
 
-class SharedObject:
+class SharedObject(object):
     """
     SharedObject class, which stores the objects itself besides meta data like an unique name, a description and the
     plugin, which registers the shared object.
     """
+    __slots__ = ("name", "description", "obj", "plugin")
+
     def __init__(self, name, description, obj, plugin):
         """
         :param name: Unique name of the shared object
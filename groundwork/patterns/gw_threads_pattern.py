@@ -2,11 +2,36 @@
 Groundwork threads support module.
 """
 
+import collections
 import logging
+import multiprocessing
 import threading
 import datetime
+import functools
+import itertools
+import inspect
+import random
+from concurrent import futures
 
 from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.scheduler import CronExpression, clock
+from groundwork.util import Registry
+
+#: Each run of a thread gets executed by a new, dedicated thread
+BACKEND_THREAD = "thread"
+#: Runs of a thread get executed by the thread pool of the application
+BACKEND_EXECUTOR = "executor"
+#: Runs of a thread get executed by the process pool of the application
+BACKEND_PROCESS = "process"
+BACKENDS = (BACKEND_THREAD, BACKEND_EXECUTOR, BACKEND_PROCESS)
+
+#: Missed runs of a schedule get dropped
+MISSED_SKIP = "skip"
+#: All missed runs of a schedule get replaced by a single run
+MISSED_RUN_ONCE = "run_once"
+#: All missed runs of a schedule get executed one after another
+MISSED_RUN_ALL = "run_all"
+MISSED_POLICIES = (MISSED_SKIP, MISSED_RUN_ONCE, MISSED_RUN_ALL)
 
 
 class GwThreadsPattern(GwBasePattern):
@@ -49,49 +74,263 @@ class ThreadsListPlugin:
                                      signal="plugin_deactivate_post",
                                      function=self.__deactivate_threads,
                                      description="Deactivate threads for %s" % self._plugin.name,
-                                     sender=self._plugin)
+                                     sender=self._plugin,
+                                     weak=True)
         self.__log.debug("Plugin threads initialised")
 
     def __deactivate_threads(self, plugin, *args, **kwargs):
+        # Threads, which did not stop, get logged by stop() and are unregistered as well.
+        # Otherwise a reactivation of the plugin could not register them again.
+        self.__app.threads.stop(self._plugin)
         threads = self.get()
         for thread in threads.keys():
             self.unregister(thread)
 
-    def register(self, name, function, description=None):
+    def register(self, name, function, description=None, backend=BACKEND_THREAD, completion_signal=None):
         """
         Register a new thread.
 
+        Threads, which shall be run periodically, get registered by :func:`schedule`.
+
         :param function: Function, which gets called for the new thread
         :type function: function
         :param name: Unique name of the thread for documentation purposes.
         :param description: Short description of the thread
+        :param backend: "thread" executes each run in a new thread.
+                        "executor" executes the runs in the thread pool of the application.
+                        "process" executes the runs in the process pool of the application.
+                        Default is "thread".
+        :param completion_signal: Name of a signal, which gets sent after each run with the arguments thread and future.
+                                  Gets registered, if it does not exist.
+        :return: :class:`Thread`
+        """
+        return self.__app.threads.register(name, function, self._plugin, description, backend, completion_signal)
+
+    def schedule(self, name, function, interval, initial_delay=None, jitter=0, missed=MISSED_SKIP, description=None,
+                 backend=BACKEND_EXECUTOR, completion_signal=None):
+        """
+        Registers a new thread, which gets run periodically.
+
+        :param name: Unique name of the thread
+        :param function: Function, which gets called for each run
+        :param interval: Seconds between two runs or a cron-like expression like "*/5 * * * *"
+        :param initial_delay: Seconds until the first run. Default is one interval or the next match of the expression.
+        :param jitter: Maximum amount of random seconds, which get added to the time of each run
+        :param missed: Policy for missed runs. One of "skip", "run_once" or "run_all".
+        :param description: Short description of the thread
+        :param backend: "thread", "executor" or "process"
+        :param completion_signal: Name of a signal, which gets sent after each run
+        :return: :class:`Thread`, whose attribute schedule contains the :class:`ThreadSchedule`
         """
-        return self.__app.threads.register(name, function, self._plugin, description)
+        return self.__app.threads.schedule(name, function, self._plugin, interval, initial_delay, jitter, missed,
+                                           description, backend, completion_signal)
 
     def unregister(self, thread):
         return self.__app.threads.unregister(thread)
 
+    def map(self, function, iterable, chunksize=1, backend=BACKEND_EXECUTOR, ordered=True, max_in_flight=None):
+        """
+        Calls a function for each item of an iterable in parallel and returns an iterator over the results.
+        See :func:`ThreadsListApplication.map`.
+
+        :param function: Function, which gets called with a single item
+        :param iterable: Items
+        :param chunksize: Amount of items, which get processed by a single task
+        :param backend: "executor" (or "thread") uses the thread pool, "process" the process pool of the application
+        :param ordered: If True, results are returned in the order of the items. Otherwise as soon as they are ready.
+        :param max_in_flight: Maximum amount of submitted, but not yet returned chunks. Default is 2 * pool size.
+        :return: :class:`ThreadMap`
+        """
+        return self.__app.threads.map(function, iterable, chunksize, backend, ordered, max_in_flight)
+
+    def stop(self, timeout=None):
+        """
+        Stops all threads of the plugin. See :func:`ThreadsListApplication.stop`.
+
+        :param timeout: Maximum seconds to wait. Default is the configuration parameter GROUNDWORK_THREADS_STOP_TIMEOUT.
+        :return: List of names of threads, which did not stop within the timeout
+        """
+        return self.__app.threads.stop(self._plugin, timeout)
+
     def get(self, name=None):
         return self.__app.threads.get(name, self._plugin)
 
 
 class ThreadsListApplication:
     """
+    Stores and handles the threads of all plugins.
+
+    Threads with the backend "executor" share a bounded thread pool. Its size is configurable by the configuration
+    parameter GROUNDWORK_THREADS_WORKERS. Default is the amount of CPUs + 4, but not more than 32.
 
+    Threads with the backend "process" share a process pool. Its size is configurable by the configuration
+    parameter GROUNDWORK_THREADS_PROCESSES. Default is the amount of CPUs.
+
+    During plugin deactivation the threads of the plugin get stopped. The time to wait for them is configurable by
+    the configuration parameter GROUNDWORK_THREADS_STOP_TIMEOUT. Default is 5 seconds.
     """
 
     def __init__(self, app):
         self.__app = app
         self.__log = logging.getLogger(__name__)
-        self.threads = {}
+        self.threads = Registry()
+
+        #: Maximum amount of threads of the thread pool
+        self.max_workers = app.config.get("GROUNDWORK_THREADS_WORKERS", None)
+        if self.max_workers is None:
+            self.max_workers = min(32, multiprocessing.cpu_count() + 4)
+        if self.max_workers < 1:
+            raise ValueError("GROUNDWORK_THREADS_WORKERS must be at least 1, got %s" % self.max_workers)
+
+        #: Maximum amount of processes of the process pool
+        self.max_processes = app.config.get("GROUNDWORK_THREADS_PROCESSES", None)
+        if self.max_processes is None:
+            self.max_processes = multiprocessing.cpu_count()
+        if self.max_processes < 1:
+            raise ValueError("GROUNDWORK_THREADS_PROCESSES must be at least 1, got %s" % self.max_processes)
+
+        #: Default seconds to wait for the threads of a plugin, if they get stopped
+        self.stop_timeout = app.config.get("GROUNDWORK_THREADS_STOP_TIMEOUT", 5)
+
+        self._executor = None
+        self._process_executor = None
+        self._lock = threading.Lock()
+        # Activation number per plugin name, used to stop threads in reverse activation order
+        self._activation_order = {}
+        self._activation_counter = itertools.count()
+        # Connected for the application, so that the receiver stays connected during plugin deactivations
+        app.signals.connect("threads_activation_order", "plugin_activate_post", self._activated, app,
+                            "Stores the activation order of plugins, to stop their threads in reverse order")
         self.__log.info("Application threads initialised")
 
-    def register(self, name, function, plugin, description=None):
+    def _activated(self, plugin, **kwargs):
+        self._activation_order[plugin.name] = next(self._activation_counter)
+
+    def stop(self, plugin=None, timeout=None):
+        """
+        Stops threads and waits until their runs have finished. See :func:`Thread.stop`.
+
+        Without a given plugin, the threads of all plugins get stopped in reverse activation order of the plugins.
+        The timeout is applied per plugin. Threads, which did not stop, are logged and returned.
+        This function does not unregister any thread. But during plugin deactivation all threads of the plugin get
+        unregistered afterwards, also the ones, which did not stop. Their runs keep running until they return.
+
+        :param plugin: Plugin object, whose threads get stopped. None for all plugins.
+        :param timeout: Maximum seconds to wait per plugin. Default is GROUNDWORK_THREADS_STOP_TIMEOUT.
+        :return: List of names of threads, which did not stop within the timeout
+        """
+        if timeout is None:
+            timeout = self.stop_timeout
+        if plugin is not None:
+            plugins = [plugin]
+        else:
+            plugins = {}
+            for thread in list(self.threads.values()):
+                plugins[id(thread.plugin)] = thread.plugin
+            plugins = sorted(plugins.values(), key=lambda plugin: self._activation_order.get(plugin.name, -1),
+                             reverse=True)
+
+        not_stopped = []
+        for plugin in plugins:
+            threads = list(self.get(plugin=plugin).values())
+            # All threads of a plugin get cancelled first, so that they can stop in parallel
+            end = clock() + timeout
+            for thread in threads:
+                if thread.schedule is not None:
+                    thread.schedule.cancel()
+                with thread._lock:
+                    thread.cancel_token.cancel()
+            for thread in threads:
+                if not thread.stop(max(end - clock(), 0)):
+                    not_stopped.append(thread.name)
+        if not_stopped:
+            self.__log.warning("Threads did not stop within %s seconds: %s" % (timeout, ", ".join(not_stopped)))
+        return not_stopped
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Executes a function in the thread pool of the application. The thread pool gets created on first usage.
+
+        :return: future
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor.submit(function, *args, **kwargs)
+
+    def submit_process(self, function, *args, **kwargs):
         """
-        Registers a new document.
+        Executes a function in the process pool of the application. The process pool gets created on first usage.
+
+        Function and arguments must be picklable.
 
-        .. warning: You can not use any relative links inside a given document.
-                    For instance, sphinx's toctree, image, figure or include statements do not work.
+        :return: future
+        """
+        with self._lock:
+            if self._process_executor is None:
+                self._process_executor = futures.ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._process_executor.submit(function, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        Stops the thread pool and the process pool. New pools get created on next submit.
+
+        :param wait: If True, waits until all submitted runs are finished
+        """
+        with self._lock:
+            executors = [self._executor, self._process_executor]
+            self._executor = None
+            self._process_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+    def map(self, function, iterable, chunksize=1, backend=BACKEND_EXECUTOR, ordered=True, max_in_flight=None):
+        """
+        Calls a function for each item of an iterable in parallel and returns an iterator over the results.
+
+        The items get split into chunks of chunksize items. Each chunk is a single task of the thread pool or
+        process pool of the application. Items are read and submitted lazily during the iteration, so that at most
+        max_in_flight chunks are submitted, but not yet returned. So a large or endless iterable does not fill the
+        memory.
+
+        If a function call raises an exception, it gets raised by the iterator and all not yet started chunks get
+        cancelled.
+
+        Example::
+
+            for result in self.threads.map(parse, files, chunksize=10, backend="process"):
+                store(result)
+
+        :param function: Function, which gets called with a single item. Must be picklable for the backend "process".
+        :param iterable: Items
+        :param chunksize: Amount of items, which get processed by a single task
+        :param backend: "executor" (or "thread") uses the thread pool, "process" the process pool of the application
+        :param ordered: If True, results are returned in the order of the items. Otherwise as soon as they are ready.
+        :param max_in_flight: Maximum amount of submitted, but not yet returned chunks. Default is 2 * pool size.
+        :return: :class:`ThreadMap`
+        """
+        if backend not in BACKENDS:
+            raise ValueError("Unknown thread backend %s. Allowed are: %s" % (backend, ", ".join(BACKENDS)))
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1, got %s" % chunksize)
+        if backend == BACKEND_PROCESS:
+            submit = self.submit_process
+            workers = self.max_processes
+        else:
+            submit = self.submit
+            workers = self.max_workers
+        if max_in_flight is None:
+            max_in_flight = 2 * workers
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1, got %s" % max_in_flight)
+        return ThreadMap(submit, function, iterable, chunksize, ordered, max_in_flight)
+
+    def register(self, name, function, plugin, description=None, backend=BACKEND_THREAD, completion_signal=None):
+        """
+        Registers a new thread. The thread gets executed by :func:`Thread.run`.
+
+        Threads, which shall be run periodically, get registered by :func:`schedule`.
 
         :param function: Function, which gets called for the new thread
         :type function: function
@@ -99,26 +338,65 @@ class ThreadsListApplication:
         :param plugin: Plugin object, under which the threads where registered
         :type plugin: GwBasePattern
         :param description: Short description of the thread
+        :param backend: "thread" executes each run in a new thread.
+                        "executor" executes the runs in the thread pool of the application.
+                        "process" executes the runs in the process pool of the application.
+                        Default is "thread".
+        :param completion_signal: Name of a signal, which gets sent after each run with the arguments thread and future.
+                                  Gets registered for the plugin, if it does not exist.
+        :return: :class:`Thread`
+        :raises ThreadExistsException: If a thread with the given name is already registered
         """
         if name in self.threads.keys():
             raise ThreadExistsException("Thread %s was already registered by %s" %
                                         (name, self.threads[name].plugin.name))
 
-        self.threads[name] = Thread(name, function, plugin, description)
+        if completion_signal is not None and self.__app.signals.get(completion_signal) is None:
+            self.__app.signals.register(completion_signal, plugin, "Thread %s has finished a run" % name)
+
+        self.threads[name] = Thread(name, function, plugin, description, backend, completion_signal)
         self.__log.debug("Thread %s registered by %s" % (name, plugin.name))
         return self.threads[name]
 
+    def schedule(self, name, function, plugin, interval, initial_delay=None, jitter=0, missed=MISSED_SKIP,
+                 description=None, backend=BACKEND_EXECUTOR, completion_signal=None):
+        """
+        Registers a new thread, which gets run periodically.
+
+        All schedules are handled by the scheduler of the application, which starts the runs on the given backend.
+
+        :param name: Unique name of the thread
+        :param function: Function, which gets called for each run
+        :param plugin: Plugin object, under which the thread gets registered
+        :param interval: Seconds between two runs or a cron-like expression like "*/5 * * * *"
+        :param initial_delay: Seconds until the first run. Default is one interval or the next match of the expression.
+        :param jitter: Maximum amount of random seconds, which get added to the time of each run
+        :param missed: Policy for missed runs. One of "skip", "run_once" or "run_all".
+        :param description: Short description of the thread
+        :param backend: "thread", "executor" or "process"
+        :param completion_signal: Name of a signal, which gets sent after each run
+        :return: :class:`Thread`, whose attribute schedule contains the :class:`ThreadSchedule`
+        """
+        thread_schedule = ThreadSchedule(self.__app.scheduler, interval, initial_delay, jitter, missed)
+        thread = self.register(name, function, plugin, description, backend, completion_signal)
+        thread.schedule = thread_schedule
+        thread_schedule.start(thread)
+        return thread
+
     def unregister(self, thread):
         """
         Unregisters an existing thread, so that this thread is no longer available.
+        The schedule of the thread gets cancelled.
 
         This function is mainly used during plugin deactivation.
 
         :param thread: Name of the thread
         """
         if thread not in self.threads.keys():
-            self.log.warning("Can not unregister thread %s" % thread)
+            self.__log.warning("Can not unregister thread %s" % thread)
         else:
+            if self.threads[thread].schedule is not None:
+                self.threads[thread].schedule.cancel()
             del (self.threads[thread])
             self.__log.debug("Thread %s got unregistered" % thread)
 
@@ -131,37 +409,18 @@ class ThreadsListApplication:
         :param plugin: Plugin object, under which the thread was registered
         :type plugin: GwBasePattern
         """
-        if plugin is not None:
-            if thread is None:
-                threads_list = {}
-                for key in self.threads.keys():
-                    if self.threads[key].plugin == plugin:
-                        threads_list[key] = self.threads[key]
-                return threads_list
-            else:
-                if thread in self.threads.keys():
-                    if self.threads[thread].plugin == plugin:
-                        return self.threads[thread]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if thread is None:
-                return self.threads
-            else:
-                if thread in self.threads.keys():
-                    return self.threads[thread]
-                else:
-                    return None
+        return self.threads.find(thread, plugin)
 
 
-class Thread:
+class Thread(object):
     """
     Groundwork thread class. Used to store name, function and plugin.
 
     This information is mostly used to generated overviews about registered threads.
 
+    A thread can be run multiple times. Each run returns a :class:`ThreadFuture`. The attributes response, time_start
+    and time_end contain the values of the last run.
+
     :param name: Name of the thread
     :type name: str
     :param function: Function, which gets called inside the thread
@@ -169,15 +428,38 @@ class Thread:
     :param plugin: The plugin, which registered this thread
     :type plugin: GwBasePattern
     :param description: short description of this thread
+    :param backend: "thread" executes each run in a new thread.
+                    "executor" executes the runs in the thread pool of the application.
+                    "process" executes the runs in the process pool of the application. The function gets called
+                    without the plugin argument and must be picklable, as well as the keyword arguments and the
+                    return value.
+    :param completion_signal: Name of a signal, which gets sent after each run with the arguments thread and future
     """
-    def __init__(self, name, function, plugin, description=None):
+    __slots__ = ("name", "function", "plugin", "description", "backend", "completion_signal", "schedule",
+                 "cancel_token", "thread", "response", "time_start", "time_end", "running", "_futures", "_pass_token",
+                 "_lock")
+
+    def __init__(self, name, function, plugin, description=None, backend=BACKEND_THREAD, completion_signal=None):
+        if backend not in BACKENDS:
+            raise ValueError("Unknown thread backend %s. Allowed are: %s" % (backend, ", ".join(BACKENDS)))
         self.name = name
         self.function = function
         self.plugin = plugin
         self.description = description
+        self.backend = backend
+        self.completion_signal = completion_signal
+
+        #: :class:`ThreadSchedule`, if the thread gets run periodically. Otherwise None.
+        self.schedule = None
 
-        #: Thread base class. Type is threading.Thread
-        self.thread = ThreadWrapper(self)
+        #: :class:`CancellationToken` of the current runs. Gets replaced by a new token, if the thread gets stopped.
+        self.cancel_token = CancellationToken()
+        # The token is passed to functions with a parameter cancel_token only.
+        # Not for the backend "process", because the token can not be shared with other processes.
+        self._pass_token = backend != BACKEND_PROCESS and _accepts_cancel_token(function)
+
+        #: Thread of the last run for the backend "thread". Type is threading.Thread
+        self.thread = None
 
         #: Stores the function return value, if thread has finished
         self.response = None
@@ -188,17 +470,484 @@ class Thread:
         #: datetime object of the ending moment
         self.time_end = None
 
-        #: True, if thread is running. Otherwise its False.
+        #: True, if a run is pending or running. Otherwise its False.
         self.running = False
 
+        # Futures of pending or running runs
+        self._futures = set()
+        self._lock = threading.Lock()
+
     def run(self, **kwargs):
         """
         Runs the thread
 
-        :param kwargs: dictionary of keyword arguments
-        :return:
+        :param kwargs: dictionary of keyword arguments, which get passed to the function
+        :return: :class:`ThreadFuture`, which contains the return value or the exception of the function
+        """
+        future = ThreadFuture(self)
+        if self._pass_token:
+            kwargs["cancel_token"] = self.cancel_token
+        with self._lock:
+            self._futures.add(future)
+            self.running = True
+        try:
+            if self.backend == BACKEND_EXECUTOR:
+                self.plugin.app.threads.submit(self._execute, future, kwargs)
+            elif self.backend == BACKEND_PROCESS:
+                future.set_running_or_notify_cancel()
+                process_future = self.plugin.app.threads.submit_process(_execute_in_process, self.function, kwargs)
+                process_future.add_done_callback(functools.partial(self._process_done, future))
+            else:
+                self.thread = ThreadWrapper(self, future, kwargs)
+                self.thread.start()
+        except Exception:
+            self._finished(future)
+            raise
+        return future
+
+    def _execute(self, future, kwargs):
+        # Executes a single run. Gets called inside the thread of the run.
+        if not future.set_running_or_notify_cancel():
+            self._finished(future)
+            return
+        future.time_start = self.time_start = datetime.datetime.now()
+        try:
+            response = self.function(self.plugin, **kwargs)
+        except Exception as e:
+            self._complete(future, None, e)
+        else:
+            self._complete(future, response)
+
+    def _process_done(self, future, process_future):
+        # Gets called, if a run of the process pool has finished
+        try:
+            time_start, time_end, response, error = process_future.result()
+        except Exception as e:
+            # Function or arguments were not picklable or the process pool is broken
+            time_start, time_end, response, error = None, None, None, e
+        future.time_start = self.time_start = time_start
+        self._complete(future, response, error, time_end)
+
+    def _complete(self, future, response, error=None, time_end=None):
+        future.time_end = self.time_end = time_end or datetime.datetime.now()
+        if error is None:
+            self.response = response
+        else:
+            self.plugin.log.error("Thread %s failed: %s" % (self.name, error))
+        self._finished(future)
+        if error is None:
+            future.set_result(response)
+        else:
+            future.set_exception(error)
+        if self.completion_signal is not None:
+            try:
+                self.plugin.app.signals.send(self.completion_signal, self.plugin, thread=self, future=future)
+            except Exception as e:
+                self.plugin.log.error("Completion signal %s of thread %s failed: %s"
+                                      % (self.completion_signal, self.name, e))
+
+    def _finished(self, future):
+        with self._lock:
+            self._futures.discard(future)
+            if not self._futures:
+                self.running = False
+
+    def stop(self, timeout=None):
+        """
+        Stops all runs of the thread.
+
+        The schedule of the thread gets cancelled, not yet started runs get cancelled and the cancellation token of
+        the running runs gets cancelled. Then it waits until the running runs have finished.
+
+        Running functions are not interrupted. They must check their ``cancel_token`` and return on their own.
+        Later runs get a new token.
+
+        :param timeout: Maximum seconds to wait. None waits forever.
+        :return: True, if all runs have finished. False, if some are still running after the timeout.
+        """
+        if self.schedule is not None:
+            self.schedule.cancel()
+        with self._lock:
+            token = self.cancel_token
+            self.cancel_token = CancellationToken()
+            pending = list(self._futures)
+        token.cancel()
+        for future in pending:
+            if future.cancel():
+                self._finished(future)
+        not_done = futures.wait(pending, timeout).not_done
+        return len(not_done) == 0
+
+
+class ThreadSchedule(object):
+    """
+    Runs a thread periodically.
+
+    The schedule does not have an own thread. Each run gets started by the scheduler of the application
+    (see :class:`~groundwork.scheduler.Scheduler`) on the backend of the thread.
+
+    A run is missed, if its time has come while the previous run is still running, or if the scheduler was late
+    for more than one interval (e.g. because the system was suspended). The missed policy defines what happens then:
+
+    * "skip": Missed runs get dropped.
+    * "run_once": All missed runs get replaced by a single run, which starts after the current run.
+    * "run_all": All missed runs get executed one after another.
+
+    :param scheduler: Scheduler, which starts the runs. Its clock is used to calculate the slots of intervals.
+    :type scheduler: ~groundwork.scheduler.Scheduler
+    :param interval: Seconds between two runs or a cron-like expression.
+                     See :class:`~groundwork.scheduler.CronExpression`.
+    :param initial_delay: Seconds until the first run. Default is one interval or the next match of the expression.
+    :param jitter: Maximum amount of random seconds, which get added to the time of each run
+    :param missed: Policy for missed runs. One of "skip", "run_once" or "run_all".
+    """
+    __slots__ = ("interval", "cron", "initial_delay", "jitter", "missed", "runs", "missed_runs", "thread",
+                 "cancelled", "_slot", "_call", "_running", "_pending", "_lock", "_scheduler")
+
+    def __init__(self, scheduler, interval, initial_delay=None, jitter=0, missed=MISSED_SKIP):
+        if missed not in MISSED_POLICIES:
+            raise ValueError("Unknown missed policy %s. Allowed are: %s" % (missed, ", ".join(MISSED_POLICIES)))
+        if jitter < 0:
+            raise ValueError("Jitter must not be negative, got %s" % jitter)
+        if isinstance(interval, str):
+            self.cron = CronExpression(interval)
+            self.interval = None
+        else:
+            if interval <= 0:
+                raise ValueError("Interval must be greater than 0, got %s" % interval)
+            self.cron = None
+            self.interval = interval
+        self.initial_delay = initial_delay
+        self.jitter = jitter
+        self.missed = missed
+
+        #: Amount of started runs
+        self.runs = 0
+        #: Amount of missed runs, which were dropped because of the missed policy
+        self.missed_runs = 0
+        #: The scheduled thread
+        self.thread = None
+        self.cancelled = False
+
+        # Time of the next run. Value of the scheduler clock for intervals, datetime object for cron expressions.
+        self._slot = None
+        self._call = None
+        self._running = False
+        # Amount of missed runs, which still must be started
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._scheduler = scheduler
+
+    def start(self, thread):
+        """
+        Schedules the first run of the thread.
+        """
+        self.thread = thread
+        with self._lock:
+            if self.interval is not None:
+                delay = self.interval if self.initial_delay is None else self.initial_delay
+                slot = self._scheduler.clock() + delay
+            else:
+                slot = self.cron.next(datetime.datetime.now() + datetime.timedelta(seconds=self.initial_delay or 0))
+            self._schedule(slot)
+
+    def cancel(self):
+        """
+        Cancels all future runs. A running run is not stopped.
+        """
+        with self._lock:
+            self.cancelled = True
+            self._pending = 0
+            if self._call is not None:
+                self._scheduler.cancel(self._call)
+                self._call = None
+
+    @property
+    def next_run(self):
+        """
+        datetime object of the next run without jitter or None, if the schedule is cancelled.
+        """
+        if self.cancelled or self._slot is None:
+            return None
+        if self.interval is not None:
+            return datetime.datetime.now() + datetime.timedelta(seconds=self._slot - self._scheduler.clock())
+        return self._slot
+
+    def _schedule(self, slot):
+        self._slot = slot
+        if self.interval is not None:
+            delay = slot - self._scheduler.clock()
+        else:
+            delay = (slot - datetime.datetime.now()).total_seconds()
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        self._call = self._scheduler.schedule(max(delay, 0), self._fire)
+
+    def _fire(self):
+        # Gets called by the scheduler at the time of the current slot
+        with self._lock:
+            if self.cancelled:
+                return
+            # Slots, which have passed while the scheduler was late, are missed
+            missed = 0
+            if self.interval is not None:
+                slot = self._slot + self.interval
+                now = self._scheduler.clock()
+                if slot <= now:
+                    late = int((now - slot) // self.interval) + 1
+                    missed += late
+                    slot += late * self.interval
+            else:
+                slot = self.cron.next(self._slot)
+                now = datetime.datetime.now()
+                while slot <= now:
+                    missed += 1
+                    # After a long break, the remaining slots are not counted one by one
+                    slot = self.cron.next(slot if missed < 1000 else now)
+            self._schedule(slot)
+
+            start = not self._running
+            if not start:
+                missed += 1
+            self._pending += missed
+            self._apply_missed_policy()
+            if start:
+                self._running = True
+                self.runs += 1
+        if start:
+            self._run()
+
+    def _apply_missed_policy(self):
+        if self.missed == MISSED_SKIP:
+            allowed = 0
+        elif self.missed == MISSED_RUN_ONCE:
+            allowed = 1
+        else:
+            allowed = self._pending
+        if self._pending > allowed:
+            self.missed_runs += self._pending - allowed
+            self._pending = allowed
+
+    def _run(self):
+        try:
+            future = self.thread.run()
+        except Exception as e:
+            self.thread.plugin.log.error("Scheduled run of thread %s failed: %s" % (self.thread.name, e))
+            with self._lock:
+                self._running = False
+            return
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        # Starts the next missed run, if there is one
+        with self._lock:
+            start = self._pending > 0 and not self.cancelled
+            if start:
+                self._pending -= 1
+                self.runs += 1
+            else:
+                self._running = False
+        if start:
+            self._run()
+
+
+class CancellationToken(object):
+    """
+    Tells a running thread function, that it shall stop.
+
+    Functions, which have a parameter ``cancel_token``, get the token of their thread::
+
+        def my_thread(self, plugin, cancel_token):
+            while not cancel_token.cancelled:
+                do_some_work()
+                cancel_token.wait(10)     # Instead of time.sleep(10). Returns early, if cancelled.
+    """
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self):
+        """
+        True, if the thread shall stop.
+        """
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+        Requests the stop.
         """
-        self.thread.start()
+        self._event.set()
+
+    def wait(self, timeout=None):
+        """
+        Waits until the token gets cancelled or the timeout is over.
+
+        :param timeout: Seconds to wait. None waits forever.
+        :return: True, if the token is cancelled
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """
+        Raises :class:`ThreadCancelledException`, if the token is cancelled.
+        """
+        if self._event.is_set():
+            raise ThreadCancelledException("Thread got cancelled")
+
+
+def _accepts_cancel_token(function):
+    # Returns True, if the function has a parameter cancel_token
+    try:
+        if hasattr(inspect, "signature"):
+            return "cancel_token" in inspect.signature(function).parameters
+        return "cancel_token" in inspect.getargspec(function).args
+    except (TypeError, ValueError):
+        return False
+
+
+class ThreadMap(object):
+    """
+    Iterator over the results of :func:`ThreadsListApplication.map`.
+
+    Chunks get submitted on the first call of next(). The timings of all returned chunks are stored in chunks.
+
+    :param submit: Function, which submits a task to a pool and returns a future
+    :param function: Function, which gets called with a single item
+    :param iterable: Items
+    :param chunksize: Amount of items per chunk
+    :param ordered: If True, results are returned in the order of the items
+    :param max_in_flight: Maximum amount of submitted, but not yet returned chunks
+    """
+
+    def __init__(self, submit, function, iterable, chunksize=1, ordered=True, max_in_flight=1):
+        self.function = function
+        self.chunksize = chunksize
+        self.ordered = ordered
+        self.max_in_flight = max_in_flight
+
+        #: List of :class:`MapChunk` of all returned chunks in the order, in which they were returned
+        self.chunks = []
+
+        self._submit = submit
+        self._items = iter(iterable)
+        self._index = itertools.count()
+        self._exhausted = False
+        # Submitted futures. A deque in submission order, if ordered. Otherwise a set.
+        self._pending = collections.deque() if ordered else set()
+        self._results = collections.deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._results:
+            self._fill()
+            if not self._pending:
+                raise StopIteration
+            if self.ordered:
+                future = self._pending.popleft()
+            else:
+                done, not_done = futures.wait(self._pending, return_when=futures.FIRST_COMPLETED)
+                future = done.pop()
+                self._pending.discard(future)
+            try:
+                index, size, time_start, time_end, results = future.result()
+            except BaseException:
+                self.close()
+                raise
+            self.chunks.append(MapChunk(index, size, time_start, time_end))
+            self._results.extend(results)
+        return self._results.popleft()
+
+    next = __next__
+
+    def close(self):
+        """
+        Cancels all not yet started chunks. Already running chunks get finished, but their results are dropped.
+        """
+        self._exhausted = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._results.clear()
+
+    def _fill(self):
+        # Submits new chunks, until max_in_flight is reached or the items are exhausted
+        while not self._exhausted and len(self._pending) < self.max_in_flight:
+            chunk = list(itertools.islice(self._items, self.chunksize))
+            if not chunk:
+                self._exhausted = True
+                break
+            future = self._submit(_map_chunk, self.function, next(self._index), chunk)
+            if self.ordered:
+                self._pending.append(future)
+            else:
+                self._pending.add(future)
+
+
+class MapChunk(object):
+    """
+    Timing of a single chunk of :class:`ThreadMap`.
+    """
+    __slots__ = ("index", "size", "time_start", "time_end")
+
+    def __init__(self, index, size, time_start, time_end):
+        #: Position of the chunk in the items, starting with 0
+        self.index = index
+        #: Amount of items of the chunk
+        self.size = size
+        #: datetime object of the starting moment
+        self.time_start = time_start
+        #: datetime object of the ending moment
+        self.time_end = time_end
+
+    @property
+    def duration(self):
+        """
+        Duration of the chunk in seconds.
+        """
+        return (self.time_end - self.time_start).total_seconds()
+
+    def __repr__(self):
+        return "<MapChunk %s: %s items in %.6fs>" % (self.index, self.size, self.duration)
+
+
+def _map_chunk(function, index, items):
+    # Gets called inside the thread or process pool for a single chunk of ThreadMap
+    time_start = datetime.datetime.now()
+    results = [function(item) for item in items]
+    return index, len(items), time_start, datetime.datetime.now(), results
+
+
+def _execute_in_process(function, kwargs):
+    # Gets called inside a process of the process pool.
+    # Exceptions are returned, so that the times of failed runs are available, too.
+    time_start = datetime.datetime.now()
+    try:
+        response = function(**kwargs)
+    except Exception as e:
+        return time_start, datetime.datetime.now(), None, e
+    return time_start, datetime.datetime.now(), response, None
+
+
+class ThreadFuture(futures.Future):
+    """
+    Future of a single run of a thread.
+
+    :param thread: The thread, which gets run
+    :type thread: Thread
+    """
+
+    def __init__(self, thread):
+        super(ThreadFuture, self).__init__()
+        #: The thread, which gets run
+        self.thread = thread
+        #: datetime object of the starting moment of this run
+        self.time_start = None
+        #: datetime object of the ending moment of this run
+        self.time_end = None
 
 
 class ThreadWrapper(threading.Thread):
@@ -207,19 +956,21 @@ class ThreadWrapper(threading.Thread):
     before and after the provided functions gets executed.
 
     """
-    def __init__(self, thread):
+    def __init__(self, thread, future=None, kwargs=None):
         super(ThreadWrapper, self).__init__()
         self.thread = thread
         self.plugin = thread.plugin
         self.app = thread.plugin.app
+        self.future = future if future is not None else ThreadFuture(thread)
+        self.kwargs = kwargs or {}
 
-    def run(self, **kwargs):
-        self.thread.running = True
-        self.thread.time_start = datetime.datetime.now()
-        self.thread.response = self.thread.function(self.plugin, **kwargs)
-        self.thread.time_end = datetime.datetime.now()
-        self.thread.running = False
+    def run(self):
+        self.thread._execute(self.future, self.kwargs)
 
 
 class ThreadExistsException(BaseException):
     pass
+
+
+class ThreadCancelledException(Exception):
+    pass
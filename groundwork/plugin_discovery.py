@@ -0,0 +1,259 @@
+"""
+The plugin_discovery module finds plugin classes, which are provided by installed distributions via the entry point
+group "groundwork.plugin".
+
+Scanning all distributions of an environment is slow. Therefore the found entry points are stored in a small
+cache file. The cache is only valid for the environment it was created for. This is checked by a fingerprint,
+which is calculated from the entries of sys.path and the modification times of the installed distribution metadata.
+
+The cache file location can be configured by the configuration parameter ``GROUNDWORK_PLUGIN_CACHE``:
+
+ * Not set/None: ``$XDG_CACHE_HOME/groundwork/plugin_cache.json`` or ``~/.cache/groundwork/plugin_cache.json``
+ * A path: The given file is used as cache file.
+ * False: Caching is deactivated. Entry points get scanned on each start of an app.
+"""
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+
+#: Name of the entry point group, which is used by groundwork plugins
+ENTRY_POINT_GROUP = "groundwork.plugin"
+
+# Increase, if the structure of the stored data changes
+CACHE_VERSION = 1
+
+# Amount of different environments (fingerprints), which are stored inside a single cache file
+CACHE_MAX_ENVIRONMENTS = 8
+
+# File endings of directories/files, which contain distribution metadata
+METADATA_ENDINGS = (".dist-info", ".egg-info", ".egg-link", ".pth")
+
+
+class EntryPointReference(object):
+    """
+    Light-weight and unresolved reference to an object, which is provided by an entry point.
+
+    The referenced module gets imported by :func:`load` only.
+
+    :param name: Name of the entry point
+    :param module: Name of the module, which contains the referenced object
+    :param attr: Dotted path of the object inside the module. E.g. "MyPlugin"
+    :param dist_key: Key (lower case name) of the providing distribution
+    :param dist_version: Version of the providing distribution
+    :param dist_path: Location of the providing distribution
+    """
+    __slots__ = ("name", "module", "attr", "dist_key", "dist_version", "dist_path")
+
+    def __init__(self, name, module, attr, dist_key=None, dist_version=None, dist_path=None):
+        self.name = name
+        self.module = module
+        self.attr = attr
+        self.dist_key = dist_key
+        self.dist_version = dist_version
+        self.dist_path = dist_path
+
+    @classmethod
+    def from_value(cls, name, value, dist_key=None, dist_version=None, dist_path=None):
+        """
+        Creates a reference from an entry point value like "my_package.plugins:MyPlugin [extra]".
+        """
+        module, _, attr = value.partition(":")
+        attr = attr.split("[")[0].strip()
+        return cls(name, module.strip(), attr, dist_key, dist_version, dist_path)
+
+    @property
+    def attrs(self):
+        """
+        Tuple of attribute names, which get resolved from the module. Same as pkg_resources.EntryPoint.attrs.
+        """
+        return tuple(self.attr.split(".")) if self.attr else ()
+
+    def load(self):
+        """
+        Imports the module and returns the referenced object.
+        """
+        obj = importlib.import_module(self.module)
+        for attr in self.attrs:
+            obj = getattr(obj, attr)
+        return obj
+
+    def to_dict(self):
+        return dict((key, getattr(self, key)) for key in self.__slots__)
+
+
+def get_cache_path(config_value=None):
+    """
+    Returns the absolute path of the cache file or None, if caching is deactivated.
+
+    :param config_value: Value of the configuration parameter GROUNDWORK_PLUGIN_CACHE
+    """
+    if config_value is False:
+        return None
+    if config_value:
+        return os.path.abspath(config_value)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "groundwork", "plugin_cache.json")
+
+
+def get_fingerprint(paths=None):
+    """
+    Calculates a fingerprint of the current environment.
+
+    The fingerprint changes, if an entry of sys.path changes or if a distribution gets installed, updated or removed.
+    Only directory listings and file stats are needed. No metadata files get read.
+
+    :param paths: List of paths. Default is sys.path.
+    :return: fingerprint as hex string
+    """
+    if paths is None:
+        paths = sys.path
+    fingerprint = hashlib.sha1()
+    fingerprint.update(sys.executable.encode("utf-8", "replace"))
+    for path in paths:
+        path = path or os.getcwd()
+        fingerprint.update(path.encode("utf-8", "replace"))
+        try:
+            fingerprint.update(str(os.stat(path).st_mtime).encode("ascii"))
+            entries = sorted(os.listdir(path))
+        except OSError:
+            # Not existing or not a directory (e.g. a zip file). The path itself is part of the fingerprint already.
+            continue
+        for entry in entries:
+            if not entry.endswith(METADATA_ENDINGS):
+                continue
+            entry_path = os.path.join(path, entry)
+            fingerprint.update(entry.encode("utf-8", "replace"))
+            for stat_path in (entry_path, os.path.join(entry_path, "entry_points.txt")):
+                try:
+                    fingerprint.update(str(os.stat(stat_path).st_mtime).encode("ascii"))
+                except OSError:
+                    pass
+    return fingerprint.hexdigest()
+
+
+def scan_entry_points(group=ENTRY_POINT_GROUP):
+    """
+    Scans all installed distributions for entry points of the given group.
+
+    Uses importlib.metadata, if available. Otherwise pkg_resources is used.
+
+    :return: list of :class:`EntryPointReference`
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        return _scan_entry_points_pkg_resources(group)
+
+    entry_points = []
+    seen_distributions = set()
+    for distribution in metadata.distributions():
+        dist_name = distribution.metadata["Name"] or ""
+        # Same as pkg_resources: The first found distribution of a project wins.
+        dist_key = dist_name.lower().replace("_", "-")
+        if dist_key in seen_distributions:
+            continue
+        seen_distributions.add(dist_key)
+        dist_path = None
+        for entry_point in distribution.entry_points:
+            if entry_point.group != group:
+                continue
+            if dist_path is None:
+                dist_path = os.path.abspath(str(distribution.locate_file("")))
+            entry_points.append(EntryPointReference.from_value(entry_point.name, entry_point.value,
+                                                               dist_key, distribution.version, dist_path))
+    return entry_points
+
+
+def _scan_entry_points_pkg_resources(group):
+    from pkg_resources import iter_entry_points
+
+    entry_points = []
+    for entry_point in iter_entry_points(group=group, name=None):
+        entry_points.append(EntryPointReference(entry_point.name, entry_point.module_name,
+                                                ".".join(entry_point.attrs), entry_point.dist.key,
+                                                entry_point.dist.version, entry_point.dist.location))
+    return entry_points
+
+
+def discover_entry_points(cache_path=None, group=ENTRY_POINT_GROUP, log=None):
+    """
+    Returns all entry points of the given group.
+
+    If a valid cache exists for the current environment, the cached entry points are returned without scanning
+    any distribution. Otherwise the distributions get scanned and the result gets stored in the cache.
+
+    :param cache_path: Path of the cache file. If None, no cache is used.
+    :param group: Name of the entry point group
+    :param log: logger, which is used to report cache hits/misses and scan durations
+    :return: list of :class:`EntryPointReference`
+    """
+    if log is None:
+        log = logging.getLogger(__name__)
+
+    if cache_path is None:
+        start = time.time()
+        entry_points = scan_entry_points(group)
+        log.debug("Plugin discovery cache deactivated. Scanned %s entry points in %.3f s"
+                  % (len(entry_points), time.time() - start))
+        return entry_points
+
+    start = time.time()
+    fingerprint = get_fingerprint()
+    cache = _read_cache(cache_path, log)
+    cached = cache["environments"].get(fingerprint, {}).get("groups", {}).get(group, None)
+    if cached is not None:
+        log.debug("Plugin discovery cache hit: %s entry points loaded from %s in %.3f s"
+                  % (len(cached), cache_path, time.time() - start))
+        return [EntryPointReference(**entry_point) for entry_point in cached]
+
+    entry_points = scan_entry_points(group)
+    log.debug("Plugin discovery cache miss: Scanned %s entry points in %.3f s"
+              % (len(entry_points), time.time() - start))
+
+    environments = cache["environments"]
+    environment = environments.setdefault(fingerprint, {"groups": {}})
+    environment["groups"][group] = [entry_point.to_dict() for entry_point in entry_points]
+    environment["time"] = time.time()
+    # Let's forget the oldest environments, so that the cache does not grow endless.
+    for old_fingerprint in sorted(environments.keys(),
+                                  key=lambda key: environments[key].get("time", 0))[:-CACHE_MAX_ENVIRONMENTS]:
+        del environments[old_fingerprint]
+    _write_cache(cache_path, cache, log)
+    return entry_points
+
+
+def _read_cache(cache_path, log):
+    empty_cache = {"version": CACHE_VERSION, "environments": {}}
+    try:
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+    except (IOError, OSError, ValueError) as e:
+        if os.path.exists(cache_path):
+            log.warning("Plugin discovery cache %s could not be read: %s" % (cache_path, e))
+        return empty_cache
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION \
+            or not isinstance(cache.get("environments"), dict):
+        return empty_cache
+    return cache
+
+
+def _write_cache(cache_path, cache, log):
+    cache_dir = os.path.dirname(cache_path)
+    temp_path = "%s.%s.tmp" % (cache_path, os.getpid())
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        with open(temp_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+        # Replacing is atomic, so parallel starting apps do never read a half written cache file.
+        getattr(os, "replace", os.rename)(temp_path, cache_path)
+    except (IOError, OSError) as e:
+        log.warning("Plugin discovery cache %s could not be written: %s" % (cache_path, e))
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -11,12 +11,15 @@ This plugin name must be unique inside a groundwork app and can be set during pl
 """
 from __future__ import absolute_import
 from future.utils import raise_from
-from pkg_resources import iter_entry_points
+from queue import Queue
 import logging
 import inspect
 import sys
+import threading
 
-from groundwork.patterns import GwBasePattern
+from groundwork.patterns.gw_base_pattern import GwBasePattern
+from groundwork.patterns.exceptions import PluginDependencyLoop
+from groundwork.plugin_discovery import discover_entry_points, get_cache_path
 from groundwork.exceptions import PluginNotActivatableException, PluginNotInitialisableException, \
     PluginRegistrationException, PluginNotDeactivatableException
 
@@ -39,6 +42,13 @@ class PluginManager:
         self._app = app
         self._plugins = {}
 
+        # Activations can be triggered by different threads and recursively by plugins, which need other plugins.
+        self._lock = threading.RLock()
+        # Names of plugins, whose needed plugins are currently activated
+        self._activating = set()
+        # Pool threads of a parallel activation store here the queue of the thread, which holds the lock.
+        self._local = threading.local()
+
         #: Instance of :class:`~groundwork.pluginmanager.PluginClassManager`.
         #: Handles the registration of plugin classes, which can be used to create new plugins during runtime.
         self.classes = PluginClassManager(self._app)
@@ -73,6 +83,9 @@ class PluginManager:
                 raise AttributeError("plugin name must be a str, not %s" % type(plugin_name))
 
             plugin_class = self.classes.get(plugin_name)
+            # Accessing clazz imports the plugin class, if it was registered via an entry point.
+            if plugin_class is None or plugin_class.clazz is None:
+                raise PluginNotInitialisableException("Plugin class %s could not be loaded" % plugin_name)
             self.initialise(plugin_class.clazz, plugin_name)
             plugin_initialised.append(plugin_name)
 
@@ -111,7 +124,7 @@ class PluginManager:
             return plugin_instance
 
         if clazz is None:
-            self._log.warn("Plugin class %s not found" % clazz.__name__)
+            self._log.warn("Plugin class %s not found" % name)
             return None
 
         if not issubclass(clazz, GwBasePattern):
@@ -126,7 +139,7 @@ class PluginManager:
         """
         self._plugins[plugin_instance.name] = plugin_instance
 
-    def activate(self, plugins=[]):
+    def activate(self, plugins=[], workers=None):
         """
         Activates given plugins.
 
@@ -135,8 +148,17 @@ class PluginManager:
 
         If given plugins have not been initialised, this is also done via :func:`_load`.
 
+        Before any plugin gets activated, the dependencies of all given plugins (see ``needed_plugins``) are resolved
+        once. So needed plugins are activated in front of the plugins, which need them.
+        Dependency loops are logged and raise :class:`~groundwork.patterns.exceptions.PluginDependencyLoop`,
+        if the app is strict.
+
+        If more than one worker is configured, plugins get activated in parallel. See :func:`_activate_in_parallel`.
+
         :param plugins: List of plugin names
         :type plugins: list of strings
+        :param workers: Amount of threads, which activate plugins in parallel. If not given, the configuration
+                        parameter GROUNDWORK_ACTIVATION_WORKERS is used. None, 0 or 1 activate plugins sequentially.
         """
         self._log.debug("Plugins Activation started")
 
@@ -145,25 +167,55 @@ class PluginManager:
 
         self._log.debug("Plugins to activate: %s" % ", ".join(plugins))
 
-        plugins_activated = []
         for plugin_name in plugins:
             if not isinstance(plugin_name, str):
                 raise AttributeError("plugin name must be a str, not %s" % type(plugin_name))
 
-            if plugin_name not in self._plugins.keys() and plugin_name in self.classes._classes.keys():
-                self._log.debug("Initialisation needed before activation.")
-                try:
-                    self.initialise_by_names([plugin_name])
-                except Exception as e:
-                    self._log.error("Couldn't initialise plugin %s. Reason %s" % (plugin_name, e))
-                    if self._app.strict:
-                        error = "Couldn't initialise plugin %s" % plugin_name
-                        if sys.version_info[0] < 3:
-                            error += "Reason: %s" % e
-                        raise_from(Exception(error), e)
-                    else:
-                        continue
-            if plugin_name in self._plugins.keys():
+        if workers is None:
+            workers = self._app.config.get("GROUNDWORK_ACTIVATION_WORKERS", None)
+
+        plugins_activated = self._run_locked(self._activate_locked, plugins, workers)
+
+        self._log.info("Plugins activated: %s" % ", ".join(plugins_activated))
+
+    def _activate_locked(self, plugins, workers):
+        activation_order = self._resolve_activation_order(plugins)
+        if workers is not None and workers > 1:
+            return self._activate_in_parallel(activation_order, workers)
+        return self._activate_in_order(activation_order)
+
+    def _run_locked(self, function, *args):
+        """
+        Calls the given function while holding the lock of the plugin manager.
+
+        The thread of a parallel activation holds the lock, while it waits for the activation routines on the pool
+        threads. If one of these routines activates other plugins, the call is handed over to the waiting thread,
+        which executes it and returns the result. Otherwise the pool thread would wait for the lock forever.
+
+        :return: Return value of the function
+        """
+        requests = getattr(self._local, "requests", None)
+        if requests is None:
+            with self._lock:
+                return function(*args)
+        call = _DelegatedCall(function, args)
+        requests.put(call)
+        return call.wait()
+
+    def _activate_in_order(self, activation_order):
+        """
+        Activates the given plugins one after another.
+
+        :param activation_order: List of plugin names. Needed plugins must be in front of the plugins, which need them.
+        :return: List of activated plugin names
+        """
+        plugins_activated = []
+        # All plugins of the given order are handled here. So none of them must be activated by a nested
+        # dependency resolution, which could happen for plugins of a (not strict) dependency loop.
+        scheduled = set(activation_order) - self._activating
+        self._activating.update(scheduled)
+        try:
+            for plugin_name in activation_order:
                 self._log.debug("Activating plugin %s" % plugin_name)
                 if not self._plugins[plugin_name].active:
                     try:
@@ -179,8 +231,273 @@ class PluginManager:
                     self._log.warning("Plugin %s got already activated." % plugin_name)
                     if self._app.strict:
                         raise PluginNotInitialisableException()
+        finally:
+            self._activating.difference_update(scheduled)
+        return plugins_activated
 
-        self._log.info("Plugins activated: %s" % ", ".join(plugins_activated))
+    def _activate_in_parallel(self, activation_order, workers):
+        """
+        Activates the given plugins level by level on a thread pool.
+
+        A level contains all plugins, whose needed plugins are part of former levels only.
+        So all plugins of a level can be activated in parallel.
+
+        The signals plugin_activate_pre and plugin_activate_post are sent by the calling thread in the order of
+        the activation_order, so that receivers get called in a deterministic order.
+        Only the activation routines of the plugins run in parallel. So they must be thread-safe.
+
+        The pool threads can activate further plugins, e.g. by calling :func:`activate` inside their activation
+        routine. These activations are executed by the calling thread, see :func:`_run_locked`.
+
+        Errors of all plugins are collected. Plugins, which need a failed plugin, are not activated.
+        If the app is strict, no further level gets activated and a
+        :class:`~groundwork.exceptions.PluginNotActivatableException` with all errors is raised.
+        Otherwise the errors are logged only.
+
+        :param activation_order: List of plugin names. Needed plugins must be in front of the plugins, which need them.
+        :param workers: Maximum amount of threads
+        :return: List of activated plugin names
+        """
+        # concurrent.futures gets imported only, if it is really needed
+        from concurrent.futures import ThreadPoolExecutor
+
+        plugins_activated = []
+        failed = set()
+        errors = []
+        # Gets notified about finished activation routines and about calls, which the pool threads hand over.
+        requests = Queue()
+
+        def activate_plugin(plugin):
+            self._local.requests = requests
+            try:
+                type(plugin).activate.without_injections(plugin)
+            finally:
+                self._local.requests = None
+
+        scheduled = set(activation_order) - self._activating
+        self._activating.update(scheduled)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for level in self._get_activation_levels(activation_order):
+                    # Already activated plugins are checked for the whole level, before any injection is executed.
+                    # So a strict app does not leave plugins of the level with a sent plugin_activate_pre only.
+                    already_active = [plugin_name for plugin_name in level if self._plugins[plugin_name].active]
+                    for plugin_name in already_active:
+                        self._log.warning("Plugin %s got already activated." % plugin_name)
+                    if len(already_active) > 0 and self._app.strict:
+                        raise PluginNotInitialisableException()
+
+                    level_plugins = []
+                    for plugin_name in level:
+                        plugin = self._plugins[plugin_name]
+                        failed_needed_plugins = [name for name in self._get_needed_plugin_names(plugin)
+                                                 if name in failed]
+                        if len(failed_needed_plugins) > 0:
+                            self._log.warning("Plugin %s not activated, because needed plugins failed: %s"
+                                              % (plugin_name, ", ".join(failed_needed_plugins)))
+                            failed.add(plugin_name)
+                            continue
+                        if plugin_name in already_active:
+                            continue
+                        self._log.debug("Activating plugin %s" % plugin_name)
+                        try:
+                            plugin._pre_activate_injection()
+                        except Exception as e:
+                            errors.append((plugin_name, e))
+                            failed.add(plugin_name)
+                        else:
+                            level_plugins.append(plugin)
+
+                    # Only the activation routine of the plugin itself gets executed in parallel.
+                    # without_injections runs the routine without the automatically injected pre/post functions,
+                    # also if it calls a wrapped activate() of a parent class.
+                    futures = [(plugin, executor.submit(activate_plugin, plugin)) for plugin in level_plugins]
+                    for plugin, future in futures:
+                        future.add_done_callback(lambda future: requests.put(None))
+
+                    # Waits for all routines of the level and executes meanwhile the calls of the pool threads
+                    pending = len(futures)
+                    while pending > 0:
+                        call = requests.get()
+                        if call is None:
+                            pending -= 1
+                        else:
+                            call.run()
+
+                    for plugin, future in futures:
+                        try:
+                            future.result()
+                        except Exception as e:
+                            errors.append((plugin.name, e))
+                            failed.add(plugin.name)
+                        else:
+                            plugin._post_activate_injection()
+                            self._log.debug("Plugin %s activated" % plugin.name)
+                            plugins_activated.append(plugin.name)
+
+                    if len(errors) > 0 and self._app.strict:
+                        break
+        finally:
+            self._activating.difference_update(scheduled)
+
+        if len(errors) > 0:
+            error = "Plugins could not be activated: %s" % "; ".join("%s: %s" % (name, e) for name, e in errors)
+            self._log.error(error)
+            if self._app.strict:
+                raise PluginNotActivatableException(error)
+
+        return plugins_activated
+
+    def _get_activation_levels(self, activation_order):
+        """
+        Groups the given plugins into levels. Plugins of a level need only plugins of former levels.
+
+        :param activation_order: List of plugin names. Needed plugins must be in front of the plugins, which need them.
+        :return: List of levels. Each level is a list of plugin names in the order of the activation_order.
+        """
+        plugin_levels = {}
+        levels = []
+        for plugin_name in activation_order:
+            level = 0
+            for needed_plugin in self._get_needed_plugin_names(self._plugins[plugin_name]):
+                # Needed plugins, which are not part of the activation_order, are already active.
+                # Needed plugins, which are not leveled yet, are part of a dependency loop, which got cut.
+                if needed_plugin in plugin_levels:
+                    level = max(level, plugin_levels[needed_plugin] + 1)
+            plugin_levels[plugin_name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(plugin_name)
+        return levels
+
+    def _activate_needed_plugins(self, plugin):
+        """
+        Activates all plugins, which are needed by the given plugin, including their own needed plugins.
+
+        Gets called by the plugin itself right before its activation routine gets executed.
+
+        :param plugin: plugin instance, which shall be activated
+        :return: True, if all needed plugins are or got activated. Otherwise False
+        """
+        if self._needed_plugins_active(plugin):
+            return True
+        return self._run_locked(self._activate_needed_plugins_locked, plugin)
+
+    def _activate_needed_plugins_locked(self, plugin):
+        # The plugin itself is in activation, so it must not get activated again by one of its needed plugins.
+        added = plugin.name not in self._activating
+        self._activating.add(plugin.name)
+        try:
+            activation_order = self._resolve_activation_order([plugin.name])
+            self._activate_in_order([name for name in activation_order if name != plugin.name])
+        except Exception as e:
+            self._log.warning("Needed plugins of %s could not be activated: %s" % (plugin.name, e))
+            return False
+        finally:
+            if added:
+                self._activating.discard(plugin.name)
+        return self._needed_plugins_active(plugin)
+
+    def _needed_plugins_active(self, plugin):
+        for needed_plugin in self._get_needed_plugin_names(plugin):
+            if needed_plugin in self._activating:
+                continue
+            if needed_plugin not in self._plugins.keys() or not self._plugins[needed_plugin].active:
+                return False
+        return True
+
+    def _get_needed_plugin_names(self, plugin):
+        needed_plugins = getattr(plugin, "needed_plugins", ())
+        if not isinstance(needed_plugins, tuple) and not isinstance(needed_plugins, list):
+            raise TypeError("needed_plugins must be a tuple or a list")
+        for needed_plugin in needed_plugins:
+            if not isinstance(needed_plugin, str):
+                raise TypeError("Plugin name must be a string, got %s" % type(needed_plugin).__name__)
+        return needed_plugins
+
+    def _get_plugin_for_activation(self, plugin_name):
+        """
+        Returns the plugin instance for the given name. The plugin gets initialised, if this was not done yet.
+
+        :return: plugin instance or None, if plugin is unknown or could not be initialised.
+        """
+        if plugin_name not in self._plugins.keys() and plugin_name in self.classes._classes.keys():
+            self._log.debug("Initialisation needed before activation.")
+            try:
+                self.initialise_by_names([plugin_name])
+            except (Exception, PluginNotInitialisableException) as e:
+                self._log.error("Couldn't initialise plugin %s. Reason %s" % (plugin_name, e))
+                if self._app.strict:
+                    error = "Couldn't initialise plugin %s" % plugin_name
+                    if sys.version_info[0] < 3:
+                        error += "Reason: %s" % e
+                    raise_from(Exception(error), e)
+                return None
+        return self._plugins.get(plugin_name, None)
+
+    def _resolve_activation_order(self, plugins):
+        """
+        Builds the dependency graph of the given plugins and their needed plugins and returns a list of plugin names,
+        in which needed plugins are in front of the plugins, which need them.
+
+        The graph gets walked once by an iterative depth-first search, so that the costs are O(plugins + dependencies).
+        Already active plugins are not part of the result, if they were not requested explicitly.
+
+        Dependency loops get logged. If the app is strict, :class:`PluginDependencyLoop` is raised.
+        Otherwise the loop gets cut and the plugins are activated in the order they were found.
+
+        :param plugins: List of plugin names, which shall be activated
+        :return: List of plugin names in activation order
+        """
+        activation_order = []
+        loops = []
+        done = set()
+        requested_plugins = set(plugins)
+        # Stack of the depth-first search. Each entry is (plugin name, iterator over its needed plugin names)
+        stack = []
+        stack_positions = {}
+
+        def enter(plugin_name, requested):
+            plugin = self._get_plugin_for_activation(plugin_name)
+            if plugin is None:
+                if not requested:
+                    self._log.warning("Needed plugin %s does not exist" % plugin_name)
+                done.add(plugin_name)
+            elif requested and plugin.active:
+                # Gets reported during activation
+                done.add(plugin_name)
+                activation_order.append(plugin_name)
+            elif not requested and (plugin.active or plugin_name in self._activating):
+                done.add(plugin_name)
+            else:
+                stack_positions[plugin_name] = len(stack)
+                stack.append((plugin_name, iter(self._get_needed_plugin_names(plugin))))
+
+        for plugin_name in plugins:
+            if plugin_name in done:
+                continue
+            enter(plugin_name, requested=True)
+            while stack:
+                current_name, needed_plugins = stack[-1]
+                for needed_plugin in needed_plugins:
+                    if needed_plugin in stack_positions:
+                        loops.append([name for name, _ in stack[stack_positions[needed_plugin]:]] + [needed_plugin])
+                    elif needed_plugin not in done:
+                        enter(needed_plugin, requested=needed_plugin in requested_plugins)
+                        break
+                else:
+                    stack.pop()
+                    del stack_positions[current_name]
+                    done.add(current_name)
+                    activation_order.append(current_name)
+
+        for loop in loops:
+            error = "Plugin dependency loop detected: %s" % " -> ".join(loop)
+            self._log.warning(error)
+            if self._app.strict:
+                raise PluginDependencyLoop(error)
+
+        return activation_order
 
     def deactivate(self, plugins=[]):
         """
@@ -226,6 +543,29 @@ class PluginManager:
 
         self._log.info("Plugins deactivated: %s" % ", ".join(plugins_deactivated))
 
+    def remove(self, name):
+        """
+        Removes an initialised plugin from the plugin manager. An active plugin gets deactivated first.
+
+        Afterwards groundwork does not reference the plugin anymore, if the plugin has connected only weak receivers,
+        which are still connected after deactivation. See :func:`~groundwork.signals.SignalsApplication.connect`.
+        So the plugin object gets garbage collected, if the application does not keep own references to it.
+
+        The plugin class stays registered, so that the plugin can be initialised again.
+
+        :param name: Name of the plugin
+        :return: The removed plugin object or None, if no plugin with this name exists
+        """
+        plugin = self._plugins.get(name, None)
+        if plugin is None:
+            self._log.info("Unknown plugin %s can not be removed" % name)
+            return None
+        if plugin.active:
+            self.deactivate([name])
+        del self._plugins[name]
+        self._log.debug("Plugin %s removed" % name)
+        return plugin
+
     def get(self, name=None):
         """
         Returns the plugin object with the given name.
@@ -265,6 +605,35 @@ class PluginManager:
         return None
 
 
+class _DelegatedCall(object):
+    """
+    Function call, which a pool thread of a parallel activation hands over to the thread holding the lock.
+    See :func:`PluginManager._run_locked`.
+    """
+    __slots__ = ("function", "args", "result", "error", "_done")
+
+    def __init__(self, function, args):
+        self.function = function
+        self.args = args
+        self.result = None
+        self.error = None
+        self._done = threading.Event()
+
+    def run(self):
+        try:
+            self.result = self.function(*self.args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 class PluginClassManager:
     """
     Manages the plugin classes, which can be used to initialise and activate new plugins.
@@ -282,50 +651,39 @@ class PluginClassManager:
     def _get_plugins_by_entry_points(self):
         """
         Registers plugin classes, which are in sys.path and have an entry_point called 'groundwork.plugin'.
+
+        The found entry points get cached (see :mod:`groundwork.plugin_discovery`), so that a warm start of an
+        application does not need to scan all installed distributions.
+
+        The plugin classes do not get imported here. They get loaded on first access of
+        :attr:`PluginClass.clazz`, which normally happens during plugin initialisation.
+
         :return: dict of plugin classes
         """
+        cache_path = get_cache_path(self._app.config.get("GROUNDWORK_PLUGIN_CACHE", None))
+
         # Let's find and register every plugin, which is in sys.path and has defined a entry_point 'groundwork.plugin'
         # in it's setup.py
-        entry_points = []
         classes = {}
-        for entry_point in iter_entry_points(group='groundwork.plugin', name=None):
-            entry_points.append(entry_point)
-
-        for entry_point in entry_points:
-            try:
-                entry_point_object = entry_point.load()
-            except Exception as e:
-                # We should not throw an exception now, because a package/entry_point can be outdated, using an old
-                # api from groundwork, tries to import unavailable packages, what ever...
-                # We just do not make it available. That's all we can do.
-                self._log.debug("Couldn't load entry_point %s. Reason: %s" % (entry_point.name, e))
-                continue
-
-            if not issubclass(entry_point_object, GwBasePattern):
-                self._log.warning("entry_point  %s is not a subclass of groundworkPlugin" % entry_point.name)
-                continue
-            plugin_name = entry_point_object.__name__
+        for entry_point in discover_entry_points(cache_path, log=self._app.log):
+            # The plugin name is the name of the referenced class, which is the last part of the entry point
+            # object reference. E.g. "GwPluginsInfo" for "groundwork.plugins.gw_plugins_info:GwPluginsInfo"
+            if entry_point.attrs:
+                plugin_name = entry_point.attrs[-1]
+            else:
+                plugin_name = entry_point.name
 
-            plugin_class = self.register_class(entry_point_object, plugin_name,
+            plugin_class = self.register_class(None, plugin_name,
                                                entrypoint_name=entry_point.name,
-                                               distribution_path=entry_point.dist.location,
-                                               distribution_key=entry_point.dist.key,
-                                               distribution_version=entry_point.dist.version)
+                                               distribution_path=entry_point.dist_path,
+                                               distribution_key=entry_point.dist_key,
+                                               distribution_version=entry_point.dist_version,
+                                               entry_point=entry_point)
 
             classes[plugin_name] = plugin_class
-            # classes[plugin_name] = {
-            #     "name": plugin_name,
-            #     "entry_point": entry_point.name,
-            #     "path": entry_point.dist.location,
-            #     "class": entry_point_object,
-            #     "distribution": {
-            #         "key": entry_point.dist.key,
-            #         "version": entry_point.dist.version
-            #     },
-            # }
             self._log.debug("Found plugin: %s at entry_point %s of package %s (%s)" % (plugin_name, entry_point.name,
-                                                                                       entry_point.dist.key,
-                                                                                       entry_point.dist.version))
+                                                                                       entry_point.dist_key,
+                                                                                       entry_point.dist_version))
         return classes
 
     def register(self, classes=[]):
@@ -354,20 +712,27 @@ class PluginClassManager:
         self._log.info("Plugins registered: %s" % ", ".join(plugin_registered))
 
     def register_class(self, clazz, name=None, entrypoint_name=None, distribution_path=None,
-                       distribution_key=None, distribution_version=None):
+                       distribution_key=None, distribution_version=None, entry_point=None):
+        """
+        Registers a single plugin class.
 
+        If an entry_point is given, clazz can be None. The class gets then loaded from the entry point on first
+        access of :attr:`PluginClass.clazz`.
+        """
         if name is None:
             name = clazz.__name__
 
-        if not inspect.isclass(clazz) or not issubclass(clazz, GwBasePattern):
-            self._log.error("Given plugin is not a subclass of groundworkPlugin.")
-            if self._app.strict:
-                raise AttributeError("Given plugin is not a subclass of groundworkPlugin.")
+        # Classes of entry points get checked during their loading
+        if entry_point is None:
+            if not inspect.isclass(clazz) or not issubclass(clazz, GwBasePattern):
+                self._log.error("Given plugin is not a subclass of groundworkPlugin.")
+                if self._app.strict:
+                    raise AttributeError("Given plugin is not a subclass of groundworkPlugin.")
 
-        if isinstance(clazz, GwBasePattern):
-            self._log.error("Given plugin %s is already initialised. Please provide a class not an instance.")
-            if self._app.strict:
-                raise Exception("Given plugin %s is already initialised. Please provide a class not an instance.")
+            if isinstance(clazz, GwBasePattern):
+                self._log.error("Given plugin %s is already initialised. Please provide a class not an instance.")
+                if self._app.strict:
+                    raise Exception("Given plugin %s is already initialised. Please provide a class not an instance.")
 
         if name in self._classes.keys():
             self._log.warning("Plugin %s already registered" % name)
@@ -375,7 +740,7 @@ class PluginClassManager:
                 raise PluginRegistrationException("Plugin %s already registered" % name)
 
         self._classes[name] = PluginClass(name, clazz, entrypoint_name, distribution_path,
-                                          distribution_key, distribution_version)
+                                          distribution_key, distribution_version, entry_point)
 
         return self._classes[name]
 
@@ -414,13 +779,76 @@ class PluginClassManager:
         return False
 
 
-class PluginClass:
-    def __init__(self, name, clazz, entrypoint_name, distribution_path, distribution_key, distribution_version):
+class PluginClass(object):
+    """
+    Stores a plugin class together with information about its origin.
+
+    If the plugin class was found via an entry point, only the unresolved entry point is stored.
+    The class itself gets imported on first access of :attr:`clazz`.
+
+    :param name: Name of the plugin class
+    :param clazz: The plugin class. Can be None, if entry_point is given.
+    :param entrypoint_name: Name of the entry point, which provides the class
+    :param distribution_path: Location of the distribution, which provides the class
+    :param distribution_key: Key/Name of the distribution, which provides the class
+    :param distribution_version: Version of the distribution, which provides the class
+    :param entry_point: Unresolved entry point, which is used to load the class on first access
+    """
+    __slots__ = ("name", "entrypoint_name", "_clazz", "_entry_point", "distribution")
+
+    _log = logging.getLogger(__name__)
+    # Entry points can be loaded by several threads, e.g. during a parallel activation
+    _load_lock = threading.RLock()
+
+    def __init__(self, name, clazz, entrypoint_name, distribution_path, distribution_key, distribution_version,
+                 entry_point=None):
         self.name = name
         self.entrypoint_name = entrypoint_name
-        self.clazz = clazz
+        self._clazz = clazz
+        self._entry_point = entry_point
         self.distribution = {
             "path": distribution_path,
             "key": distribution_key,
             "version": distribution_version
         }
+
+    @property
+    def clazz(self):
+        """
+        The plugin class.
+
+        Gets loaded from the entry point on first access.
+        Is None, if the entry point could not be loaded or does not provide a groundwork plugin class.
+        """
+        if self._entry_point is not None:
+            with PluginClass._load_lock:
+                # Another thread may have loaded the class, while this one waited for the lock
+                if self._entry_point is not None:
+                    self._load()
+        return self._clazz
+
+    def _load(self):
+        entry_point = self._entry_point
+        try:
+            clazz = entry_point.load()
+        except Exception as e:
+            # We should not throw an exception now, because a package/entry_point can be outdated, using an old
+            # api from groundwork, tries to import unavailable packages, what ever...
+            # We just do not make it available. That's all we can do.
+            self._log.debug("Couldn't load entry_point %s. Reason: %s" % (entry_point.name, e))
+        else:
+            if not inspect.isclass(clazz) or not issubclass(clazz, GwBasePattern):
+                self._log.warning("entry_point  %s is not a subclass of groundworkPlugin" % entry_point.name)
+            else:
+                self._clazz = clazz
+        finally:
+            # Whatever happens, we try to load an entry point only once.
+            # The entry point gets reset after the class, so that threads without the lock never see a missing class.
+            self._entry_point = None
+
+    @property
+    def loaded(self):
+        """
+        True, if the plugin class was already imported (or the loading of its entry point failed).
+        """
+        return self._entry_point is None
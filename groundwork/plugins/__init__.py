@@ -1,5 +1,15 @@
-from groundwork.plugins.gw_plugins_info import GwPluginsInfo
-from groundwork.plugins.gw_signals_info import GwSignalsInfo
-from groundwork.plugins.gw_commands_info import GwCommandsInfo
-from groundwork.plugins.gw_documents_info import GwDocumentsInfo
-from groundwork.plugins.gw_recipes_builder import GwRecipesBuilder
+from groundwork.util import gw_lazy_attributes
+
+# Plugins are imported on first access only. So "import groundwork" does not import click, jinja2, docutils or
+# cookiecutter, which are only needed if one of the plugins gets really used.
+_plugins = {
+    "GwPluginsInfo": "groundwork.plugins.gw_plugins_info",
+    "GwSignalsInfo": "groundwork.plugins.gw_signals_info",
+    "GwCommandsInfo": "groundwork.plugins.gw_commands_info",
+    "GwDocumentsInfo": "groundwork.plugins.gw_documents_info",
+    "GwRecipesBuilder": "groundwork.plugins.gw_recipes_builder",
+}
+
+__all__ = list(_plugins.keys())
+
+__getattr__, __dir__ = gw_lazy_attributes(__name__, _plugins)
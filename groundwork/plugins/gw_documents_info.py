@@ -2,7 +2,6 @@ import os
 import sys
 from jinja2 import Environment
 from click import echo, prompt, Option, Argument
-from docutils.core import publish_parts
 from groundwork.patterns import GwDocumentsPattern, GwCommandsPattern
 
 documents_content = """
@@ -133,6 +132,10 @@ class GwDocumentsInfo(GwCommandsPattern, GwDocumentsPattern):
         if answer == "N":
             sys.exit(0)
 
+        if html:
+            # docutils is only needed for html output and its import is expensive.
+            from docutils.core import publish_parts
+
         for document in documents:
             try:
                 with open(os.path.join(path, document[0]), "w") as doc_file:
@@ -19,6 +19,14 @@ List of signals
 Name: {{signal.name}}
 Description: {{signal.description}}
 Plugin: {{signal.plugin.name}}
+{% if signal.history is not none %}
+Send history (last {{signal.history|count}} of {{signal.history.total}} sends):
+
+{% for entry in signal.history.entries() %}
+ * {{entry.time}} from {{entry.plugin}} ({{entry.kwargs|join(", ")}}):
+   {{entry.receivers}} receivers in {{"%.3f"|format(entry.duration * 1000)}} ms{% if entry.failed %}, failed{% endif %}
+{% endfor %}
+{% endif %}
 {% endfor %}
 
 """
@@ -58,6 +66,8 @@ class GwSignalsInfo(GwCommandsPattern, GwDocumentsPattern):
     def activate(self):
         self.commands.register("signal_list", "List of all signals", self.list_signals)
         self.commands.register("receiver_list", "List of all signal receivers", self.list_receivers)
+        self.commands.register("signal_stats", "Dispatch metrics of signals and receivers", self.show_stats)
+        self.commands.register("signal_history", "Last sends of signals", self.show_history)
 
         self.documents.register(name="signals_overview",
                                 content=signal_content,
@@ -90,3 +100,46 @@ class GwSignalsInfo(GwCommandsPattern, GwDocumentsPattern):
                                                receiver.signal,
                                                receiver.plugin.name,
                                                receiver.description))
+
+    def show_stats(self):
+        """
+        Prints the dispatch metrics of all signals and receivers. Sorted by the total time.
+        """
+        if not self.app.signals.stats_enabled:
+            print("Collection of signal metrics is disabled. Set GROUNDWORK_SIGNALS_STATS = True to enable it.\n")
+
+        print("Signal stats")
+        print("************\n")
+        self._print_stats(self.app.signals.get_stats(), "sends")
+
+        print("Receiver stats")
+        print("**************\n")
+        self._print_stats(self.app.signals.get_receiver_stats(), "calls")
+
+    def show_history(self):
+        """
+        Prints the send history of all signals, which store one. Oldest sends first.
+        """
+        print("Signal history")
+        print("**************\n")
+        signals = [signal for signal in self.app.signals.signals.values() if signal.history is not None]
+        if not signals:
+            print("No signal stores a send history. Register a signal with history=<size> or set "
+                  "GROUNDWORK_SIGNALS_HISTORY = <size>.\n")
+        for signal in signals:
+            print("%s (last %s of %s sends)" % (signal.name, len(signal.history), signal.history.total))
+            for entry in signal.history.entries():
+                print("  %s  %-30s %4s receivers %10.3f ms%s  [%s]" % (
+                    entry.time, entry.plugin, entry.receivers, entry.duration * 1000,
+                    " FAILED" if entry.failed else "", ", ".join(entry.kwargs)))
+            print("")
+
+    @staticmethod
+    def _print_stats(stats, count_name):
+        print("%-40s %10s %10s %12s %10s %10s %10s" % ("name", count_name, "exceptions", "total [ms]",
+                                                       "p50 [ms]", "p95 [ms]", "p99 [ms]"))
+        for entry in sorted(stats.values(), key=lambda entry: entry["total_time"], reverse=True):
+            print("%-40s %10s %10s %12.3f %10.3f %10.3f %10.3f" % (entry["name"], entry["count"], entry["exceptions"],
+                                                                   entry["total_time"] * 1000, entry["p50"] * 1000,
+                                                                   entry["p95"] * 1000, entry["p99"] * 1000))
+        print("")
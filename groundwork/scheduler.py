@@ -0,0 +1,287 @@
+"""
+Timer for delayed function calls, which is shared by all parts of a groundwork application.
+
+All scheduled calls of an application are stored in a single heap and executed by a single background thread.
+So a delayed action does not need an own thread or :class:`threading.Timer`.
+"""
+import datetime
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+#: Monotonic clock of the scheduler. Falls back to time.time() on Python 2.
+clock = getattr(time, "monotonic", time.time)
+
+
+class Scheduler(object):
+    """
+    Executes functions at given times by a single background thread.
+
+    The thread gets started with the first scheduled call. Scheduled functions should return quickly, because they
+    delay all other calls. Long running work should be handed over to other threads.
+
+    Exceptions of scheduled functions are logged.
+
+    Example::
+
+        call = my_app.scheduler.schedule(5, my_function, args=(1, 2))
+        my_app.scheduler.cancel(call)
+
+    :param name: Name of the background thread
+    :param clock: Function, which returns the current time in seconds. Default is :data:`clock`.
+                  Schedules, which are based on the scheduler, use it too. So tests can inject a manual clock.
+    """
+
+    def __init__(self, name="groundwork-scheduler", clock=clock):
+        self.name = name
+        self.clock = clock
+        # Heap of tuples (time, sequence number, ScheduledCall)
+        self._queue = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        # Gets increased by shutdown(). A thread of an older generation stops.
+        self._generation = 0
+        self._log = logging.getLogger(__name__)
+
+    def __len__(self):
+        """
+        Amount of scheduled, not cancelled calls.
+        """
+        with self._condition:
+            return len(self._queue) - self._cancelled
+
+    def schedule(self, delay, function, args=(), kwargs=None):
+        """
+        Calls a function after the given delay.
+
+        Arguments are given as tuple and dictionary, so that they can not collide with the parameters of this function.
+
+        :param delay: Delay in seconds
+        :param function: Function to call
+        :param args: tuple of positional arguments for the function
+        :param kwargs: dictionary of keyword arguments for the function
+        :return: :class:`ScheduledCall`, which can be cancelled
+        """
+        return self.schedule_at(self.clock() + delay, function, args, kwargs)
+
+    def schedule_at(self, when, function, args=(), kwargs=None):
+        """
+        Calls a function at the given time.
+
+        :param when: Time as returned by the clock of the scheduler
+        :param function: Function to call
+        :param args: tuple of positional arguments for the function
+        :param kwargs: dictionary of keyword arguments for the function
+        :return: :class:`ScheduledCall`, which can be cancelled
+        """
+        call = ScheduledCall(when, function, args, kwargs or {})
+        with self._condition:
+            heapq.heappush(self._queue, (when, next(self._counter), call))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(self._generation,), name=self.name)
+                self._thread.daemon = True
+                self._thread.start()
+            elif self._queue[0][2] is call:
+                # The new call is the next one. So the thread must wake up earlier.
+                self._condition.notify_all()
+        return call
+
+    def cancel(self, call):
+        """
+        Cancels a scheduled call.
+
+        :param call: :class:`ScheduledCall`, returned by :func:`schedule`
+        :return: True, if the call was cancelled. False, if it is already running, done or cancelled.
+        """
+        with self._condition:
+            if call.state != ScheduledCall.PENDING:
+                return False
+            call.state = ScheduledCall.CANCELLED
+            # Cancelled calls stay in the heap and get skipped. If they are the majority, the heap gets rebuilt.
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._queue):
+                self._queue = [entry for entry in self._queue if entry[2].state == ScheduledCall.PENDING]
+                heapq.heapify(self._queue)
+                self._cancelled = 0
+            return True
+
+    def shutdown(self, wait=True):
+        """
+        Stops the background thread and drops all scheduled calls.
+        The thread gets started again by the next scheduled call.
+
+        :param wait: If True, waits until a running call is finished
+        """
+        with self._condition:
+            for entry in self._queue:
+                entry[2].state = ScheduledCall.CANCELLED
+            self._queue = []
+            self._cancelled = 0
+            self._generation += 1
+            thread = self._thread
+            self._thread = None
+            self._condition.notify_all()
+        if thread is not None and wait and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self, generation):
+        while True:
+            with self._condition:
+                while True:
+                    if self._generation != generation:
+                        return
+                    if not self._queue:
+                        # The thread stops, if it has nothing to do for a while
+                        self._condition.wait(5)
+                        if not self._queue and self._generation == generation:
+                            self._thread = None
+                            return
+                        continue
+                    when, sequence, call = self._queue[0]
+                    if call.state == ScheduledCall.CANCELLED:
+                        heapq.heappop(self._queue)
+                        self._cancelled -= 1
+                        continue
+                    remaining = when - self.clock()
+                    if remaining <= 0:
+                        heapq.heappop(self._queue)
+                        call.state = ScheduledCall.RUNNING
+                        break
+                    self._condition.wait(remaining)
+            try:
+                call.function(*call.args, **call.kwargs)
+            except Exception as e:
+                name = getattr(call.function, "__name__", call.function)
+                self._log.exception("Scheduled call of %s failed: %s" % (name, e))
+            finally:
+                call.state = ScheduledCall.DONE
+
+
+class ScheduledCall(object):
+    """
+    A function call, which was scheduled by :class:`Scheduler`.
+    """
+    __slots__ = ("when", "function", "args", "kwargs", "state")
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+
+    def __init__(self, when, function, args, kwargs):
+        #: Time of the call, as returned by the clock of the scheduler
+        self.when = when
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        #: One of pending, running, done or cancelled
+        self.state = ScheduledCall.PENDING
+
+    @property
+    def cancelled(self):
+        return self.state == ScheduledCall.CANCELLED
+
+
+class CronExpression(object):
+    """
+    Cron-like expression with the five fields minute, hour, day of month, month and day of week.
+
+    Each field supports ``*``, single values, ranges like ``1-5``, lists like ``1,15`` and steps like ``*/10``.
+    Day of week 0 and 7 are sunday. If day of month and day of week are both restricted, a day matches, if one of
+    them matches, same as cron does. The aliases @hourly, @daily, @weekly, @monthly and @yearly are supported.
+
+    Example::
+
+        expression = CronExpression("*/15 8-18 * * 1-5")    # Every 15 minutes during working hours
+        next_time = expression.next(datetime.datetime.now())
+
+    :param expression: The cron expression
+    :type expression: str
+    """
+    ALIASES = {"@hourly": "0 * * * *",
+               "@daily": "0 0 * * *",
+               "@weekly": "0 0 * * 0",
+               "@monthly": "0 0 1 * *",
+               "@yearly": "0 0 1 1 *"}
+
+    # Name, minimum and maximum of each field
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expression):
+        self.expression = expression
+        fields = self.ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError("Cron expression %s must have 5 fields, got %s" % (expression, len(fields)))
+        values = [self._parse(field, *definition) for field, definition in zip(fields, self.FIELDS)]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = values
+        if 7 in self.weekdays:
+            self.weekdays = self.weekdays | set([0])
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self):
+        return "<CronExpression %s>" % self.expression
+
+    def _parse(self, field, name, minimum, maximum):
+        values = set()
+        for part in field.split(","):
+            step = 1
+            stepped = "/" in part
+            if stepped:
+                part, step = part.split("/", 1)
+                step = self._number(step, name)
+                if step < 1:
+                    raise ValueError("Step of cron field %s must be at least 1: %s" % (name, field))
+            if part == "*":
+                start, end = minimum, maximum
+            elif "-" in part:
+                start, end = [self._number(value, name) for value in part.split("-", 1)]
+            else:
+                start = self._number(part, name)
+                end = maximum if stepped else start
+            if start < minimum or end > maximum or start > end:
+                raise ValueError("Cron field %s must be between %s and %s: %s" % (name, minimum, maximum, field))
+            values.update(range(start, end + 1, step))
+        return values
+
+    @staticmethod
+    def _number(value, name):
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError("Invalid value %s of cron field %s" % (value, name))
+
+    def _day_matches(self, date):
+        day = date.day in self.days
+        weekday = date.isoweekday() % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next(self, after):
+        """
+        Returns the next matching time after the given time.
+
+        :param after: datetime object
+        :return: datetime object with seconds and microseconds set to 0
+        """
+        current = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        # Every valid expression matches at least once in 8 years (leap days)
+        limit = current + datetime.timedelta(days=8 * 366)
+        while current < limit:
+            if current.month not in self.months:
+                year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+                current = current.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(current):
+                current = current.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif current.hour not in self.hours:
+                current = current.replace(minute=0) + datetime.timedelta(hours=1)
+            elif current.minute not in self.minutes:
+                current += datetime.timedelta(minutes=1)
+            else:
+                return current
+        raise ValueError("Cron expression %s never matches" % self.expression)
@@ -1,12 +1,46 @@
+import bisect
+import collections
+import datetime
+import fnmatch
+import functools
+import itertools
 import logging
+import multiprocessing
+import re
+import sys
+import threading
+import time
+import types
+import weakref
+from concurrent import futures
 
-# from blinker import Namespace
+from groundwork.scheduler import Scheduler
+from groundwork.signals_stats import SignalStatsCollector, perf_counter
+from groundwork.util import Registry
 
-# Used in groundwork <= 0.1.11
-# Used WeakNamespace could also be Namespace.
-# But doc says, Weaknamespace gets clean up, if no reference exists anymore.
-# from blinker import WeakNamespace as Namespace  # Do not use, seems to Clean up still needed parts!
-from blinker import Namespace as Namespace
+#: Overflow policy of queued signals: send() waits until the queue has space again
+OVERFLOW_BLOCK = "block"
+#: Overflow policy of queued signals: The oldest queued signal gets dropped
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+#: Overflow policy of queued signals: The new signal gets dropped
+OVERFLOW_DROP_NEWEST = "drop_newest"
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST)
+
+#: Characters, which make the signal name of a receiver to a pattern. See :func:`is_pattern`.
+WILDCARD_CHARACTERS = "*?["
+
+
+class _Stop(object):
+    __slots__ = ()
+
+    def __repr__(self):
+        return "STOP"
+
+
+#: Return value of a receiver, which stops the propagation of a signal. Receivers with lower priority do not get
+#: called anymore. Example: ``from groundwork.signals import STOP``
+STOP = _Stop()
 
 
 class SignalsApplication:
@@ -26,26 +60,53 @@ class SignalsApplication:
 
         #: Dictionary of registered signals. Dictionary key is the registered signal name.
         #: Value is an instance of :class:`~groundwork.signals.Signal`.
-        self.signals = {}
+        self.signals = Registry()
 
         #: Dictionary of registered receivers. Dictionary key is the registered receiver name.
         #: Value is an instance of :class:`~groundwork.signals.Receiver`.
-        self.receivers = {}
-
-        # We must use an unique namespace for our signals. Otherwise we get problems with multiple applications or
-        # application recreation, because blinker throws every signal to a "singleton container", which stays
-        # the same for the whole runtime of the python interpreter. No cleanup or anything else.
-        # So registered signals and receivers keep registered, whatever you do with the app.
-        # How to use namespace in blinker? See:
-        # http://flask.pocoo.org/docs/0.11/signals/#creating-signals for blinker namespace usage
-        # https://github.com/jek/blinker/blob/master/blinker/base.py#L432
-        #: Used blinker namespace object to register signals only for the context of a single groundwork application
-        #: instance
-        self._namespace = Namespace()
+        self.receivers = Registry()
+
+        # Dispatchers of all signal names, which have a registered signal or connected receivers.
+        # Key is the signal name, value an instance of SignalDispatcher.
+        # They are the only place, where the connected receivers of a signal are stored. Each application has its own
+        # dispatchers, so signals and receivers of an application are not visible in other applications.
+        self._dispatchers = {}
+
+        # Receivers, whose signal is a pattern like "db.*". They get added to the dispatchers of all matching signals.
+        self._patterns = SignalPatternTrie()
+
+        # Connection order of all receivers. Used to call receivers of different signal patterns in connection order.
+        self._connection_counter = itertools.count(1)
+
+        #: Instance of :class:`~groundwork.signals.ReceiverExecutor`, which executes threaded receivers.
+        #: Size of the thread pool is configurable by the configuration parameter GROUNDWORK_SIGNALS_WORKERS.
+        self.executor = ReceiverExecutor(app.config.get("GROUNDWORK_SIGNALS_WORKERS", None))
+
+        #: Instance of :class:`~groundwork.signals.QueueDispatcher`, which delivers queued signals in background.
+        self.queue_dispatcher = QueueDispatcher()
+
+        #: Instance of :class:`~groundwork.signals_stats.SignalStatsCollector`, which stores the dispatch metrics.
+        #: Metrics get only collected, if :func:`enable_stats` was called or the configuration parameter
+        #: GROUNDWORK_SIGNALS_STATS is True.
+        self.stats = SignalStatsCollector()
+        self.stats_enabled = False
+        if app.config.get("GROUNDWORK_SIGNALS_STATS", False):
+            self.enable_stats()
+
+        #: Default size of the send history of new signals. 0 means no history.
+        #: Configurable by the configuration parameter GROUNDWORK_SIGNALS_HISTORY.
+        self.history_size = app.config.get("GROUNDWORK_SIGNALS_HISTORY", 0)
+
+        #: Instance of :class:`~groundwork.scheduler.Scheduler`, which flushes coalesced signals.
+        #: It's the scheduler of the application.
+        self.scheduler = getattr(app, "scheduler", None)
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
 
         self.__log.info("Application signals initialised")
 
-    def register(self, signal, plugin, description=""):
+    def register(self, signal, plugin, description="", threaded=False, queued=False, queue_size=1000,
+                 overflow=OVERFLOW_BLOCK, history=None, coalesce=None, debounce=False, merge=None):
         """
         Registers a new signal.
 
@@ -53,11 +114,40 @@ class SignalsApplication:
         :param plugin: Plugin, which registers the new signal
         :param description: Description of the reason or use case, why this signal is needed.
                             Used for documentation.
+        :param threaded: If True, all receivers of this signal get executed by the thread pool of the application.
+                         send() returns futures instead of return values for them.
+        :param queued: If True, send() only puts the signal into a queue and returns immediately.
+                       The receivers get called by a background thread.
+        :param queue_size: Maximum amount of queued, but not yet delivered signals. Used only, if queued is True.
+        :param overflow: Policy, if the queue is full. One of "block", "drop_oldest" or "drop_newest".
+        :param history: Amount of last sends, which are stored in the send history of the signal. 0 means no history.
+                        If None, GROUNDWORK_SIGNALS_HISTORY is used.
+        :param coalesce: If set, sends get merged and delivered as one combined send per sender.
+                         A number is the time window in seconds, after which the combined send gets delivered.
+                         True means, the combined send gets delivered by :func:`flush` only.
+        :param debounce: If True, each send restarts the coalescing window.
+                         So the signal gets delivered after no send happened for the whole window.
+        :param merge: Function merge(previous_kwargs, kwargs), which combines the keyword arguments of coalesced sends.
+                      If None, the keyword arguments of the last send are delivered.
         """
         if signal in self.signals.keys():
             raise Exception("Signal %s was already registered by %s" % (signal, self.signals[signal].plugin.name))
 
-        self.signals[signal] = Signal(signal, plugin, self._namespace, description)
+        new_signal = Signal(signal, plugin, description, self._get_dispatcher(signal), threaded)
+        if queued:
+            new_signal.queue = SignalQueue(new_signal, self.queue_dispatcher, queue_size, overflow)
+        if history is None:
+            history = self.history_size
+        if history:
+            new_signal.history = SignalHistory(history)
+        if coalesce is not None and coalesce is not False:
+            window = None if coalesce is True else coalesce
+            new_signal.coalescer = SignalCoalescer(new_signal, self.scheduler, window, debounce, merge,
+                                                   self.executor)
+        self.signals[signal] = new_signal
+        # Signals pick up all receivers, which were connected to a matching pattern before
+        for receiver in self._patterns.match(signal):
+            new_signal._dispatcher.add(receiver)
         self.__log.debug("Signal %s registered by %s" % (signal, plugin.name))
         return self.signals[signal]
 
@@ -68,32 +158,66 @@ class SignalsApplication:
         :param signal: Name of the signal
         """
         if signal in self.signals.keys():
+            old_signal = self.signals[signal]
             del(self.signals[signal])
+            if old_signal.coalescer is not None:
+                old_signal.coalescer.clear()
+            if old_signal.queue is not None:
+                self.queue_dispatcher.close(old_signal.queue)
+            for receiver in self._patterns.match(signal):
+                old_signal._dispatcher.remove(receiver)
+            self._release_dispatcher(signal)
             self.__log.debug("Signal %s unregisterd" % signal)
         else:
             self.__log.debug("Signal %s does not exist and could not be unregistered.")
 
-    def connect(self, receiver, signal, function, plugin, description="", sender=None):
+    def connect(self, receiver, signal, function, plugin, description="", sender=None, threaded=False,
+                batch_function=None, weak=False, priority=0):
         """
         Connect a receiver to a signal
 
         :param receiver: Name of the receiver
         :type receiver: str
-        :param signal: Name of the signal. Must already be registered!
+        :param signal: Name of the signal or a pattern like "db.*" or "plugin_*", which matches the names of
+                       multiple signals. See :func:`is_pattern`.
         :type signal: str
         :param function: Callable functions, which shall be executed, of signal is send.
         :param plugin: The plugin objects, which connects one of its functions to a signal.
         :param description: Description of the reason or use case, why this connection is needed.
                             Used for documentation.
         :param sender: If set, only signals from this sender will be send to ths receiver.
-
+        :param threaded: If True, the function gets executed by the thread pool of the application.
+                         send() returns a future instead of the return value for this receiver.
+        :param batch_function: Optional function, which gets called by :func:`send_many` with the sender and the
+                               whole list of payloads, instead of calling function for each payload.
+        :param weak: If True, function, plugin, sender and batch_function are referenced weakly only.
+                     If one of them gets garbage collected, the receiver gets disconnected automatically.
+        :param priority: Receivers with a higher priority get called first. Receivers with the same priority get
+                         called in the order of their connection. Default is 0.
+                         If a receiver returns :data:`STOP`, receivers with a lower position are not called.
         """
         if receiver in self.receivers.keys():
             raise Exception("Receiver %s was already registered by %s" % (receiver,
                                                                           self.receivers[receiver].plugin.name))
-        self.receivers[receiver] = Receiver(receiver, signal, function, plugin, self._namespace, description, sender)
+        if weak:
+            new_receiver = WeakReceiver(receiver, signal, function, plugin, description, sender,
+                                        threaded, batch_function, priority, self._disconnect_dead_receiver)
+        else:
+            new_receiver = Receiver(receiver, signal, function, plugin, description, sender,
+                                    threaded, batch_function, priority)
+        new_receiver.order = next(self._connection_counter)
+        self.receivers[receiver] = new_receiver
+        # Receivers with an invalid function or signal name are not connected. See Receiver.__init__().
+        if hasattr(function, '__call__') and isinstance(signal, str):
+            if new_receiver.pattern is None:
+                self._get_dispatcher(signal).add(new_receiver)
+            else:
+                self._patterns.add(new_receiver)
+                for name in self.signals.keys():
+                    if new_receiver.pattern.match(name):
+                        self._dispatchers[name].add(new_receiver)
         self.__log.debug("Receiver %s registered for signal %s" % (receiver, signal))
-        return self.receivers[receiver]
+        return new_receiver
 
     def disconnect(self, receiver):
         """
@@ -104,10 +228,26 @@ class SignalsApplication:
         """
         if receiver not in self.receivers.keys():
             raise Exception("No receiver %s was registered" % receiver)
-        self.receivers[receiver].disconnect()
+        old_receiver = self.receivers[receiver]
         del(self.receivers[receiver])
+        if old_receiver.pattern is None:
+            dispatcher = self._dispatchers.get(old_receiver.signal, None)
+            if dispatcher is not None:
+                dispatcher.remove(old_receiver)
+                self._release_dispatcher(old_receiver.signal)
+        elif self._patterns.remove(old_receiver):
+            for name in self.signals.keys():
+                if old_receiver.pattern.match(name):
+                    self._dispatchers[name].remove(old_receiver)
+        # Not yet started executions of a disconnected receiver are not needed anymore
+        self.executor.cancel(old_receiver)
         self.__log.debug("Receiver %s disconnected" % receiver)
 
+    def _disconnect_dead_receiver(self, receiver):
+        # Called by weak receivers, if one of their referenced objects got garbage collected
+        if self.receivers.get(receiver.name, None) is receiver:
+            self.disconnect(receiver.name)
+
     def send(self, signal, plugin, **kwargs):
         """
         Sends a signal for the given plugin.
@@ -116,45 +256,219 @@ class SignalsApplication:
         :type signal: str
         :param plugin: Plugin object, under which the signals where registered
         :type plugin: GwBasePattern
+        :return: list of tuples (function, return value). For threaded receivers the return value is a future.
+                 Use :func:`~groundwork.signals.wait` to wait for them.
         """
-        if signal not in self.signals.keys():
+        # This function gets called very often. So we avoid every unneeded lookup or string formatting here.
+        signal_object = self.signals.get(signal, None)
+        if signal_object is None:
             raise UnknownSignal("Unknown signal %s" % signal)
-        self.__log.debug("Sending signal %s for %s" % (signal, plugin.name))
-        rv = self.signals[signal].send(plugin, **kwargs)
-        return rv
+        self.__log.debug("Sending signal %s for %s", signal, plugin.name)
+        return signal_object.send(plugin, **kwargs)
 
-    def get(self, signal=None, plugin=None):
+    def send_many(self, signal, plugin, payloads):
         """
-        Get one or more signals.
+        Sends a signal once per given payload.
+
+        Faster than calling :func:`send` for each payload, because the receivers get resolved only once.
+        Receivers, which were connected with a batch_function, get called only once with the whole list of payloads.
+        All other receivers get called once per payload.
 
         :param signal: Name of the signal
         :type signal: str
         :param plugin: Plugin object, under which the signals where registered
         :type plugin: GwBasePattern
+        :param payloads: list of dictionaries. Each dictionary contains the keyword arguments for a single send.
+        :return: list of tuples (function, result). One tuple per receiver. result is the return value of the batch
+                 function or a list of return values, one per payload. For threaded receivers it's a future.
         """
-        if plugin is not None:
-            if signal is None:
-                signals_list = {}
-                for key in self.signals.keys():
-                    if self.signals[key].plugin == plugin:
-                        signals_list[key] = self.signals[key]
-                return signals_list
-            else:
-                if signal in self.signals.keys():
-                    if self.signals[signal].plugin == plugin:
-                        return self.signals[signal]
-                    else:
-                        return None
+        signal_object = self.signals.get(signal, None)
+        if signal_object is None:
+            raise UnknownSignal("Unknown signal %s" % signal)
+        payloads = list(payloads)
+        self.__log.debug("Sending signal %s %s times for %s", signal, len(payloads), plugin.name)
+        return signal_object.send_many(plugin, payloads)
+
+    def send_async(self, signal, plugin, max_concurrency=None, **kwargs):
+        """
+        Sends a signal for the given plugin and awaits coroutine receivers concurrently.
+
+        Returns an awaitable, which must be awaited inside a running asyncio event loop::
+
+            answers = await my_app.signals.send_async("my_signal", my_plugin, max_concurrency=5, data=data)
+
+        Receivers can be coroutine functions or plain functions. Plain functions get called directly.
+        Threaded receivers get executed by the thread pool of the application, same as by :func:`send`, and their
+        results get awaited. A plain function can stop the signal by returning :data:`STOP`. Coroutine functions and
+        threaded receivers can not stop the signal, because their return values are not known, before the following
+        receivers get called.
+
+        Coalesced and queued signals are handled the same way as by :func:`send`: The send gets merged or queued
+        and the awaitable returns an empty list. The send history and the metrics of the signal get recorded
+        after all receivers are finished. Metrics per receiver are not recorded.
+
+        Needs Python >= 3.5.
+
+        :param signal: Name of the signal
+        :type signal: str
+        :param plugin: Plugin object, under which the signals where registered
+        :type plugin: GwBasePattern
+        :param max_concurrency: Maximum amount of receivers, which are executed at the same time. None means no limit.
+        :type max_concurrency: int
+        :return: awaitable, which returns a list of tuples (function, return value), same as :func:`send`
+        """
+        if sys.version_info < (3, 5):
+            raise RuntimeError("send_async needs Python >= 3.5")
+        signal_object = self.signals.get(signal, None)
+        if signal_object is None:
+            raise UnknownSignal("Unknown signal %s" % signal)
+
+        # Imported here, because the module needs Python >= 3.5 and asyncio is not needed by most applications.
+        from groundwork.signals_async import send_async, completed, recorded
+
+        self.__log.debug("Sending signal %s asynchronously for %s", signal, plugin.name)
+        if signal_object.coalescer is not None:
+            signal_object.coalescer.put(plugin, kwargs)
+            return completed([])
+        if signal_object.queue is not None:
+            signal_object.queue.put(plugin, kwargs)
+            return completed([])
+        awaitable = send_async(signal_object._dispatcher.receivers_for(plugin), plugin, kwargs, max_concurrency,
+                               self.executor, signal_object.threaded)
+        if signal_object.history is not None or self.stats_enabled:
+            stats = self.stats if self.stats_enabled else None
+            awaitable = recorded(awaitable, signal_object, plugin, kwargs, stats)
+        return awaitable
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops the background thread for queued signals and the thread pool, which executes threaded receivers.
+
+        A later send of a queued or threaded signal starts them again.
+
+        :param wait: If True, waits until all queued signals are delivered and all running receivers are finished
+        :param cancel_pending: If True, coalesced and queued signals and not yet started receivers get
+                               dropped/cancelled. Otherwise they get executed first.
+        """
+        for signal in list(self.signals.values()):
+            if signal.coalescer is not None:
+                if cancel_pending:
+                    signal.coalescer.clear()
                 else:
-                    return None
+                    signal.coalescer.flush()
+        self.queue_dispatcher.shutdown(wait, cancel_pending)
+        self.executor.shutdown(wait, cancel_pending)
+
+    def flush(self, signal=None):
+        """
+        Delivers the pending sends of coalesced signals immediately.
+
+        :param signal: Name of the signal. If None, all coalesced signals get flushed.
+        :return: list of tuples (function, return value) of all delivered sends
+        """
+        if signal is None:
+            signals = list(self.signals.values())
         else:
-            if signal is None:
-                return self.signals
-            else:
-                if signal in self.signals.keys():
-                    return self.signals[signal]
-                else:
-                    return None
+            signal_object = self.signals.get(signal, None)
+            if signal_object is None:
+                raise UnknownSignal("Unknown signal %s" % signal)
+            signals = [signal_object]
+        answers = []
+        for signal_object in signals:
+            if signal_object.coalescer is not None:
+                answers.extend(signal_object.coalescer.flush())
+        return answers
+
+    def enable_stats(self):
+        """
+        Starts the collection of dispatch metrics for all signals and receivers.
+        """
+        self.stats_enabled = True
+        for dispatcher in self._dispatchers.values():
+            dispatcher.stats = self.stats
+
+    def disable_stats(self):
+        """
+        Stops the collection of dispatch metrics. Already collected metrics are kept.
+        """
+        self.stats_enabled = False
+        for dispatcher in self._dispatchers.values():
+            dispatcher.stats = None
+
+    def reset_stats(self):
+        """
+        Deletes all collected dispatch metrics.
+        """
+        self.stats.reset()
+
+    def get_stats(self, signal=None):
+        """
+        Returns the dispatch metrics of signals: Amount of sends and exceptions, total/mean/max time and the
+        50th, 95th and 99th percentile of the send duration. All times are in seconds.
+
+        :param signal: Name of the signal. If None, the metrics of all signals are returned.
+        :return: dictionary of metrics or, if no signal is given, a dictionary with signal names as keys and
+                 metrics as values
+        """
+        return self.stats.get(self.stats.signals, signal)
+
+    def get_receiver_stats(self, receiver=None):
+        """
+        Returns the dispatch metrics of receivers: Amount of calls and exceptions, total/mean/max time and the
+        50th, 95th and 99th percentile of the call duration. All times are in seconds.
+
+        :param receiver: Name of the receiver. If None, the metrics of all receivers are returned.
+        :return: dictionary of metrics or, if no receiver is given, a dictionary with receiver names as keys and
+                 metrics as values
+        """
+        return self.stats.get(self.stats.receivers, receiver)
+
+    def queue_stats(self):
+        """
+        Returns the queue metrics of all queued signals.
+
+        :return: dictionary with signal names as keys and the result of :func:`SignalQueue.stats` as values
+        """
+        return dict((name, signal.queue.stats()) for name, signal in self.signals.items() if signal.queue is not None)
+
+    def get_history(self, signal):
+        """
+        Returns the last sends of a signal, oldest first.
+
+        :param signal: Name of the signal
+        :return: list of :class:`SignalHistoryEntry`. Empty, if the signal has no history.
+        """
+        signal_object = self.signals.get(signal, None)
+        if signal_object is None:
+            raise UnknownSignal("Unknown signal %s" % signal)
+        if signal_object.history is None:
+            return []
+        return signal_object.history.entries()
+
+    def _get_dispatcher(self, signal):
+        dispatcher = self._dispatchers.get(signal, None)
+        if dispatcher is None:
+            dispatcher = self._dispatchers[signal] = SignalDispatcher(self.executor, signal)
+            if self.stats_enabled:
+                dispatcher.stats = self.stats
+        return dispatcher
+
+    def _release_dispatcher(self, signal):
+        # Dispatchers are kept as long as the signal is registered or receivers are connected to it.
+        dispatcher = self._dispatchers.get(signal, None)
+        if dispatcher is not None and signal not in self.signals and not len(dispatcher):
+            del self._dispatchers[signal]
+
+    def get(self, signal=None, plugin=None):
+        """
+        Get one or more signals.
+
+        :param signal: Name of the signal
+        :type signal: str
+        :param plugin: Plugin object, under which the signals where registered
+        :type plugin: GwBasePattern
+        """
+        return self.signals.find(signal, plugin)
 
     def get_receiver(self, receiver=None, plugin=None):
         """
@@ -165,32 +479,10 @@ class SignalsApplication:
         :param plugin: Plugin object, under which the signals where registered
         :type plugin: GwBasePattern
         """
-        if plugin is not None:
-            if receiver is None:
-                receiver_list = {}
-                for key in self.receivers.keys():
-                    if self.receivers[key].plugin == plugin:
-                        receiver_list[key] = self.receivers[key]
-                return receiver_list
-            else:
-                if receiver in self.receivers.keys():
-                    if self.receivers[receiver].plugin == plugin:
-                        return self.receivers[receiver]
-                    else:
-                        return None
-                else:
-                    return None
-        else:
-            if receiver is None:
-                return self.receivers
-            else:
-                if receiver in self.receivers.keys():
-                    return self.receivers[receiver]
-                else:
-                    return None
+        return self.receivers.find(receiver, plugin)
 
 
-class Signal:
+class Signal(object):
     """
     Groundwork signal class. Used to store name, description and plugin.
 
@@ -198,62 +490,1084 @@ class Signal:
 
     :param name: Name of the signal
     :type name: str
-    :param namespace: Namespace of the signal. There is one per groundwork app.
     :param description: Additional description for the signal
     :type description: str
     :param plugin: The plugin, which registered this signal
     :type plugin: GwBasePattern
+    :param dispatcher: Dispatcher, which knows the connected receivers. If None, the signal gets an own dispatcher.
+    :type dispatcher: SignalDispatcher
+    :param threaded: If True, all receivers get executed by the thread pool of the dispatcher
+    :type threaded: bool
     """
-    def __init__(self, name, plugin, namespace, description=""):
+    __slots__ = ("name", "description", "plugin", "threaded", "queue", "history", "coalescer", "_dispatcher")
+
+    def __init__(self, name, plugin, description="", dispatcher=None, threaded=False):
         self.name = name
         self.description = description
         self.plugin = plugin
-        self._signal = namespace.signal(name, doc=description)
+        self.threaded = threaded
+        #: Instance of :class:`SignalQueue`, if the signal gets delivered in background. Otherwise None.
+        self.queue = None
+        #: Instance of :class:`SignalHistory`, if the last sends shall be stored. Otherwise None.
+        self.history = None
+        #: Instance of :class:`SignalCoalescer`, if sends get merged. Otherwise None.
+        self.coalescer = None
+        self._dispatcher = dispatcher if dispatcher is not None else SignalDispatcher(name=name)
 
     def send(self, plugin, **kwargs):
-        return self._signal.send(plugin, **kwargs)
+        """
+        Sends the signal.
+
+        :return: list of tuples (function, return value). Empty, if the signal is queued or coalesced.
+        """
+        if self.coalescer is not None:
+            self.coalescer.put(plugin, kwargs)
+            return []
+        if self.queue is not None:
+            self.queue.put(plugin, kwargs)
+            return []
+        return self.deliver(plugin, kwargs)
+
+    def send_many(self, plugin, payloads):
+        """
+        Sends the signal once per payload.
+
+        :param payloads: list of dictionaries with keyword arguments for the receivers
+        :return: list of tuples (function, result) per receiver, see :func:`SignalDispatcher.dispatch_many`.
+                 Empty, if the signal is queued or coalesced.
+        """
+        if self.coalescer is not None:
+            for payload in payloads:
+                self.coalescer.put(plugin, payload)
+            return []
+        if self.queue is not None:
+            for payload in payloads:
+                self.queue.put(plugin, payload)
+            return []
+        if self.history is not None:
+            return self._record_many(plugin, payloads)
+        return self._deliver_many(plugin, payloads)
+
+    def _deliver_many(self, plugin, payloads):
+        return self._dispatcher.dispatch_many(plugin, payloads, self.threaded)
+
+    def _record_many(self, plugin, payloads):
+        timestamp = time.time()
+        start = perf_counter()
+        answers = None
+        try:
+            answers = self._deliver_many(plugin, payloads)
+            return answers
+        finally:
+            if payloads:
+                duration = (perf_counter() - start) / len(payloads)
+                receivers = len(answers) if answers is not None else -1
+                for payload in payloads:
+                    self.history.record(timestamp, plugin, payload, receivers, duration, answers is None)
+
+    def deliver(self, plugin, kwargs):
+        """
+        Calls the receivers immediately. Also used to deliver queued signals.
+        """
+        if self.history is not None:
+            return self._record(plugin, kwargs)
+        return self._dispatcher.dispatch(plugin, kwargs, self.threaded)
+
+    def _record(self, plugin, kwargs):
+        # Same as deliver(), but stores the send in the history
+        timestamp = time.time()
+        start = perf_counter()
+        answers = None
+        try:
+            answers = self._dispatcher.dispatch(plugin, kwargs, self.threaded)
+            return answers
+        finally:
+            receivers = len(answers) if answers is not None else -1
+            self.history.record(timestamp, plugin, kwargs, receivers, perf_counter() - start, answers is None)
+
+    def receivers_for(self, plugin):
+        """
+        Returns a list of receiver functions, which get called, if the signal gets sent for the given plugin.
+        """
+        return [function for function in (receiver.function for receiver in self._dispatcher.receivers_for(plugin))
+                if function is not None]
+
+
+class SignalDispatcher(object):
+    """
+    Stores the connected receivers of a single signal and calls them, if the signal gets sent.
+
+    The receivers, which must be called for a sender, get resolved on the first send only and are cached afterwards.
+    The cache gets invalidated, if a receiver gets added or removed.
+
+    The semantic is the same as of blinker, which was used to send signals in groundwork <= 0.1.16:
+
+     * A receiver without a sender gets called for each sender.
+     * A receiver with a sender gets called only, if the signal gets sent for exactly this sender object.
+     * A function, which was connected multiple times, gets called only once per send.
+
+    Different to blinker, the receivers get always called in the order of their priority and connection.
+    Receivers of a signal pattern are called in the order of their connection too, even if the signal got registered
+    after the connection.
+    The order is kept at connection time, so sending does not sort anything.
+
+    If a receiver returns :data:`STOP`, all following receivers are skipped. This is not possible for threaded
+    receivers, because their return value is not known during sending.
+
+    :param executor: Executor for threaded receivers. If None, threaded receivers get called directly.
+    :type executor: ReceiverExecutor
+    :param name: Name of the signal
+    """
+    __slots__ = ("executor", "name", "stats", "_any", "_by_sender", "_cache", "_counter")
+
+    def __init__(self, executor=None, name=None):
+        self.executor = executor
+        self.name = name
+        #: Instance of :class:`~groundwork.signals_stats.SignalStatsCollector`, if metrics shall be collected.
+        self.stats = None
+        # Receivers are stored as tuple (-priority, receiver order, counter, receiver) and kept sorted, so that
+        # receivers with a higher priority come first. The counter only separates receivers with the same order.
+        self._any = []
+        # Key is id(sender). This is safe, because the receiver keeps a reference to its sender.
+        # Weak receivers get removed, before their sender is gone.
+        self._by_sender = {}
+        # Key is id(sender) for senders with own receivers. Otherwise None. Value is a tuple of receivers.
+        self._cache = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._any) + sum(len(entries) for entries in self._by_sender.values())
+
+    def add(self, receiver):
+        self._counter += 1
+        entry = (-receiver.priority, receiver.order, self._counter, receiver)
+        if receiver.sender_id is None:
+            bisect.insort(self._any, entry)
+        else:
+            bisect.insort(self._by_sender.setdefault(receiver.sender_id, []), entry)
+        # A new cache object, so that a running send does not store outdated receivers in the new cache
+        self._cache = {}
+
+    def remove(self, receiver):
+        if receiver.sender_id is None:
+            entries = self._any
+        else:
+            entries = self._by_sender.get(receiver.sender_id, [])
+        for index, entry in enumerate(entries):
+            if entry[-1] is receiver:
+                del entries[index]
+                break
+        if receiver.sender_id is not None and not entries:
+            self._by_sender.pop(receiver.sender_id, None)
+        self._cache = {}
+
+    def receivers_for(self, sender):
+        """
+        Returns a tuple of receivers, which must be called, if the signal gets sent for the given sender.
+        """
+        cache = self._cache
+        key = id(sender)
+        if key not in self._by_sender:
+            key = None
+        receivers = cache.get(key, None)
+        if receivers is None:
+            # A copy, because garbage collected weak receivers may get removed while we iterate
+            entries = tuple(self._any)
+            if key is not None:
+                entries = sorted(entries + tuple(self._by_sender[key]))
+            receivers = []
+            functions = set()
+            for priority, order, counter, receiver in entries:
+                function = receiver.function
+                if function is None:
+                    # Weak receiver, whose function is already gone
+                    continue
+                function_id = _hashable_identity(function)
+                if function_id not in functions:
+                    functions.add(function_id)
+                    receivers.append(receiver)
+            receivers = cache[key] = tuple(receivers)
+        return receivers
+
+    def send(self, sender, **kwargs):
+        """
+        Calls all receivers for the given sender.
+
+        :return: list of tuples (function, return value), same as blinker
+        """
+        return self.dispatch(sender, kwargs)
+
+    def dispatch(self, sender, kwargs, threaded=False):
+        """
+        Calls all receivers for the given sender.
+
+        Threaded receivers get submitted to the executor. Their return value is a future.
+
+        :param sender: Sender/plugin of the signal
+        :param kwargs: dictionary of keyword arguments for the receivers
+        :param threaded: If True, all receivers are handled as threaded receivers
+        :return: list of tuples (function, return value or future)
+        """
+        if self.stats is not None:
+            return self._dispatch_measured(sender, kwargs, threaded)
+        answers = []
+        executor = self.executor
+        for receiver in self.receivers_for(sender):
+            function = receiver.function
+            if function is None:
+                continue
+            if (threaded or receiver.threaded) and executor is not None:
+                answers.append((function, executor.submit(receiver, function, (sender,), kwargs)))
+            else:
+                answer = function(sender, **kwargs)
+                answers.append((function, answer))
+                if answer is STOP:
+                    break
+        return answers
 
+    def _dispatch_measured(self, sender, kwargs, threaded):
+        # Same as dispatch(), but records the durations and exceptions of the signal and each receiver
+        stats = self.stats
+        executor = self.executor
+        start = perf_counter()
+        failed = True
+        try:
+            answers = []
+            for receiver in self.receivers_for(sender):
+                function = receiver.function
+                if function is None:
+                    continue
+                args = (receiver, function, (sender,), kwargs)
+                if (threaded or receiver.threaded) and executor is not None:
+                    answers.append((function, executor.submit(receiver, stats.call, args)))
+                else:
+                    answer = stats.call(*args)
+                    answers.append((function, answer))
+                    if answer is STOP:
+                        break
+            failed = False
+            return answers
+        finally:
+            stats.record_signal(self.name, perf_counter() - start, failed)
 
-class Receiver:
+    def dispatch_many(self, sender, payloads, threaded=False):
+        """
+        Calls all receivers for the given sender and a list of payloads.
+
+        The receivers get resolved only once. Receivers with a batch function get called once with the whole list.
+        All other receivers get called once per payload.
+
+        :param sender: Sender/plugin of the signals
+        :param payloads: list of dictionaries with keyword arguments for the receivers
+        :param threaded: If True, all receivers are handled as threaded receivers
+        :return: list of tuples (function, result) per receiver. For receivers with a batch function, function is the
+                 batch function and result its return value. For all others result is a list of return values.
+                 For threaded receivers result is a future.
+
+        If a receiver returns :data:`STOP` for a payload, the following receivers do not get this payload anymore.
+        So their result lists contain only the results of the remaining payloads. If a batch function returns
+        :data:`STOP`, no following receiver gets called.
+        """
+        answers = []
+        executor = self.executor
+        stats = self.stats
+        count = len(payloads)
+        start = perf_counter()
+        failed = True
+        try:
+            for receiver in self.receivers_for(sender):
+                batch_function = receiver.batch_function
+                if batch_function is not None:
+                    function = batch_function
+                    if stats is None:
+                        call, args = function, (sender, payloads)
+                    else:
+                        call, args = stats.call, (receiver, function, (sender, payloads), {})
+                else:
+                    function = receiver.function
+                    if function is None:
+                        continue
+                    call, args = _call_for_each, (function, sender, payloads, receiver, stats)
+                if (threaded or receiver.threaded) and executor is not None:
+                    answers.append((function, executor.submit(receiver, call, args)))
+                else:
+                    answer = call(*args)
+                    answers.append((function, answer))
+                    if answer is STOP:
+                        break
+                    if batch_function is None and any(result is STOP for result in answer):
+                        payloads = [payload for payload, result in zip(payloads, answer) if result is not STOP]
+                        if not payloads:
+                            break
+            failed = False
+            return answers
+        finally:
+            if stats is not None and count:
+                stats.record_signal(self.name, (perf_counter() - start) / count, failed, count)
+
+
+def _call_for_each(function, sender, payloads, receiver=None, stats=None):
+    if stats is None:
+        return [function(sender, **payload) for payload in payloads]
+    return [stats.call(receiver, function, (sender,), payload) for payload in payloads]
+
+
+class ReceiverExecutor(object):
+    """
+    Executes threaded receivers on a bounded thread pool, which is shared by all signals of an application.
+
+    The thread pool gets created on first usage. Futures of not yet finished executions are stored per receiver,
+    so that they can be cancelled, if the receiver gets disconnected (e.g. during plugin deactivation).
+
+    Exceptions of threaded receivers are logged. They are also available via the returned futures.
+
+    :param max_workers: Maximum amount of threads. Default is the amount of CPUs + 4, but not more than 32.
+    :type max_workers: int
+    """
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = min(32, multiprocessing.cpu_count() + 4)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1, got %s" % max_workers)
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._log = logging.getLogger(__name__)
+
+    def submit(self, receiver, function, args=(), kwargs=None):
+        """
+        Executes a function for the given receiver in the thread pool.
+
+        Arguments are given as tuple and dictionary, so that keyword arguments of a signal can not collide with
+        the parameters of this function.
+
+        :param receiver: Receiver, for which the function gets executed
+        :param function: Function to execute. Normally the function of the receiver.
+        :param args: tuple of positional arguments for the function
+        :param kwargs: dictionary of keyword arguments for the function
+        :return: future
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+            future = self._executor.submit(function, *args, **(kwargs or {}))
+            self._pending.setdefault(receiver, set()).add(future)
+        future.add_done_callback(functools.partial(self._done, receiver))
+        return future
+
+    def _done(self, receiver, future):
+        with self._lock:
+            pending = self._pending.get(receiver, None)
+            if pending is not None:
+                pending.discard(future)
+                if not pending:
+                    del self._pending[receiver]
+        if not future.cancelled() and future.exception() is not None:
+            self._log.error("Threaded receiver %s for signal %s failed: %s"
+                            % (receiver.name, receiver.signal, future.exception()))
+
+    def pending(self, receiver=None):
+        """
+        Returns the amount of not finished executions of a receiver or of all receivers, if no receiver is given.
+        """
+        with self._lock:
+            if receiver is not None:
+                return len(self._pending.get(receiver, ()))
+            return sum(len(pending) for pending in self._pending.values())
+
+    def cancel(self, receiver):
+        """
+        Cancels all not yet started executions of the given receiver.
+
+        :return: Amount of cancelled executions
+        """
+        with self._lock:
+            pending = list(self._pending.get(receiver, ()))
+        return len([future for future in pending if future.cancel()])
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops the thread pool. A new thread pool gets created on next submit.
+
+        :param wait: If True, waits until all running executions are finished
+        :param cancel_pending: If True, not yet started executions get cancelled
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            pending = [future for futures_set in self._pending.values() for future in futures_set]
+        if cancel_pending:
+            for future in pending:
+                future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class SignalQueue(object):
+    """
+    Bounded queue of sent, but not yet delivered signals of a single queued signal.
+
+    :param signal: The queued signal
+    :type signal: Signal
+    :param dispatcher: Background dispatcher, which delivers the queued signals
+    :type dispatcher: QueueDispatcher
+    :param maxsize: Maximum amount of queued signals
+    :param overflow: Policy, if the queue is full. One of "block", "drop_oldest" or "drop_newest".
+    """
+
+    def __init__(self, signal, dispatcher, maxsize=1000, overflow=OVERFLOW_BLOCK):
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1, got %s" % maxsize)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy %s. Allowed are: %s" % (overflow, ", ".join(OVERFLOW_POLICIES)))
+        self.signal = signal
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.closed = False
+
+        #: Amount of signals, which were put into the queue
+        self.enqueued = 0
+        #: Amount of delivered signals
+        self.delivered = 0
+        #: Amount of dropped signals
+        self.dropped = 0
+        #: Highest reached queue depth
+        self.max_depth = 0
+
+        self._items = collections.deque()
+        self._dispatcher = dispatcher
+
+    @property
+    def depth(self):
+        """
+        Current amount of queued signals.
+        """
+        return len(self._items)
+
+    def put(self, sender, kwargs):
+        """
+        Puts a signal into the queue.
+
+        :return: True, if the signal got queued. False, if it was dropped.
+        """
+        return self._dispatcher.put(self, sender, kwargs)
+
+    def stats(self):
+        """
+        Returns the queue metrics as dictionary.
+        """
+        return {"depth": self.depth,
+                "max_depth": self.max_depth,
+                "maxsize": self.maxsize,
+                "overflow": self.overflow,
+                "enqueued": self.enqueued,
+                "delivered": self.delivered,
+                "dropped": self.dropped}
+
+
+class SignalCoalescer(object):
+    """
+    Merges the sends of a single signal and delivers them as one combined send.
+
+    Sends are merged per sender. After the first send of a sender the combined send gets delivered, if the window
+    is over or :func:`flush` gets called. If window is None, only :func:`flush` delivers the combined sends.
+
+    All coalescers of an application share the same :class:`~groundwork.scheduler.Scheduler`. Its thread only hands
+    the delivery over to the executor after the window. So slow receivers do not delay other scheduled calls.
+
+    :param signal: The coalesced signal
+    :type signal: Signal
+    :param scheduler: Scheduler, which flushes the signal after the window
+    :type scheduler: ~groundwork.scheduler.Scheduler
+    :param window: Time window in seconds or None for explicit flushes only
+    :param debounce: If True, each send restarts the window. So the signal gets delivered after a quiet period.
+    :param merge: Function merge(previous_kwargs, kwargs), which returns the combined keyword arguments.
+                  If None, the keyword arguments of the last send are used.
+    :param executor: Executor, which delivers the combined sends after the window.
+                     If None, they get delivered by the thread of the scheduler.
+    :type executor: ReceiverExecutor
+    """
+
+    def __init__(self, signal, scheduler, window=None, debounce=False, merge=None, executor=None):
+        if window is not None and window < 0:
+            raise ValueError("Coalescing window must not be negative, got %s" % window)
+        self.signal = signal
+        self.window = window
+        self.debounce = debounce
+        self.merge = merge
+
+        #: Amount of sends, which were merged into a pending send
+        self.coalesced = 0
+        #: Amount of delivered, combined sends
+        self.delivered = 0
+
+        # Pending sends per sender. Key is id(sender), value is a list [sender, kwargs].
+        self._pending = collections.OrderedDict()
+        self._call = None
+        self._lock = threading.Lock()
+        self._scheduler = scheduler
+        self._executor = executor
+        self._log = logging.getLogger(__name__)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def put(self, sender, kwargs):
+        """
+        Merges a send into the pending send of the sender.
+        """
+        with self._lock:
+            pending = self._pending.get(id(sender), None)
+            if pending is None:
+                self._pending[id(sender)] = [sender, kwargs]
+            else:
+                pending[1] = kwargs if self.merge is None else self.merge(pending[1], kwargs)
+                self.coalesced += 1
+            if self.window is None:
+                return
+            if self._call is not None and self.debounce:
+                self._scheduler.cancel(self._call)
+                self._call = None
+            if self._call is None:
+                self._call = self._scheduler.schedule(self.window, self._window_over)
+
+    def flush(self):
+        """
+        Delivers all pending sends immediately.
+
+        :return: list of tuples (function, return value) of all delivered sends.
+                 Empty, if the signal is queued or nothing was pending.
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            if self._call is not None:
+                self._scheduler.cancel(self._call)
+                self._call = None
+            self.delivered += len(pending)
+        answers = []
+        for sender, kwargs in pending:
+            if self.signal.queue is not None:
+                self.signal.queue.put(sender, kwargs)
+            else:
+                answers.extend(self.signal.deliver(sender, kwargs))
+        return answers
+
+    def _window_over(self):
+        # Gets called by the thread of the scheduler, which must not be blocked by receivers or full queues
+        with self._lock:
+            self._call = None
+        if self._executor is None:
+            self._flush_logged()
+        else:
+            self._executor.submit(self, self._flush_logged)
+
+    def _flush_logged(self):
+        try:
+            self.flush()
+        except Exception as e:
+            self._log.exception("Delivery of coalesced signal %s failed: %s" % (self.signal.name, e))
+
+    def clear(self):
+        """
+        Drops all pending sends.
+        """
+        with self._lock:
+            self._pending.clear()
+            if self._call is not None:
+                self._scheduler.cancel(self._call)
+                self._call = None
+
+    def stats(self):
+        """
+        Returns the coalescing metrics as dictionary.
+        """
+        return {"pending": len(self._pending),
+                "window": self.window,
+                "debounce": self.debounce,
+                "coalesced": self.coalesced,
+                "delivered": self.delivered}
+
+
+class SignalHistory(object):
+    """
+    Ring buffer, which stores the last sends of a single signal.
+
+    The buffer and all its :class:`SignalHistoryEntry` objects get allocated during creation. Recording a send
+    overwrites the values of the oldest entry. The tuple of keyword argument names gets reused, as long as the sends
+    use the same keyword arguments. So recording a send does not allocate new objects in most cases.
+
+    :param size: Maximum amount of stored sends
+    """
+    __slots__ = ("size", "total", "_entries", "_index", "_names", "_lock")
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("History size must be at least 1, got %s" % size)
+        self.size = size
+        #: Amount of all recorded sends, including the already overwritten ones
+        self.total = 0
+        self._entries = [SignalHistoryEntry(0, None, (), 0, 0.0) for index in range(size)]
+        self._index = 0
+        # Names of the keyword arguments of the last send
+        self._names = ()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.size)
+
+    def record(self, timestamp, sender, kwargs, receivers, duration, failed=False):
+        """
+        Stores a send and overwrites the oldest one, if the buffer is full.
+
+        :param timestamp: Time of the send, as returned by time.time()
+        :param sender: Sender/plugin of the signal
+        :param kwargs: Keyword arguments of the send. Only their names get stored.
+        :param receivers: Amount of called receivers. -1, if unknown because of an exception.
+        :param duration: Duration of the send in seconds
+        :param failed: True, if a receiver has raised an exception
+        """
+        with self._lock:
+            names = self._names
+            if len(names) != len(kwargs):
+                names = self._names = tuple(kwargs)
+            else:
+                for name in names:
+                    if name not in kwargs:
+                        names = self._names = tuple(kwargs)
+                        break
+            entry = self._entries[self._index]
+            entry.timestamp = timestamp
+            entry.plugin = getattr(sender, "name", sender)
+            entry.kwargs = names
+            entry.receivers = receivers
+            entry.duration = duration
+            entry.failed = failed
+            self._index = (self._index + 1) % self.size
+            self.total += 1
+
+    def entries(self):
+        """
+        Returns copies of the stored sends, oldest first.
+
+        :return: list of :class:`SignalHistoryEntry`
+        """
+        with self._lock:
+            if self.total < self.size:
+                entries = self._entries[:self.total]
+            else:
+                entries = self._entries[self._index:] + self._entries[:self._index]
+            return [SignalHistoryEntry(entry.timestamp, entry.plugin, entry.kwargs, entry.receivers, entry.duration,
+                                       entry.failed) for entry in entries]
+
+    def clear(self):
+        """
+        Deletes all stored sends.
+        """
+        with self._lock:
+            for entry in self._entries:
+                entry.plugin = None
+                entry.kwargs = ()
+            self._index = 0
+            self.total = 0
+
+
+class SignalHistoryEntry(object):
+    """
+    A single send of a signal, stored by :class:`SignalHistory`.
+
+    Only the names of the keyword arguments are stored, so that the history does not keep sent objects alive.
+    """
+    __slots__ = ("timestamp", "plugin", "kwargs", "receivers", "duration", "failed")
+
+    def __init__(self, timestamp, plugin, kwargs, receivers, duration, failed=False):
+        #: Time of the send, as returned by time.time()
+        self.timestamp = timestamp
+        #: Name of the sending plugin
+        self.plugin = plugin
+        #: Tuple of the names of the keyword arguments
+        self.kwargs = kwargs
+        #: Amount of called receivers. -1, if unknown because of an exception.
+        self.receivers = receivers
+        #: Duration of the send in seconds
+        self.duration = duration
+        #: True, if a receiver has raised an exception
+        self.failed = failed
+
+    @property
+    def time(self):
+        """
+        Time of the send as readable string, e.g. 2017-05-01 12:30:01.123456
+        """
+        return datetime.datetime.fromtimestamp(self.timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+    def __repr__(self):
+        return "<SignalHistoryEntry %s from %s: %s receivers in %.6fs>" % (self.time, self.plugin, self.receivers,
+                                                                           self.duration)
+
+
+class QueueDispatcher(object):
+    """
+    Delivers the signals of all queues of an application by a single background thread.
+
+    The thread gets started with the first queued signal. Signals of the same queue get delivered in the order of
+    their sending. Signals of different queues get delivered alternately, so that a busy queue does not block
+    the others.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # Queues, which have items to deliver
+        self._ready = collections.deque()
+        self._thread = None
+        self._stopping = False
+        self._log = logging.getLogger(__name__)
+
+    def put(self, queue, sender, kwargs):
+        """
+        Puts a signal into the given queue. Handles the overflow policy of the queue.
+
+        :return: True, if the signal got queued. False, if it was dropped.
+        """
+        with self._condition:
+            if queue.closed:
+                return False
+            if len(queue._items) >= queue.maxsize:
+                if queue.overflow == OVERFLOW_DROP_NEWEST:
+                    queue.dropped += 1
+                    return False
+                elif queue.overflow == OVERFLOW_DROP_OLDEST:
+                    queue._items.popleft()
+                    queue.dropped += 1
+                elif threading.current_thread() is not self._thread:
+                    # A receiver must not wait for itself. So the dispatcher thread exceeds the queue size instead.
+                    while len(queue._items) >= queue.maxsize and not queue.closed:
+                        self._start()
+                        self._condition.wait()
+                    if queue.closed:
+                        return False
+            if not queue._items:
+                self._ready.append(queue)
+            queue._items.append((sender, kwargs))
+            queue.enqueued += 1
+            if len(queue._items) > queue.max_depth:
+                queue.max_depth = len(queue._items)
+            self._start()
+            self._condition.notify_all()
+        return True
+
+    def close(self, queue):
+        """
+        Drops all queued signals of the given queue and does not accept new ones.
+        Used, if a queued signal gets unregistered.
+        """
+        with self._condition:
+            queue.closed = True
+            queue.dropped += len(queue._items)
+            queue._items.clear()
+            if queue in self._ready:
+                self._ready.remove(queue)
+            self._condition.notify_all()
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops the background thread. It gets started again by the next queued signal.
+
+        :param wait: If True, waits until all queued signals are delivered
+        :param cancel_pending: If True, all queued signals get dropped
+        """
+        with self._condition:
+            if cancel_pending:
+                for queue in self._ready:
+                    queue.dropped += len(queue._items)
+                    queue._items.clear()
+                self._ready.clear()
+            self._stopping = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None and wait and thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self):
+        # Must be called with acquired condition
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="groundwork-signal-queue")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        queue = None
+        while True:
+            with self._condition:
+                if queue is not None:
+                    queue.delivered += 1
+                while not self._ready and not self._stopping:
+                    self._condition.wait()
+                if not self._ready:
+                    self._thread = None
+                    return
+                queue = self._ready.popleft()
+                sender, kwargs = queue._items.popleft()
+                if queue._items:
+                    self._ready.append(queue)
+                # Wakes up senders, which are waiting for space in the queue
+                self._condition.notify_all()
+            try:
+                queue.signal.deliver(sender, kwargs)
+            except Exception as e:
+                self._log.error("Queued signal %s could not be delivered: %s" % (queue.signal.name, e))
+
+
+def wait(answers, timeout=None):
+    """
+    Waits for the futures of threaded receivers inside the answers of :func:`SignalsApplication.send`.
+
+    Example::
+
+        answers = wait(my_app.signals.send("my_threaded_signal", my_plugin), timeout=5)
+
+    :param answers: list of tuples (function, return value or future)
+    :param timeout: Maximum amount of seconds to wait. None means no limit.
+    :return: list of tuples (function, return value). Exceptions of receivers get raised.
+    :raises concurrent.futures.TimeoutError: If not all receivers finished inside the given timeout
+    """
+    pending = [answer for function, answer in answers if isinstance(answer, futures.Future)]
+    done, not_done = futures.wait(pending, timeout)
+    if not_done:
+        raise futures.TimeoutError("%s of %s threaded receivers did not finish in %s seconds"
+                                   % (len(not_done), len(pending), timeout))
+    return [(function, answer.result() if isinstance(answer, futures.Future) else answer)
+            for function, answer in answers]
+
+
+def _hashable_identity(function):
+    # Same identity as blinker uses. Bound methods get recreated on each access, so their identity is built from
+    # the instance and the function.
+    if hasattr(function, '__func__'):
+        return id(function.__self__), id(function.__func__)
+    return id(function)
+
+
+class Receiver(object):
     """
     Subscriber class, which stores information for documentation purposes.
 
     :param name: Name of the Subscriber
     :type name: str
-    :param signal: Signal name(s)
+    :param signal: Signal name or a pattern, which matches multiple signal names. See :func:`is_pattern`.
     :type signal: str
-    :param namespace: Namespace of the signal. There is one per groundwork app.
     :param function: Callable function, which gets executed, if signal is sent.
     :param plugin: Plugin object, which registered the subscriber
     :type plugin: GwBasePattern
     :param description: Additional description about the subscriber.
     :type description: str
+    :param sender: If set, only signals from this sender will be send to ths receiver.
+    :param threaded: If True, the function gets executed by the thread pool of the application.
+    :type threaded: bool
+    :param batch_function: Function, which gets called with a list of payloads by send_many()
+    :param priority: Receivers with a higher priority get called first
+    :type priority: int
     """
-    def __init__(self, name, signal, function, plugin, namespace, description="", sender=None):
+    __slots__ = ("name", "plugin", "function", "description", "signal", "sender", "sender_id",
+                 "threaded", "batch_function", "priority", "pattern", "order")
+
+    # A single logger for all receivers. Receivers get created in large amounts.
+    __log = logging.getLogger(__name__)
+
+    def __init__(self, name, signal, function, plugin, description="", sender=None, threaded=False,
+                 batch_function=None, priority=0):
         self.name = name
         self.plugin = plugin
         self.function = function
         self.description = description
         self.signal = signal
-        self.__log = logging.getLogger(__name__)
-        self.namespace = namespace
         self.sender = sender
-        self.connect()
+        #: id of the sender or None. Used as key by the dispatchers, even if the sender of a weak receiver is gone.
+        self.sender_id = id(sender) if sender is not None else None
+        self.threaded = threaded
+        self.batch_function = batch_function
+        self.priority = priority
+        #: Compiled regular expression, if signal is a pattern. Otherwise None.
+        self.pattern = re.compile(fnmatch.translate(signal)) if is_pattern(signal) else None
+        #: Position in the connection order of all receivers of an application
+        self.order = 0
+        # The receiver gets connected by the dispatchers of its signals. Invalid receivers are stored, but never called.
+        if not hasattr(function, '__call__'):
+            self.__log.error("Given function object for signal %s is not a function" % signal)
+        elif not isinstance(signal, str):
+            self.__log.error("Given signal object is not a string.")
+
+
+class WeakReceiver(Receiver):
+    """
+    Receiver, which references its function, plugin, sender and batch function weakly only.
+
+    Bound methods are referenced by a weak reference to their object, so that a receiver does not keep
+    its plugin or any other object alive.
+    If one of the referenced objects gets garbage collected, on_dead gets called with the receiver.
+    The attributes of a gone object return None.
+
+    Same parameters as :class:`Receiver`, plus:
+
+    :param on_dead: Function, which gets called with the receiver, if a referenced object got garbage collected
+    """
+    __slots__ = ("_function_ref", "_plugin_ref", "_sender_ref", "_batch_function_ref", "_callback", "_on_dead",
+                 "__weakref__")
+
+    def __init__(self, name, signal, function, plugin, description="", sender=None, threaded=False,
+                 batch_function=None, priority=0, on_dead=None):
+        self._on_dead = on_dead
+        self._callback = functools.partial(_weak_receiver_died, weakref.ref(self))
+        super(WeakReceiver, self).__init__(name, signal, function, plugin, description, sender, threaded,
+                                           batch_function, priority)
+
+    def _set_function(self, function):
+        self._function_ref = _weak_reference(function, self._callback)
+
+    def _set_plugin(self, plugin):
+        self._plugin_ref = _weak_reference(plugin, self._callback)
+
+    def _set_sender(self, sender):
+        self._sender_ref = _weak_reference(sender, self._callback)
+
+    def _set_batch_function(self, batch_function):
+        self._batch_function_ref = _weak_reference(batch_function, self._callback)
+
+    function = property(lambda self: self._function_ref(), _set_function)
+    plugin = property(lambda self: self._plugin_ref(), _set_plugin)
+    sender = property(lambda self: self._sender_ref(), _set_sender)
+    batch_function = property(lambda self: self._batch_function_ref(), _set_batch_function)
+
+
+def _weak_receiver_died(receiver_reference, reference):
+    receiver = receiver_reference()
+    if receiver is not None and receiver._on_dead is not None:
+        receiver._on_dead(receiver)
+
+
+def _weak_reference(obj, callback):
+    # Returns a function, which returns the given object or None, if the object got garbage collected.
+    if obj is None:
+        return _none
+    if getattr(obj, "__self__", None) is not None and hasattr(obj, "__func__"):
+        # Bound methods get created on each attribute access. So the object and the function get referenced
+        # separately and the method gets bound again on each access.
+        instance = weakref.ref(obj.__self__, callback)
+        function = obj.__func__
+        return lambda: _bind(function, instance())
+    try:
+        return weakref.ref(obj, callback)
+    except TypeError:
+        # Some objects, like builtin functions, do not support weak references. They live forever anyway.
+        return lambda: obj
+
+
+def _bind(function, instance):
+    if instance is None:
+        return None
+    return types.MethodType(function, instance)
+
+
+def _none():
+    return None
+
+
+def is_pattern(signal):
+    """
+    Returns True, if the given signal name of a receiver is a pattern, which can match multiple signals.
+
+    Patterns use the shell-style wildcards of :mod:`fnmatch`:
+
+     * ``*`` matches everything, including dots. So "db.*" matches "db.insert" and "db.table.insert".
+     * ``?`` matches a single character
+     * ``[seq]`` matches any character in seq
+
+    :param signal: Signal name of a receiver
+    :return: True or False
+    """
+    return isinstance(signal, str) and any(character in signal for character in WILDCARD_CHARACTERS)
+
+
+class SignalPatternTrie(object):
+    """
+    Prefix trie of receivers, whose signal is a pattern.
+
+    The receivers are stored under the literal prefix of their pattern, which is the part before the first wildcard.
+    So :func:`match` only tests the patterns, whose prefix is also a prefix of the given signal name.
+    Matching is needed only, if a signal gets registered or unregistered. Sending a signal does not use the trie.
+    """
+    __slots__ = ("_root",)
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def add(self, receiver):
+        node = self._root
+        for character in _literal_prefix(receiver.signal):
+            child = node.children.get(character, None)
+            if child is None:
+                child = node.children[character] = _TrieNode()
+            node = child
+        node.receivers.append(receiver)
+
+    def remove(self, receiver):
+        """
+        Removes a receiver. Empty nodes get deleted.
+
+        :return: True, if the receiver was found
+        """
+        path = [self._root]
+        prefix = _literal_prefix(receiver.signal)
+        for character in prefix:
+            child = path[-1].children.get(character, None)
+            if child is None:
+                return False
+            path.append(child)
+        if receiver not in path[-1].receivers:
+            return False
+        path[-1].receivers.remove(receiver)
+        for index in range(len(prefix), 0, -1):
+            node = path[index]
+            if node.receivers or node.children:
+                break
+            del path[index - 1].children[prefix[index - 1]]
+        return True
+
+    def match(self, name):
+        """
+        Returns all receivers, whose pattern matches the given signal name.
+        """
+        matches = []
+        node = self._root
+        index = 0
+        while node is not None:
+            for receiver in node.receivers:
+                if receiver.pattern.match(name):
+                    matches.append(receiver)
+            if index == len(name):
+                break
+            node = node.children.get(name[index], None)
+            index += 1
+        return matches
+
+
+class _TrieNode(object):
+    __slots__ = ("children", "receivers")
+
+    def __init__(self):
+        self.children = {}
+        self.receivers = []
 
-    def connect(self):
-        if not hasattr(self.function, '__call__'):
-            self.__log.error("Given function object for signal %s is not a function" % self.signal)
-        else:
-            if isinstance(self.signal, str):
-                if self.sender is None:
-                    self.namespace.signal(self.signal).connect(self.function)
-                else:
-                    self.namespace.signal(self.signal).connect(self.function, sender=self.sender)
-            else:
-                self.__log.error("Given signal object is not a string.")
 
-    def disconnect(self):
-        self.namespace.signal(self.signal).disconnect(self.function)
+def _literal_prefix(pattern):
+    # Part of a pattern before the first wildcard
+    for index, character in enumerate(pattern):
+        if character in WILDCARD_CHARACTERS:
+            return pattern[:index]
+    return pattern
 
 
 class UnknownSignal(Exception):
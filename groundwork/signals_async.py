@@ -0,0 +1,109 @@
+"""
+Asynchronous sending of signals, based on asyncio.
+
+This module needs Python >= 3.5 and gets imported by :func:`groundwork.signals.SignalsApplication.send_async` on
+first usage only. So :mod:`groundwork.signals` is still usable on Python versions without asyncio support.
+"""
+import asyncio
+import inspect
+import time
+
+from groundwork.signals import STOP
+from groundwork.signals_stats import perf_counter
+
+
+async def send_async(receivers, sender, kwargs, max_concurrency=None, executor=None, threaded=False):
+    """
+    Calls all given receivers and awaits the results of coroutine functions and threaded receivers concurrently.
+
+    The receivers get called in their given order. Plain functions are called directly inside the running event loop.
+    So they should not block for a long time. Threaded receivers get executed by the given executor and their
+    results get awaited. If a plain function returns :data:`~groundwork.signals.STOP`, the following receivers are
+    not called. Coroutine functions and threaded receivers can not stop the signal, because their return values are
+    not known, before the following receivers get called. Same as :func:`groundwork.signals.SignalDispatcher.dispatch`.
+
+    If a receiver raises an exception, the exception is raised by this function.
+
+    :param receivers: List of :class:`~groundwork.signals.Receiver` objects
+    :param sender: Sender/plugin of the signal. Is given as first argument to each receiver function.
+    :param kwargs: dictionary of keyword arguments for the receiver functions
+    :param max_concurrency: Maximum amount of coroutine receivers, which are executed at the same time.
+                            None means no limit.
+    :param executor: :class:`~groundwork.signals.ReceiverExecutor` for threaded receivers. If None, threaded receivers
+                     get called directly.
+    :param threaded: If True, all receivers are handled as threaded receivers
+    :return: list of tuples (function, return value), same as :func:`groundwork.signals.SignalsApplication.send`
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1, got %s" % max_concurrency)
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+    async def limited(awaitable):
+        async with semaphore:
+            return await awaitable
+
+    answers = []
+    # Tuples (position in answers, awaitable)
+    pending = []
+    try:
+        for receiver in receivers:
+            function = receiver.function
+            if function is None:
+                continue
+            if (threaded or receiver.threaded) and executor is not None:
+                future = executor.submit(receiver, function, (sender,), kwargs)
+                pending.append((len(answers), asyncio.wrap_future(future)))
+                answers.append((function, future))
+                continue
+            result = function(sender, **kwargs)
+            if inspect.isawaitable(result):
+                pending.append((len(answers), limited(result) if semaphore is not None else result))
+            answers.append((function, result))
+            if result is STOP:
+                break
+    except BaseException:
+        # Coroutines of already called receivers do not get awaited anymore
+        for position, awaitable in pending:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+        raise
+
+    results = await asyncio.gather(*[awaitable for position, awaitable in pending])
+    for (position, awaitable), result in zip(pending, results):
+        answers[position] = (answers[position][0], result)
+    return answers
+
+
+async def completed(answers):
+    """
+    Returns the given answers. Used for signals, which are not delivered during the send (coalesced or queued).
+    """
+    return answers
+
+
+async def recorded(awaitable, signal, sender, kwargs, stats=None):
+    """
+    Awaits the given send and records it in the send history of the signal and in the given metrics.
+
+    :param awaitable: Awaitable of :func:`send_async`
+    :param signal: The sent signal
+    :type signal: groundwork.signals.Signal
+    :param sender: Sender/plugin of the signal
+    :param kwargs: Keyword arguments of the send
+    :param stats: :class:`~groundwork.signals_stats.SignalStatsCollector` or None, if no metrics shall be recorded
+    :return: list of tuples (function, return value)
+    """
+    timestamp = time.time()
+    start = perf_counter()
+    answers = None
+    try:
+        answers = await awaitable
+        return answers
+    finally:
+        duration = perf_counter() - start
+        failed = answers is None
+        if stats is not None:
+            stats.record_signal(signal.name, duration, failed)
+        if signal.history is not None:
+            signal.history.record(timestamp, sender, kwargs, len(answers) if not failed else -1, duration, failed)
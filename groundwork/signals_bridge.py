@@ -0,0 +1,464 @@
+"""
+Mirrors signals of a groundwork application to groundwork applications in other processes.
+
+The processes are connected as star: One process listens on a local address (a Unix domain socket or a named pipe
+on Windows), all other processes connect to it. The listening process delivers the signals of each connected
+process locally and forwards them to all other connected processes. No external broker is needed.
+
+Example::
+
+    from groundwork.signals_bridge import SignalBridge
+
+    # Main process
+    bridge = SignalBridge(my_app, ["cache_invalidate"])
+    bridge.listen("/tmp/my_app_signals.sock")
+
+    # Each worker process
+    bridge = SignalBridge(my_app, ["cache_invalidate"])
+    bridge.connect("/tmp/my_app_signals.sock")
+
+    # In any process: Receivers of all processes get called
+    my_app.signals.send("cache_invalidate", my_plugin, key="user_42")
+
+Two processes can also be connected by a pipe of :func:`multiprocessing.Pipe` via :func:`SignalBridge.attach`.
+
+Receivers of mirrored signals get a :class:`RemoteSender` as sender. So receivers, which were connected for a
+specific sender, are not called for signals of other processes.
+
+The keyword arguments of mirrored signals must be picklable. Received data gets unpickled, so only trusted processes
+must be able to connect. By default the authentication key of the current process is used, which is shared by
+all processes started via :mod:`multiprocessing`. Independent processes must use the same ``authkey``.
+"""
+import collections
+import logging
+import multiprocessing
+import pickle
+import socket
+import struct
+import threading
+import time
+import uuid
+from multiprocessing import connection as mp_connection
+
+#: Version of the frame format
+FRAME_VERSION = 1
+
+# A frame starts with the format version and the amount of messages.
+# Each message is the pickled tuple (origin, signal, kwargs) with a length prefix.
+_FRAME_HEADER = struct.Struct("!BH")
+_MESSAGE_LENGTH = struct.Struct("!I")
+
+
+def encode_frame(messages):
+    """
+    Packs already pickled messages into a single frame.
+
+    :param messages: list of bytes. At most 65535 messages.
+    :return: bytes
+    """
+    parts = [_FRAME_HEADER.pack(FRAME_VERSION, len(messages))]
+    for message in messages:
+        parts.append(_MESSAGE_LENGTH.pack(len(message)))
+        parts.append(message)
+    return b"".join(parts)
+
+
+def decode_frame(frame):
+    """
+    Unpacks a frame into its pickled messages.
+
+    :param frame: bytes, created by :func:`encode_frame`
+    :return: list of bytes
+    """
+    version, count = _FRAME_HEADER.unpack_from(frame, 0)
+    if version != FRAME_VERSION:
+        raise BridgeProtocolError("Unsupported frame version %s" % version)
+    messages = []
+    offset = _FRAME_HEADER.size
+    for index in range(count):
+        length, = _MESSAGE_LENGTH.unpack_from(frame, offset)
+        offset += _MESSAGE_LENGTH.size
+        messages.append(frame[offset:offset + length])
+        offset += length
+    if offset != len(frame):
+        raise BridgeProtocolError("Frame has %s unexpected bytes" % (len(frame) - offset))
+    return messages
+
+
+class SignalBridge(object):
+    """
+    Sends selected signals of an application to other processes and sends received signals locally.
+
+    Local sends get collected and sent in batches: A batch gets sent, if it contains batch_size signals or
+    batch_interval seconds have passed since its first signal.
+    If a connection gets lost, the bridge reconnects automatically. Signals, which were sent in the meantime, are
+    kept, up to max_pending signals per connection. Older signals get dropped.
+
+    :param app: groundwork application
+    :param signals: list of signal names, which shall be mirrored
+    :param authkey: Key for authentication of connections. Default is the authkey of the current process.
+    :type authkey: bytes
+    :param batch_size: Maximum amount of signals per batch
+    :param batch_interval: Maximum amount of seconds a signal waits for other signals of its batch
+    :param max_pending: Maximum amount of not yet sent signals per connection
+    :param reconnect_interval: Seconds to wait before the first reconnect. Doubled for each failed try.
+    :param max_reconnect_interval: Maximum amount of seconds between reconnects
+    """
+
+    def __init__(self, app, signals, authkey=None, batch_size=100, batch_interval=0.005, max_pending=10000,
+                 reconnect_interval=0.05, max_reconnect_interval=5.0):
+        if batch_size < 1 or batch_size > 65535:
+            raise ValueError("batch_size must be between 1 and 65535, got %s" % batch_size)
+        self.app = app
+        self.signals = list(signals)
+        self.authkey = authkey if authkey is not None else bytes(multiprocessing.current_process().authkey)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.max_pending = max_pending
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+
+        #: Unique id of this bridge. Used to detect own signals.
+        self.id = uuid.uuid4().hex
+
+        #: Amount of signals, which were sent to other processes. Counted once per signal, not per connection.
+        self.sent = 0
+        #: Amount of signals, which were received from other processes
+        self.received = 0
+        #: Amount of signals, which were dropped, because they were not picklable or too many were pending
+        self.dropped = 0
+
+        self._peers = []
+        self._listener = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._log = logging.getLogger(__name__)
+
+        for signal in self.signals:
+            self.app.signals.connect("signal_bridge_%s_%s" % (self.id, signal), signal,
+                                     _SignalForwarder(self, signal), self.app,
+                                     "Mirrors %s to other processes" % signal)
+
+    @property
+    def peers(self):
+        """
+        Amount of currently connected processes.
+        """
+        with self._lock:
+            return len([peer for peer in self._peers if peer.connected])
+
+    def listen(self, address, backlog=16):
+        """
+        Accepts connections of other processes on the given address.
+
+        :param address: Path of a Unix domain socket or name of a Windows named pipe (r'\\\\.\\pipe\\name')
+        :param backlog: Maximum amount of not yet accepted connections
+        """
+        self._listener = mp_connection.Listener(address, backlog=backlog, authkey=self.authkey)
+        thread = threading.Thread(target=self._accept, name="groundwork-signal-bridge-listener")
+        thread.daemon = True
+        thread.start()
+        self._log.info("Signal bridge listens on %s" % address)
+
+    def connect(self, address):
+        """
+        Connects to a listening bridge. The connection is established in background and reestablished
+        automatically, if it gets lost.
+
+        :param address: Address of the listening bridge
+        """
+        self._add_peer(_Peer(self, address=address))
+
+    def attach(self, connection):
+        """
+        Uses an already established connection, e.g. one end of :func:`multiprocessing.Pipe`.
+        A lost connection can not be reestablished.
+
+        :param connection: Connection object of :mod:`multiprocessing`
+        """
+        self._add_peer(_Peer(self, connection=connection))
+
+    def close(self, timeout=5):
+        """
+        Sends pending signals, closes all connections and disconnects the receivers of the mirrored signals.
+
+        :param timeout: Maximum amount of seconds to wait for each connection
+        """
+        with self._lock:
+            self._closed = True
+            peers = list(self._peers)
+        for signal in self.signals:
+            receiver = "signal_bridge_%s_%s" % (self.id, signal)
+            if self.app.signals.get_receiver(receiver) is not None:
+                self.app.signals.disconnect(receiver)
+        if self._listener is not None:
+            # A blocking accept() does not return on close. So we connect once to wake it up.
+            try:
+                mp_connection.Client(self._listener.address, authkey=self.authkey).close()
+            except (OSError, IOError, EOFError, mp_connection.AuthenticationError):
+                pass
+            try:
+                self._listener.close()
+            except (OSError, IOError):
+                pass
+        for peer in peers:
+            peer.close(timeout)
+
+    def _add_peer(self, peer):
+        with self._lock:
+            if self._closed:
+                raise BridgeClosedError("Signal bridge is closed")
+            self._peers.append(peer)
+        peer.start()
+
+    def _remove_peer(self, peer):
+        with self._lock:
+            if peer in self._peers:
+                self._peers.remove(peer)
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except (OSError, IOError, EOFError, mp_connection.AuthenticationError) as e:
+                if self._closed:
+                    return
+                self._log.warning("Signal bridge could not accept connection: %s" % e)
+                continue
+            try:
+                self._add_peer(_Peer(self, connection=connection))
+            except BridgeClosedError:
+                connection.close()
+                return
+
+    def _forward(self, signal, sender, kwargs):
+        # Called by the receivers of mirrored signals
+        if isinstance(sender, RemoteSender):
+            # Received from another process. Sending it back would create a loop.
+            return
+        try:
+            message = pickle.dumps((self.id, signal, kwargs), pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.dropped += 1
+            self._log.error("Signal %s can not be sent to other processes: %s" % (signal, e))
+            return
+        self.sent += 1
+        self._put(message)
+
+    def _put(self, message, exclude=None):
+        with self._lock:
+            peers = [peer for peer in self._peers if peer is not exclude]
+        for peer in peers:
+            peer.put(message)
+
+    def _receive(self, peer, message):
+        # Called by the reader thread of a connection for each received message
+        try:
+            origin, signal, kwargs = pickle.loads(message)
+        except Exception as e:
+            self.dropped += 1
+            self._log.error("Received signal can not be decoded: %s" % e)
+            return
+        if origin == self.id:
+            return
+        self.received += 1
+        # Listening bridges forward signals to all other connected processes
+        if self._listener is not None:
+            self._put(message, exclude=peer)
+        try:
+            self.app.signals.send(signal, RemoteSender(origin), **kwargs)
+        except Exception as e:
+            self._log.error("Received signal %s could not be sent: %s" % (signal, e))
+
+
+class _SignalForwarder(object):
+    # Receiver function for a mirrored signal. A class instead of a closure, so that it can be identified in logs.
+    __slots__ = ("bridge", "signal", "__name__", "__weakref__")
+
+    def __init__(self, bridge, signal):
+        self.bridge = bridge
+        self.signal = signal
+        self.__name__ = "signal_bridge_%s" % signal
+
+    def __call__(self, sender, **kwargs):
+        self.bridge._forward(self.signal, sender, kwargs)
+
+
+class RemoteSender(object):
+    """
+    Sender of signals, which were received from another process.
+
+    :param origin: Id of the bridge, which has sent the signal
+    """
+    __slots__ = ("origin", "name")
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.name = "remote:%s" % origin
+
+
+class _Peer(object):
+    """
+    A single connection of a bridge. Has a writer thread, which sends batches and (re)connects, and a reader thread
+    per established connection.
+    """
+
+    def __init__(self, bridge, connection=None, address=None):
+        self.bridge = bridge
+        self.address = address
+        self.connection = connection
+        self.pending = collections.deque()
+        self.closed = False
+        self._condition = threading.Condition()
+        self._writer = None
+        self._reader = None
+        self._log = bridge._log
+
+    @property
+    def connected(self):
+        return self.connection is not None
+
+    def start(self):
+        self._writer = threading.Thread(target=self._write, name="groundwork-signal-bridge-writer")
+        self._writer.daemon = True
+        self._writer.start()
+
+    def put(self, message):
+        with self._condition:
+            if self.closed:
+                return
+            if len(self.pending) >= self.bridge.max_pending:
+                self.pending.popleft()
+                self.bridge.dropped += 1
+            self.pending.append(message)
+            self._condition.notify_all()
+
+    def close(self, timeout=5):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join(timeout)
+        self._disconnect(self.connection)
+
+    def _write(self):
+        delay = self.bridge.reconnect_interval
+        try:
+            while True:
+                if self.connection is None:
+                    if self.address is None or self.closed:
+                        return
+                    if not self._connect():
+                        time.sleep(delay)
+                        delay = min(delay * 2, self.bridge.max_reconnect_interval)
+                        continue
+                    delay = self.bridge.reconnect_interval
+                if self._reader is None:
+                    self._start_reader(self.connection)
+
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                if not batch:
+                    continue
+                connection = self.connection
+                try:
+                    connection.send_bytes(encode_frame(batch))
+                except (OSError, IOError, EOFError, ValueError) as e:
+                    self._log.warning("Signal bridge lost connection: %s" % e)
+                    with self._condition:
+                        # Sent again after reconnect
+                        self.pending.extendleft(reversed(batch))
+                    self._disconnect(connection)
+        finally:
+            self.bridge._remove_peer(self)
+
+    def _connect(self):
+        try:
+            connection = mp_connection.Client(self.address, authkey=self.bridge.authkey)
+        except (OSError, IOError, EOFError, mp_connection.AuthenticationError) as e:
+            self._log.debug("Signal bridge could not connect to %s: %s" % (self.address, e))
+            return False
+        self.connection = connection
+        self._log.info("Signal bridge connected to %s" % self.address)
+        return True
+
+    def _disconnect(self, connection):
+        with self._condition:
+            if connection is not None and self.connection is connection:
+                self.connection = None
+                self._reader = None
+                self._condition.notify_all()
+        if connection is not None:
+            _shutdown(connection)
+            try:
+                connection.close()
+            except (OSError, IOError):
+                pass
+
+    def _next_batch(self):
+        # Waits for the first pending signal and collects more signals until the batch is full or batch_interval
+        # is over. Returns None, if the peer is closed and all signals are sent.
+        # Returns an empty list, if the connection got lost meanwhile.
+        bridge = self.bridge
+        with self._condition:
+            while not self.pending:
+                if self.closed:
+                    return None
+                if self.connection is None:
+                    return []
+                self._condition.wait(0.5)
+            deadline = time.time() + bridge.batch_interval
+            while len(self.pending) < bridge.batch_size and not self.closed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if self.connection is None:
+                return []
+            return [self.pending.popleft() for index in range(min(bridge.batch_size, len(self.pending)))]
+
+    def _start_reader(self, connection):
+        self._reader = threading.Thread(target=self._read, args=(connection,), name="groundwork-signal-bridge-reader")
+        self._reader.daemon = True
+        self._reader.start()
+
+    def _read(self, connection):
+        while True:
+            try:
+                frame = connection.recv_bytes()
+            except (OSError, IOError, EOFError):
+                break
+            try:
+                messages = decode_frame(frame)
+            except (BridgeProtocolError, struct.error) as e:
+                self._log.error("Signal bridge received invalid frame: %s" % e)
+                break
+            for message in messages:
+                self.bridge._receive(self, message)
+        if not self.closed:
+            self._log.info("Signal bridge connection closed by peer")
+        self._disconnect(connection)
+
+
+def _shutdown(connection):
+    # A blocking read of another thread does not return, if a connection gets closed. A shutdown of the socket wakes
+    # it up and informs the other side. Not possible for named pipes on Windows, which are closed directly.
+    try:
+        sock = socket.fromfd(connection.fileno(), socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError, IOError, ValueError):
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except (OSError, IOError):
+        pass
+    finally:
+        sock.close()
+
+
+class BridgeProtocolError(Exception):
+    pass
+
+
+class BridgeClosedError(Exception):
+    pass
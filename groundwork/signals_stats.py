@@ -0,0 +1,176 @@
+"""
+Dispatch metrics for signals and receivers.
+
+The metrics get collected only, if they were activated by :func:`groundwork.signals.SignalsApplication.enable_stats`
+or by the configuration parameter ``GROUNDWORK_SIGNALS_STATS = True``.
+
+Latencies are stored in histograms with logarithmic buckets. Bucket *n* counts all latencies between
+2^(n-1) and 2^n microseconds. So adding a value costs only a few integer operations and percentiles can be calculated
+at any time. A calculated percentile is the upper bound of its bucket, so it is at most twice the real value.
+"""
+import threading
+import time
+
+try:
+    perf_counter = time.perf_counter
+except AttributeError:
+    # Python 2
+    perf_counter = time.time
+
+#: Amount of histogram buckets. The last bucket counts all latencies above 2^38 microseconds (~76 hours).
+HISTOGRAM_BUCKETS = 40
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of latencies with logarithmic buckets.
+    """
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds, count=1):
+        """
+        Adds a latency.
+
+        :param seconds: latency in seconds
+        :param count: How often the latency shall be added
+        """
+        bucket = int(seconds * 1000000).bit_length()
+        if bucket >= HISTOGRAM_BUCKETS:
+            bucket = HISTOGRAM_BUCKETS - 1
+        self.buckets[bucket] += count
+        self.count += count
+        self.total += seconds * count
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        Returns the latency in seconds, which is higher than the given percentage of all added latencies.
+
+        :param percent: Percentage between 0 and 100. E.g. 99 for the 99th percentile.
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for bucket, amount in enumerate(self.buckets):
+            seen += amount
+            if amount and seen >= rank:
+                return min(2 ** bucket / 1000000.0, self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class DispatchStats(object):
+    """
+    Metrics of a single signal or receiver.
+
+    :param name: Name of the signal or receiver
+    """
+    __slots__ = ("name", "count", "exceptions", "latency")
+
+    def __init__(self, name):
+        self.name = name
+        #: Amount of sent signals or of receiver calls
+        self.count = 0
+        #: Amount of raised exceptions
+        self.exceptions = 0
+        #: Instance of :class:`LatencyHistogram`
+        self.latency = LatencyHistogram()
+
+    def as_dict(self):
+        """
+        Returns the metrics as dictionary. All times are in seconds.
+        """
+        return {"name": self.name,
+                "count": self.count,
+                "exceptions": self.exceptions,
+                "total_time": self.latency.total,
+                "mean_time": self.latency.mean,
+                "max_time": self.latency.max,
+                "p50": self.latency.percentile(50),
+                "p95": self.latency.percentile(95),
+                "p99": self.latency.percentile(99)}
+
+
+class SignalStatsCollector(object):
+    """
+    Collects the metrics of all signals and receivers of an application.
+    """
+
+    def __init__(self):
+        #: Dictionary of :class:`DispatchStats` with signal names as keys
+        self.signals = {}
+        #: Dictionary of :class:`DispatchStats` with receiver names as keys
+        self.receivers = {}
+        self._lock = threading.Lock()
+
+    def record_signal(self, name, seconds, failed=False, count=1):
+        """
+        Records the sending of a signal.
+
+        :param name: Name of the signal
+        :param seconds: Duration of the sending
+        :param failed: True, if an exception was raised
+        :param count: Amount of sent signals. If higher than 1, seconds is the duration per signal.
+        """
+        self._record(self.signals, name, seconds, failed, count)
+
+    def call(self, receiver, function, args, kwargs):
+        """
+        Calls the function of a receiver and records its duration and exceptions.
+        """
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            self._record(self.receivers, receiver.name, perf_counter() - start, True)
+            raise
+        self._record(self.receivers, receiver.name, perf_counter() - start, False)
+        return result
+
+    def _record(self, stats_dict, name, seconds, failed, count=1):
+        # Called for each receiver call. So LatencyHistogram.add() is inlined here.
+        bucket = int(seconds * 1000000).bit_length()
+        if bucket >= HISTOGRAM_BUCKETS:
+            bucket = HISTOGRAM_BUCKETS - 1
+        with self._lock:
+            stats = stats_dict.get(name, None)
+            if stats is None:
+                stats = stats_dict[name] = DispatchStats(name)
+            stats.count += count
+            if failed:
+                stats.exceptions += 1
+            latency = stats.latency
+            latency.buckets[bucket] += count
+            latency.count += count
+            latency.total += seconds * count
+            if seconds > latency.max:
+                latency.max = seconds
+
+    def get(self, stats_dict, name=None):
+        """
+        Returns the metrics of a single signal/receiver or of all of them as dictionary.
+        """
+        with self._lock:
+            if name is not None:
+                stats = stats_dict.get(name, None)
+                return stats.as_dict() if stats is not None else None
+            return dict((key, stats.as_dict()) for key, stats in stats_dict.items())
+
+    def reset(self):
+        """
+        Deletes all collected metrics.
+        """
+        with self._lock:
+            self.signals.clear()
+            self.receivers.clear()
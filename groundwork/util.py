@@ -1,3 +1,7 @@
+import importlib
+import sys
+
+
 def gw_get(object_dict, name=None, plugin=None):
     """
     Getter function to retrieve objects from a given object dictionary.
@@ -11,6 +15,9 @@ def gw_get(object_dict, name=None, plugin=None):
     :param plugin: plugin name, which registers the object
     :return: None, single object or dict of objects
     """
+    if isinstance(object_dict, Registry):
+        return object_dict.find(name, plugin)
+
     if plugin is not None:
         if name is None:
             object_list = {}
@@ -34,3 +41,183 @@ def gw_get(object_dict, name=None, plugin=None):
                 return object_dict[name]
             else:
                 return None
+
+
+class Registry(dict):
+    """
+    Dictionary for registered objects like signals, commands or documents.
+
+    The dictionary key is the registered name of an object. Each stored object must provide the attribute ``plugin``,
+    which is the plugin object, that has registered the object.
+
+    Beside the normal dictionary, the registry maintains a second index from plugins to their registered objects.
+    So all objects of a single plugin can be retrieved and removed, without looping over the objects of all
+    other plugins. This is mainly used during plugin deactivation.
+
+    The index uses the id of a plugin as key, so that the registry itself does not keep plugins alive.
+    Objects, which reference their plugin weakly (like :class:`~groundwork.signals.WeakReceiver`), must be removed
+    from the registry, before their plugin is gone. Patterns unregister all objects of a plugin during its
+    deactivation, which removes the plugin from the index too. As the id of a gone plugin can be reused by a new
+    object, :func:`find` returns only objects, whose plugin is the given plugin.
+
+    All mutating dictionary functions update the index. Changing the registry via functions of ``dict`` itself
+    (like ``dict.update(registry, ...)``) bypasses the index and must not be used.
+
+    Example::
+
+        registry = Registry()
+        registry["my_signal"] = Signal("my_signal", my_plugin)
+        registry.find(plugin=my_plugin)       # {"my_signal": <Signal>}
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(Registry, self).__init__()
+        self._plugin_index = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name, obj):
+        if name in self:
+            self._unindex(name, dict.__getitem__(self, name))
+        dict.__setitem__(self, name, obj)
+        self._plugin_index.setdefault(id(getattr(obj, "plugin", None)), {})[name] = obj
+
+    def __delitem__(self, name):
+        obj = dict.__getitem__(self, name)
+        dict.__delitem__(self, name)
+        self._unindex(name, obj)
+
+    def _unindex(self, name, obj):
+        key = id(getattr(obj, "plugin", None))
+        plugin_objects = self._plugin_index.get(key, None)
+        if plugin_objects is None or plugin_objects.get(name, None) is not obj:
+            # The plugin of a weakly referencing object may be gone already. So we must search for the object.
+            for key, plugin_objects in self._plugin_index.items():
+                if plugin_objects.get(name, None) is obj:
+                    break
+            else:
+                return
+        del plugin_objects[name]
+        if not plugin_objects:
+            del self._plugin_index[key]
+
+    def pop(self, name, *default):
+        if name not in self:
+            return dict.pop(self, name, *default)
+        obj = dict.__getitem__(self, name)
+        del self[name]
+        return obj
+
+    def popitem(self):
+        name, obj = dict.popitem(self)
+        self._unindex(name, obj)
+        return name, obj
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return dict.__getitem__(self, name)
+
+    def update(self, *args, **kwargs):
+        for name, obj in dict(*args, **kwargs).items():
+            self[name] = obj
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        registry = self.copy()
+        registry.update(other)
+        return registry
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        registry = self.__class__(other)
+        registry.update(self)
+        return registry
+
+    def copy(self):
+        return self.__class__(self)
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        # Pickle and copy.deepcopy rebuild the index via __init__
+        return self.__class__, (dict(self),)
+
+    @classmethod
+    def fromkeys(cls, names, value=None):
+        registry = cls()
+        for name in names:
+            registry[name] = value
+        return registry
+
+    def clear(self):
+        dict.clear(self)
+        self._plugin_index.clear()
+
+    def find(self, name=None, plugin=None):
+        """
+        Returns registered objects, which can be filtered by name and plugin.
+
+        Same behavior as :func:`gw_get`, but the objects of a plugin are taken from the plugin index.
+
+        :param name: name of the object
+        :type name: str
+        :param plugin: plugin object, which registers the object
+        :return: None, single object or dict of objects
+        """
+        if plugin is not None:
+            plugin_objects = self._plugin_index.get(id(plugin), {})
+            # Objects of a gone plugin, whose id got reused, are not returned.
+            # The result is a copy, so that the caller can unregister objects while iterating over it.
+            if name is None:
+                return dict((key, obj) for key, obj in plugin_objects.items()
+                            if getattr(obj, "plugin", None) is plugin)
+            obj = plugin_objects.get(name, None)
+            if obj is None or getattr(obj, "plugin", None) is not plugin:
+                return None
+            return obj
+        if name is None:
+            return self
+        return dict.get(self, name, None)
+
+
+def gw_lazy_attributes(module_name, attributes):
+    """
+    Creates the module level functions ``__getattr__`` and ``__dir__`` (PEP 562) for a package, which shall import
+    its content on first access only.
+
+    Used by packages like :mod:`groundwork.patterns`, so that heavy third party libraries (e.g. click or cookiecutter)
+    are not imported before a pattern or plugin really needs them.
+
+    On Python versions without support for module level ``__getattr__`` (< 3.7) all attributes get imported
+    immediately.
+
+    :param module_name: Name of the module/package, for which the functions are created
+    :type module_name: str
+    :param attributes: Dictionary with attribute names as keys and the name of the defining module as values
+    :type attributes: dict
+    :return: tuple of (__getattr__, __dir__)
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError("module %r has no attribute %r" % (module_name, name))
+        value = getattr(importlib.import_module(attributes[name]), name)
+        # Store the attribute on the module, so that __getattr__ does not get called again for it.
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(list(vars(module).keys()) + list(attributes.keys())))
+
+    if sys.version_info < (3, 7):
+        for attribute in attributes:
+            __getattr__(attribute)
+
+    return __getattr__, __dir__
@@ -78,7 +78,8 @@ setup(
     setup_requires=[],
     tests_require=['pytest', 'pytest-flake8'],
     # TODO 17-10-11-mh Future is missing here
-    install_requires=["pathlib", "click", "blinker", "jinja2", "cookiecutter", "docutils"],
+    install_requires=["pathlib", "click", "jinja2", "cookiecutter", "docutils",
+                      'futures; python_version < "3.2"'],
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Environment :: Console',
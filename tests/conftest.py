@@ -8,6 +8,15 @@ import sys
 sys.path.append("/".join([os.path.dirname(os.path.abspath(__file__)), ".."]))
 
 
+@pytest.fixture(autouse=True)
+def plugin_cache(tmpdir, monkeypatch):
+    """
+    Redirects the default plugin discovery cache into the temporary directory of the test,
+    so that no test reads or writes the cache in the home directory of the user.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir.join("cache_home")))
+
+
 @pytest.fixture
 def test_apps(monkeypatch):
     monkeypatch.syspath_prepend(
@@ -1,8 +1,11 @@
 import os
+import threading
+import time
 import pytest
 
 import groundwork
-from groundwork.exceptions import PluginRegistrationException
+from groundwork.exceptions import PluginRegistrationException, PluginNotActivatableException, \
+    PluginNotInitialisableException
 from groundwork.patterns import GwBasePattern
 from groundwork.patterns.gw_base_pattern import PluginAttributeMissing, PluginActivateMissing, PluginDeactivateMissing
 from groundwork.patterns.exceptions import PluginDependencyLoop
@@ -262,3 +265,380 @@ def test_plugin_dependency_loop(basicApp):
     assert my_plugin_b.active is False
     with pytest.raises(PluginDependencyLoop):
         my_plugin_a.activate()
+
+
+class FakeEntryPoint(object):
+    """
+    Simulates a pkg_resources entry point and counts its load() calls.
+    """
+    def __init__(self, name, obj=None, error=None):
+        self.name = name
+        self.obj = obj
+        self.error = error
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        if self.error is not None:
+            raise self.error
+        return self.obj
+
+
+def test_app_entry_point_classes_lazy(BasicPlugin):
+    """
+    This test case checks
+    - if plugin classes of entry points are listed without being loaded
+    - if the class gets loaded once, when the plugin gets activated
+    """
+    app = groundwork.App(strict=True)
+    entry_point = FakeEntryPoint("lazy_plugin", BasicPlugin)
+    app.plugins.classes.register_class(None, "LazyPlugin", entrypoint_name="lazy_plugin", entry_point=entry_point)
+
+    plugin_class = app.plugins.classes.get("LazyPlugin")
+    assert "LazyPlugin" in app.plugins.classes.get().keys()
+    assert plugin_class.loaded is False
+    assert entry_point.loads == 0
+
+    app.plugins.activate(["LazyPlugin"])
+    assert entry_point.loads == 1
+    assert plugin_class.loaded is True
+    assert plugin_class.clazz is BasicPlugin
+    assert app.plugins.get("LazyPlugin").active is True
+    assert entry_point.loads == 1
+
+
+def test_app_entry_point_classes_broken():
+    """
+    This test case checks
+    - if broken entry points are listed, but can not be activated
+    """
+    app = groundwork.App(strict=False)
+    app.plugins.classes.register_class(None, "BrokenPlugin", entry_point=FakeEntryPoint("broken",
+                                                                                        error=ImportError("broken")))
+    app.plugins.classes.register_class(None, "NoPlugin", entry_point=FakeEntryPoint("no_plugin", obj=object))
+
+    assert app.plugins.classes.exist("BrokenPlugin")
+    app.plugins.activate(["BrokenPlugin", "NoPlugin"])
+    assert app.plugins.get("BrokenPlugin") is None
+    assert app.plugins.get("NoPlugin") is None
+    assert app.plugins.classes.get("BrokenPlugin").clazz is None
+
+    app.strict = True
+    with pytest.raises(Exception):
+        app.plugins.activate(["BrokenPlugin"])
+
+
+def _create_dependency_plugin_class(plugin_name, needed_plugins, activations=None, delay=0, error=None,
+                                    barrier=None):
+    class DependencyPlugin(GwBasePattern):
+        def __init__(self, app, **kwargs):
+            self.name = plugin_name
+            self.needed_plugins = needed_plugins
+            super(DependencyPlugin, self).__init__(app, **kwargs)
+
+        def activate(self):
+            if delay:
+                time.sleep(delay)
+            if barrier is not None:
+                barrier.wait()
+            if error is not None:
+                raise error
+            if activations is not None:
+                activations.append(self.name)
+
+        def deactivate(self):
+            pass
+
+    DependencyPlugin.__name__ = plugin_name
+    return DependencyPlugin
+
+
+def test_plugin_dependency_order():
+    """
+    This test case checks
+    - if needed plugins get initialised and activated in front of the plugins, which need them
+    - if each plugin gets activated once only
+    """
+    activations = []
+    dependencies = {
+        "plugin_a": ("plugin_b", "plugin_c"),
+        "plugin_b": ("plugin_d",),
+        "plugin_c": ("plugin_d", "plugin_b"),
+        "plugin_d": (),
+        "plugin_e": ("plugin_a",),
+    }
+    classes = [_create_dependency_plugin_class(name, needed, activations) for name, needed in dependencies.items()]
+    app = groundwork.App(plugins=classes, strict=True)
+    app.plugins.activate(["plugin_e", "plugin_c"])
+
+    assert sorted(activations) == sorted(dependencies.keys())
+    for name, needed_plugins in dependencies.items():
+        for needed_plugin in needed_plugins:
+            assert activations.index(needed_plugin) < activations.index(name)
+
+
+def test_plugin_dependency_chain():
+    activations = []
+    amount = 300
+    classes = [_create_dependency_plugin_class("plugin_%s" % i, ("plugin_%s" % (i + 1),) if i < amount - 1 else (),
+                                               activations) for i in range(amount)]
+    app = groundwork.App(plugins=classes, strict=True)
+    app.plugins.activate(["plugin_0"])
+    assert activations == ["plugin_%s" % i for i in reversed(range(amount))]
+
+
+def test_plugin_dependency_loop_via_manager():
+    activations = []
+    classes = [_create_dependency_plugin_class("plugin_a", ("plugin_b",), activations),
+               _create_dependency_plugin_class("plugin_b", ("plugin_c",), activations),
+               _create_dependency_plugin_class("plugin_c", ("plugin_a",), activations)]
+    app = groundwork.App(plugins=classes, strict=True)
+    with pytest.raises(PluginDependencyLoop):
+        app.plugins.activate(["plugin_a"])
+    assert activations == []
+
+    app.strict = False
+    app.plugins.activate(["plugin_a"])
+    assert activations == ["plugin_c", "plugin_b", "plugin_a"]
+
+
+def test_plugin_parallel_activation():
+    """
+    This test case checks
+    - if independent plugins get activated in parallel
+    - if activation signals are sent in a deterministic order
+    """
+    # All plugins of the first level wait for each other. So they can only be activated, if they run in parallel.
+    barrier = threading.Barrier(4, timeout=5)
+    classes = [_create_dependency_plugin_class("slow_%s" % i, (), barrier=barrier) for i in range(4)]
+    classes.append(_create_dependency_plugin_class("slow_top", ("slow_0", "slow_1", "slow_2", "slow_3")))
+    app = groundwork.App(plugins=classes, strict=True)
+
+    signals = []
+    for signal in ["plugin_activate_pre", "plugin_activate_post"]:
+        app.signals.connect("%s_recorder" % signal, signal,
+                            lambda plugin, signal=signal, **kwargs: signals.append((signal, plugin.name)), app)
+
+    app.plugins.activate(["slow_top", "slow_3", "slow_2"], workers=4)
+
+    for plugin in app.plugins.get().values():
+        assert plugin.active is True
+    level_0 = ["slow_0", "slow_1", "slow_2", "slow_3"]
+    assert signals == [("plugin_activate_pre", name) for name in level_0] + \
+        [("plugin_activate_post", name) for name in level_0] + \
+        [("plugin_activate_pre", "slow_top"), ("plugin_activate_post", "slow_top")]
+
+
+def test_plugin_parallel_activation_errors(tmpdir):
+    """
+    This test case checks
+    - if errors of all plugins of a level get reported together
+    - if plugins, which need failed plugins, do not get activated
+    - if GROUNDWORK_ACTIVATION_WORKERS gets used
+    """
+    config = tmpdir.join("config.py")
+    config.write("GROUNDWORK_ACTIVATION_WORKERS = 3\n")
+
+    def create_classes():
+        return [_create_dependency_plugin_class("fail_a", (), delay=0.01, error=ValueError("error a")),
+                _create_dependency_plugin_class("fail_b", (), delay=0.01, error=ValueError("error b")),
+                _create_dependency_plugin_class("ok", (), delay=0.01),
+                _create_dependency_plugin_class("needs_fail", ("fail_a",), delay=0.01)]
+
+    app = groundwork.App([str(config)], plugins=create_classes(), strict=True)
+    with pytest.raises(PluginNotActivatableException) as excinfo:
+        app.plugins.activate(["fail_a", "fail_b", "ok", "needs_fail"])
+    assert "error a" in str(excinfo.value)
+    assert "error b" in str(excinfo.value)
+    assert app.plugins.get("ok").active is True
+    assert app.plugins.get("needs_fail") is None or app.plugins.get("needs_fail").active is False
+
+    app = groundwork.App([str(config)], plugins=create_classes(), strict=False)
+    app.plugins.activate(["fail_a", "fail_b", "ok", "needs_fail"])
+    assert app.plugins.get("ok").active is True
+    assert app.plugins.get("fail_a").active is False
+    assert app.plugins.get("needs_fail").active is False
+
+
+def test_plugin_parallel_activation_already_active():
+    """
+    This test case checks, if a strict parallel activation fails for already activated plugins, before any plugin
+    of the same level gets its plugin_activate_pre signal.
+    """
+    classes = [_create_dependency_plugin_class(name, ()) for name in ["first", "second", "third"]]
+    app = groundwork.App(plugins=classes, strict=True)
+    app.plugins.activate(["second"])
+
+    signals = []
+    app.signals.connect("activation_recorder", "plugin_activate_pre",
+                        lambda plugin, **kwargs: signals.append(plugin.name), app)
+    with pytest.raises(PluginNotInitialisableException):
+        app.plugins.activate(["first", "second", "third"], workers=2)
+    assert signals == []
+    assert app.plugins.get("first").active is False
+    assert app.plugins.get("third").active is False
+
+    app.strict = False
+    app.plugins.activate(["first", "second", "third"], workers=2)
+    assert signals == ["first", "third"]
+    assert app.plugins.get("first").active is True
+    assert app.plugins.get("third").active is True
+
+
+def test_plugin_activation_injection(basicApp):
+    """
+    This test case checks
+    - if attribute access is not intercepted anymore
+    - if activation signals are sent once, even if a plugin calls the activation routine of its parent class
+    """
+    class ParentPlugin(GwBasePattern):
+        def __init__(self, app, **kwargs):
+            self.name = "parent_plugin"
+            super(ParentPlugin, self).__init__(app, **kwargs)
+
+        def activate(self):
+            self.parent_activated = True
+
+        def deactivate(self):
+            pass
+
+    class ChildPlugin(ParentPlugin):
+        def __init__(self, app, **kwargs):
+            super(ChildPlugin, self).__init__(app, **kwargs)
+            self.name = "child_plugin"
+
+        def activate(self):
+            super(ChildPlugin, self).activate()
+
+    assert GwBasePattern.__getattribute__ is object.__getattribute__
+
+    signals = []
+    basicApp.signals.connect("activation_recorder", "plugin_activate_pre",
+                             lambda plugin, **kwargs: signals.append(plugin.name), basicApp)
+
+    plugin = ChildPlugin(basicApp)
+    assert plugin.activate.__name__ == "activate"
+    plugin.activate()
+    assert plugin.active is True
+    assert plugin.parent_activated is True
+    assert signals == ["child_plugin"]
+
+    plugin.deactivate()
+    assert plugin.active is False
+
+
+def test_plugin_parallel_activation_injection():
+    """
+    This test case checks, if activation signals are sent once during a parallel activation,
+    even if a plugin calls the activation routine of its parent class.
+    """
+    class ParentPlugin(GwBasePattern):
+        def activate(self):
+            self.parent_activated = True
+
+        def deactivate(self):
+            pass
+
+    def create_child_class(plugin_name):
+        class ChildPlugin(ParentPlugin):
+            def __init__(self, app, **kwargs):
+                self.name = plugin_name
+                super(ChildPlugin, self).__init__(app, **kwargs)
+
+            def activate(self):
+                super(ChildPlugin, self).activate()
+
+        ChildPlugin.__name__ = plugin_name
+        return ChildPlugin
+
+    app = groundwork.App(plugins=[create_child_class("child_a"), create_child_class("child_b")], strict=True)
+    signals = []
+    for signal in ["plugin_activate_pre", "plugin_activate_post"]:
+        app.signals.connect("%s_recorder" % signal, signal,
+                            lambda plugin, signal=signal, **kwargs: signals.append((signal, plugin.name)), app)
+
+    app.plugins.activate(["child_a", "child_b"], workers=2)
+    assert signals == [("plugin_activate_pre", "child_a"), ("plugin_activate_pre", "child_b"),
+                       ("plugin_activate_post", "child_a"), ("plugin_activate_post", "child_b")]
+    for plugin in app.plugins.get().values():
+        assert plugin.active is True
+        assert plugin.parent_activated is True
+        assert plugin._activate_running is False
+
+
+def test_plugin_parallel_activation_nested():
+    """
+    This test case checks, if plugins, which get activated in parallel, can activate other plugins inside their
+    activation routine without a deadlock. Via the plugin manager and via the activation routine of a plugin,
+    which needs other plugins.
+    """
+    activations = []
+
+    def create_activating_class(plugin_name, activate):
+        class ActivatingPlugin(GwBasePattern):
+            def __init__(self, app, **kwargs):
+                self.name = plugin_name
+                super(ActivatingPlugin, self).__init__(app, **kwargs)
+
+            def activate(self):
+                activate(self.app)
+                activations.append(self.name)
+
+            def deactivate(self):
+                pass
+
+        ActivatingPlugin.__name__ = plugin_name
+        return ActivatingPlugin
+
+    classes = [create_activating_class("by_manager", lambda app: app.plugins.activate(["nested_a"])),
+               create_activating_class("by_plugin", lambda app: app.plugins.get("nested_c").activate()),
+               _create_dependency_plugin_class("nested_a", ("nested_b",), activations),
+               _create_dependency_plugin_class("nested_b", (), activations),
+               _create_dependency_plugin_class("nested_c", ("nested_d",), activations),
+               _create_dependency_plugin_class("nested_d", (), activations)]
+    app = groundwork.App(plugins=classes, strict=True)
+    app.plugins.initialise_by_names(["nested_c"])
+
+    errors = []
+
+    def activate():
+        try:
+            app.plugins.activate(["by_manager", "by_plugin"], workers=2)
+        except Exception as e:
+            errors.append(e)
+
+    activation = threading.Thread(target=activate)
+    activation.daemon = True
+    activation.start()
+    activation.join(10)
+    assert not activation.is_alive(), "Parallel activation is deadlocked"
+    assert errors == []
+    for name in ["by_manager", "by_plugin", "nested_a", "nested_b", "nested_c", "nested_d"]:
+        assert app.plugins.get(name).active is True
+    assert activations.index("nested_b") < activations.index("nested_a") < activations.index("by_manager")
+    assert activations.index("nested_d") < activations.index("nested_c") < activations.index("by_plugin")
+
+
+def test_registry_records_are_slotted(basicApp):
+    """
+    Records of the application registries are created in large amounts and must not have a __dict__.
+    """
+    from groundwork.signals import Signal, Receiver
+    from groundwork.pluginmanager import PluginClass
+    from groundwork.patterns.gw_commands_pattern import Command
+    from groundwork.patterns.gw_documents_pattern import Document
+    from groundwork.patterns.gw_threads_pattern import Thread
+    from groundwork.patterns.gw_shared_objects_pattern import SharedObject
+    from groundwork.patterns.gw_recipes_pattern import Recipe
+
+    plugin = basicApp.plugins.get("BasicPlugin")
+    records = [Signal("slotted_signal", plugin),
+               Receiver("slotted_receiver", "slotted_signal", lambda plugin, **kwargs: None, plugin),
+               Command("slotted_command", "", [], lambda: None, plugin),
+               Document("slotted_document", "", plugin),
+               Thread("slotted_thread", lambda plugin: None, plugin),
+               SharedObject("slotted_shared_object", "", None, plugin),
+               Recipe("slotted_recipe", os.path.abspath("."), plugin),
+               PluginClass("slotted_plugin_class", GwBasePattern, None, None, None, None)]
+    for record in records:
+        assert not hasattr(record, "__dict__"), record
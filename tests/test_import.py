@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Libraries, which must not be imported by a plain "import groundwork"
+HEAVY_MODULES = ["click", "jinja2", "docutils", "cookiecutter", "pkg_resources"]
+
+
+def test_import_is_lazy():
+    """
+    This test case checks
+    - if "import groundwork" does not import heavy third party libraries
+    - if the built-in patterns and plugins are not imported during "import groundwork"
+    """
+    code = "import sys; import groundwork; print(','.join(m for m in %r if m in sys.modules))" % (
+        HEAVY_MODULES + ["groundwork.plugins.gw_documents_info", "groundwork.patterns.gw_recipes_pattern"])
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+    assert output.decode("utf-8").strip() == ""
+
+
+def test_lazy_attributes():
+    import groundwork.patterns
+    import groundwork.plugins
+    from groundwork.patterns import GwCommandsPattern
+    from groundwork.plugins import GwDocumentsInfo
+    from groundwork.patterns.gw_commands_pattern import GwCommandsPattern as GwCommandsPatternDirect
+
+    assert GwCommandsPattern is GwCommandsPatternDirect
+    assert issubclass(GwDocumentsInfo, GwCommandsPattern)
+    assert "GwRecipesBuilder" in dir(groundwork.plugins)
+    assert "GwThreadsPattern" in dir(groundwork.patterns)
+    with pytest.raises(AttributeError):
+        groundwork.plugins.NotExistingPlugin
@@ -0,0 +1,87 @@
+import json
+import os
+
+import groundwork
+from groundwork import plugin_discovery
+
+
+def _create_app(tmpdir, cache_value):
+    config = tmpdir.join("config.py")
+    config.write("GROUNDWORK_PLUGIN_CACHE = %r\n" % cache_value)
+    return groundwork.App([str(config)], strict=True)
+
+
+def test_discovery_cache(tmpdir, monkeypatch):
+    """
+    This test case checks
+    - if the first app start scans the distributions and writes the cache
+    - if the second app start uses the cache and does not scan anything
+    """
+    cache_path = str(tmpdir.join("cache", "plugin_cache.json"))
+    app = _create_app(tmpdir, cache_path)
+    assert os.path.exists(cache_path)
+    classes = app.plugins.classes.get()
+
+    with open(cache_path) as cache_file:
+        cache = json.load(cache_file)
+    assert cache["version"] == plugin_discovery.CACHE_VERSION
+    assert len(cache["environments"]) == 1
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("Distributions must not be scanned, if the cache is valid")
+
+    monkeypatch.setattr(plugin_discovery, "scan_entry_points", no_scan)
+    app2 = _create_app(tmpdir, cache_path)
+    classes2 = app2.plugins.classes.get()
+    assert sorted(classes.keys()) == sorted(classes2.keys())
+    for name in classes.keys():
+        assert classes[name].entrypoint_name == classes2[name].entrypoint_name
+        assert classes[name].distribution == classes2[name].distribution
+        assert classes[name].clazz is classes2[name].clazz
+
+
+def test_discovery_cache_invalidation(tmpdir, monkeypatch):
+    """
+    This test case checks
+    - if a change of sys.path leads to a new scan
+    """
+    cache_path = str(tmpdir.join("plugin_cache.json"))
+    _create_app(tmpdir, cache_path)
+
+    scans = []
+
+    def counting_scan(*args, **kwargs):
+        scans.append(1)
+        return []
+
+    monkeypatch.setattr(plugin_discovery, "scan_entry_points", counting_scan)
+    monkeypatch.syspath_prepend(str(tmpdir))
+    app = _create_app(tmpdir, cache_path)
+    assert len(scans) == 1
+    assert len(app.plugins.classes.get()) == 0
+
+
+def test_discovery_cache_deactivated(tmpdir):
+    app = _create_app(tmpdir, False)
+    assert plugin_discovery.get_cache_path(False) is None
+    assert app.plugins.classes.get() is not None
+    assert tmpdir.listdir() == [tmpdir.join("config.py")]
+
+
+def test_entry_point_reference():
+    reference = plugin_discovery.EntryPointReference.from_value(
+        "gw_plugins_info", "groundwork.plugins.gw_plugins_info:GwPluginsInfo [extra]")
+    assert reference.module == "groundwork.plugins.gw_plugins_info"
+    assert reference.attrs == ("GwPluginsInfo",)
+    from groundwork.plugins import GwPluginsInfo
+    assert reference.load() is GwPluginsInfo
+
+
+def test_discovery_cache_default_path(tmpdir):
+    """
+    This test case checks, if an app with default settings writes its cache below $XDG_CACHE_HOME,
+    which the plugin_cache fixture points into the temporary directory of the test.
+    """
+    groundwork.App(strict=True)
+    assert os.path.exists(str(tmpdir.join("cache_home", "groundwork", "plugin_cache.json")))
+    assert plugin_discovery.get_cache_path().startswith(str(tmpdir))
@@ -29,3 +29,36 @@ def test_plugin_list_receivers(emptyApp):
     plugin.activate()
     runner = CliRunner()
     runner.invoke(app.commands.get("receiver_list").click_command)
+
+
+def test_plugin_signal_stats(emptyApp):
+    app = emptyApp
+    plugin = GwSignalsInfo(app)
+    plugin.activate()
+    app.signals.enable_stats()
+    plugin.signals.register("stats_signal", "signal for stats")
+    plugin.signals.connect("stats_receiver", "stats_signal", lambda plugin, **kwargs: None, "receiver for stats")
+    plugin.signals.send("stats_signal")
+    runner = CliRunner()
+    result = runner.invoke(app.commands.get("signal_stats").click_command)
+    assert "stats_signal" in result.output
+    assert "stats_receiver" in result.output
+
+
+def test_plugin_signal_history(emptyApp):
+    app = emptyApp
+    plugin = GwSignalsInfo(app)
+    plugin.activate()
+    runner = CliRunner()
+    result = runner.invoke(app.commands.get("signal_history").click_command)
+    assert "No signal stores a send history" in result.output
+
+    plugin.signals.register("history_signal", "signal with history", history=10)
+    plugin.signals.send("history_signal", my_argument=1)
+    result = runner.invoke(app.commands.get("signal_history").click_command)
+    assert "history_signal (last 1 of 1 sends)" in result.output
+    assert "my_argument" in result.output
+
+    from jinja2 import Environment
+    output = Environment().from_string(app.documents.get("signals_overview").content).render(app=app)
+    assert "Send history (last 1 of 1 sends)" in output
@@ -0,0 +1,72 @@
+import threading
+import time
+
+from groundwork.scheduler import Scheduler, ScheduledCall
+
+
+def test_scheduler():
+    scheduler = Scheduler()
+    calls = []
+    done = threading.Event()
+
+    def call(name):
+        calls.append(name)
+        if name == "last":
+            done.set()
+
+    scheduler.schedule(0.1, call, args=("last",))
+    scheduler.schedule(0.05, call, args=("second",))
+    scheduler.schedule(0, call, kwargs={"name": "first"})
+    cancelled = scheduler.schedule(0.02, call, args=("cancelled",))
+    assert scheduler.cancel(cancelled)
+    assert not scheduler.cancel(cancelled)
+    assert cancelled.state == ScheduledCall.CANCELLED
+    assert done.wait(5)
+    assert calls == ["first", "second", "last"]
+    assert len(scheduler) == 0
+
+    # Failing calls do not stop the scheduler
+    scheduler.schedule(0, lambda: 1 / 0)
+    done.clear()
+    scheduler.schedule(0.01, call, args=("last",))
+    assert done.wait(5)
+
+    # Many cancelled calls do not stay in the queue
+    pending = [scheduler.schedule(60, call, args=(number,)) for number in range(1000)]
+    for scheduled_call in pending[:900]:
+        scheduler.cancel(scheduled_call)
+    assert len(scheduler) == 100
+    assert len(scheduler._queue) < 1000
+
+    scheduler.shutdown()
+    assert len(scheduler) == 0
+    assert all(scheduled_call.cancelled for scheduled_call in pending)
+    time.sleep(0.05)
+    assert calls == ["first", "second", "last", "last"]
+
+    # Restarts after a shutdown
+    done.clear()
+    scheduler.schedule(0, call, args=("last",))
+    assert done.wait(5)
+    scheduler.shutdown()
+
+
+def test_cron_expression():
+    import datetime
+    import pytest
+    from groundwork.scheduler import CronExpression
+
+    saturday = datetime.datetime(2026, 10, 17, 12, 3, 30)
+    assert CronExpression("*/15 8-18 * * 1-5").next(saturday) == datetime.datetime(2026, 10, 19, 8, 0)
+    assert CronExpression("* * * * *").next(saturday) == datetime.datetime(2026, 10, 17, 12, 4)
+    assert CronExpression("@hourly").next(saturday) == datetime.datetime(2026, 10, 17, 13, 0)
+    assert CronExpression("0 0 29 2 *").next(saturday) == datetime.datetime(2028, 2, 29, 0, 0)
+    # Day of month or day of week
+    assert CronExpression("30 6 1 * 7").next(saturday) == datetime.datetime(2026, 10, 18, 6, 30)
+    assert CronExpression("5/20,1 * * * *").minutes == set([1, 5, 25, 45])
+
+    for expression in ["* * * *", "60 * * * *", "a * * * *", "*/0 * * * *", "5-1 * * * *"]:
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+    with pytest.raises(ValueError):
+        CronExpression("0 0 31 2 *").next(saturday)
@@ -89,7 +89,6 @@ def test_multi_plugin_deactivations(basicApp, EmptyPlugin):
 
 
 def test_signal_handling(basicApp, EmptyPlugin):
-    from blinker import NamedSignal
     from groundwork.signals import UnknownSignal
 
     def sig_reg_test(plugin, **kwargs):
@@ -97,18 +96,15 @@ def test_signal_handling(basicApp, EmptyPlugin):
 
     plugin1 = EmptyPlugin(app=basicApp, name="EmptyPlugin")
 
-    # This creates a gw receiver and a blinker internal signal called "test"
+    # This creates a gw receiver and an internal dispatcher for the signal "sig_reg_test"
     plugin1.signals.connect("sig_reg_receiver", "sig_reg_test", sig_reg_test, "receiver sig_reg for test")
 
-    # Check the blinker internal registration
-    signal_namespace = basicApp.signals._namespace
-    assert "sig_reg_test" in signal_namespace.keys()
-    test_signal = signal_namespace["sig_reg_test"]
-    assert isinstance(test_signal, NamedSignal)
+    # Check the internal registration
+    assert len(basicApp.signals._dispatchers["sig_reg_test"]) == 1
 
     # Check the gw registration
     plugin_signals = plugin1.signals.get()
-    # This must be 0, because gw has not registered a signal, this was done in blinker only
+    # This must be 0, because gw has not registered a signal, the receiver is only known by the dispatcher
     assert len(plugin_signals) == 0
 
     app_signals = basicApp.signals.get()
@@ -177,11 +173,6 @@ def test_multi_plugin_sending(basicApp, EmptyPlugin):
 
     Registers receivers before the signal gets registers itself and afterwards.
     Checks if all receivers get correctly called, if signal is send.
-
-    This tests will normally fail, if Weaknamespace is used in groundwork/signals.py:
-    from blinker import WeakNamespace as Namespace
-
-    So use always Namespace and if need do clean ups on groundwork site.
     """
 
     amount_pre_plugins = 30
@@ -220,12 +211,12 @@ def test_multi_plugin_sending(basicApp, EmptyPlugin):
         if i == 0:
             # We only need to register our signal once
             plugin_send[0].signals.register("signal_test", "signal_test")
-            assert amount_pre_plugins == len(basicApp.signals.signals["signal_test"]._signal.receivers)
+            assert amount_pre_plugins == len(basicApp.signals.signals["signal_test"]._dispatcher)
 
     # Check, if for our signal all receivers have been registered
     print("Registered receivers for signal_test: {0}".format(
-        len(basicApp.signals.signals["signal_test"]._signal.receivers)))
-    assert amount_pre_plugins == len(basicApp.signals.signals["signal_test"]._signal.receivers)
+        len(basicApp.signals.signals["signal_test"]._dispatcher)))
+    assert amount_pre_plugins == len(basicApp.signals.signals["signal_test"]._dispatcher)
 
     # Send signal
     for index, plugin in enumerate(plugin_send):
@@ -266,3 +257,751 @@ def test_multi_plugin_sending(basicApp, EmptyPlugin):
                     found = True
                     break
             assert found is True
+
+
+def test_signal_dispatch_cache(basicApp, EmptyPlugin):
+    """
+    Checks the cached receiver resolution: connection order, sender filtering and cache invalidation.
+    """
+    plugin = EmptyPlugin(app=basicApp, name="DispatchPlugin")
+    plugin.activate()
+    other_sender = EmptyPlugin(app=basicApp, name="OtherSender")
+    plugin.signals.register("dispatch_signal", "dispatch test signal")
+
+    def receiver_a(plugin, **kwargs):
+        return "a"
+
+    def receiver_b(plugin, **kwargs):
+        return "b"
+
+    def receiver_c(plugin, **kwargs):
+        return "c"
+
+    plugin.signals.connect("receiver_a", "dispatch_signal", receiver_a, "receiver a")
+    plugin.signals.connect("receiver_b", "dispatch_signal", receiver_b, "receiver b", sender=plugin)
+    plugin.signals.connect("receiver_c", "dispatch_signal", receiver_c, "receiver c")
+    # Same function twice: blinker calls it only once, so we do it too.
+    plugin.signals.connect("receiver_a2", "dispatch_signal", receiver_a, "receiver a again")
+
+    assert [answer[1] for answer in plugin.signals.send("dispatch_signal")] == ["a", "b", "c"]
+    assert [answer[1] for answer in basicApp.signals.send("dispatch_signal", other_sender)] == ["a", "c"]
+
+    # The cache must be invalidated on disconnect
+    plugin.signals.disconnect("receiver_c")
+    assert [answer[1] for answer in plugin.signals.send("dispatch_signal")] == ["a", "b"]
+
+    # ... and on connect
+    plugin.signals.connect("receiver_c", "dispatch_signal", receiver_c, "receiver c", sender=other_sender)
+    assert [answer[1] for answer in plugin.signals.send("dispatch_signal")] == ["a", "b"]
+    assert [answer[1] for answer in basicApp.signals.send("dispatch_signal", other_sender)] == ["a", "c"]
+
+    # Receivers stay connected, if their signal gets registered again
+    plugin.signals.unregister("dispatch_signal")
+    plugin.signals.register("dispatch_signal", "dispatch test signal")
+    assert [answer[1] for answer in plugin.signals.send("dispatch_signal")] == ["a", "b"]
+
+    plugin.deactivate()
+    assert "dispatch_signal" not in basicApp.signals._dispatchers
+
+
+def test_signal_send_async(basicApp, EmptyPlugin):
+    import asyncio
+    import threading
+    from groundwork.signals import STOP
+
+    plugin = EmptyPlugin(app=basicApp, name="AsyncPlugin")
+    plugin.activate()
+    plugin.signals.register("async_signal", "async test signal")
+
+    running = []
+    max_running = []
+    # Each receiver waits, until the expected amount of receivers is running. So the receivers of a send can only
+    # finish, if they are executed concurrently.
+    expected_running = [2]
+    all_running = {}
+
+    async def async_receiver(plugin, **kwargs):
+        running.append(1)
+        max_running.append(len(running))
+        event = all_running.setdefault("event", asyncio.Event())
+        if len(running) >= expected_running[0]:
+            event.set()
+        await asyncio.wait_for(event.wait(), 5)
+        running.pop()
+        return kwargs["value"] * 2
+
+    def run(awaitable):
+        all_running.clear()
+        return asyncio.run(awaitable)
+
+    def sync_receiver(plugin, **kwargs):
+        return kwargs["value"]
+
+    plugin.signals.connect("async_receiver_1", "async_signal", async_receiver, "async receiver")
+    plugin.signals.connect("async_receiver_2", "async_signal",
+                           lambda plugin, **kwargs: async_receiver(plugin, **kwargs), "async receiver")
+    plugin.signals.connect("sync_receiver", "async_signal", sync_receiver, "sync receiver")
+
+    answers = run(plugin.signals.send_async("async_signal", value=21))
+    assert [answer[1] for answer in answers] == [42, 42, 21]
+    assert answers[0][0] == async_receiver
+    assert max(max_running) == 2
+
+    expected_running[0] = 1
+    del max_running[:]
+    answers = run(basicApp.signals.send_async("async_signal", plugin, max_concurrency=1, value=1))
+    assert [answer[1] for answer in answers] == [2, 2, 1]
+    assert max(max_running) == 1
+
+    # Same result shape as send() for plain receivers
+    answers = asyncio.run(basicApp.signals.send_async("test", basicApp, text="test"))
+    assert answers == basicApp.signals.send("test", basicApp, text="test")
+
+    # Same as send(): plain receivers can stop the signal, threaded receivers run in the thread pool
+    plugin.signals.register("async_stop", "async signal with stop")
+    main_thread = threading.current_thread()
+    plugin.signals.connect("async_threaded", "async_stop",
+                           lambda plugin, **kwargs: threading.current_thread() is not main_thread, "threaded receiver",
+                           threaded=True, priority=2)
+    plugin.signals.connect("async_stopping", "async_stop", lambda plugin, **kwargs: STOP, "stopping receiver",
+                           priority=1)
+    plugin.signals.connect("async_stopped", "async_stop", async_receiver, "stopped receiver")
+    answers = asyncio.run(plugin.signals.send_async("async_stop", value=1))
+    assert [answer[1] for answer in answers] == [True, STOP]
+
+    # Same modes as send(): history, metrics, coalescing and queues
+    plugin.signals.register("async_history", "async signal with history", history=5)
+    plugin.signals.connect("async_history_receiver", "async_history", async_receiver, "async receiver")
+    basicApp.signals.enable_stats()
+    run(plugin.signals.send_async("async_history", value=1))
+    assert [entry.receivers for entry in basicApp.signals.get_history("async_history")] == [1]
+    assert basicApp.signals.get_stats("async_history")["count"] == 1
+    basicApp.signals.disable_stats()
+
+    delivered = []
+    plugin.signals.register("async_coalesced", "coalesced async signal", coalesce=True)
+    plugin.signals.register("async_queued", "queued async signal", queued=True)
+    for signal in ["async_coalesced", "async_queued"]:
+        plugin.signals.connect("%s_receiver" % signal, signal,
+                               lambda plugin, **kwargs: delivered.append(kwargs["value"]), "receiver")
+    assert asyncio.run(plugin.signals.send_async("async_coalesced", value="coalesced")) == []
+    assert asyncio.run(plugin.signals.send_async("async_queued", value="queued")) == []
+    plugin.signals.flush("async_coalesced")
+    basicApp.signals.shutdown()
+    assert sorted(delivered) == ["coalesced", "queued"]
+
+
+def test_signal_threaded_receivers(basicApp, EmptyPlugin):
+    import threading
+    from concurrent.futures import Future, TimeoutError
+    from groundwork.signals import wait
+
+    plugin = EmptyPlugin(app=basicApp, name="ThreadedPlugin")
+    plugin.activate()
+    plugin.signals.register("threaded_signal", "threaded test signal")
+
+    release = threading.Event()
+    # Both slow receivers must wait at the barrier at the same time. So they can only finish, if they run in parallel.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def slow_receiver(plugin, **kwargs):
+        release.wait(5)
+        barrier.wait()
+        return threading.current_thread().name
+
+    def inline_receiver(plugin, **kwargs):
+        return threading.current_thread().name
+
+    plugin.signals.connect("slow_receiver_1", "threaded_signal", slow_receiver, "slow receiver", threaded=True)
+    plugin.signals.connect("slow_receiver_2", "threaded_signal", lambda plugin, **kwargs: slow_receiver(plugin),
+                           "slow receiver", threaded=True)
+    plugin.signals.connect("inline_receiver", "threaded_signal", inline_receiver, "inline receiver")
+
+    answers = plugin.signals.send("threaded_signal")
+    # Sender is not blocked by threaded receivers, which wait for the release
+    assert isinstance(answers[0][1], Future)
+    assert isinstance(answers[1][1], Future)
+    assert not answers[0][1].done() and not answers[1][1].done()
+    assert answers[2][1] == threading.current_thread().name
+
+    with pytest.raises(TimeoutError):
+        wait(answers, timeout=0.01)
+    release.set()
+    results = wait(answers, timeout=5)
+    assert results[0][0] == slow_receiver
+    assert results[0][1] != threading.current_thread().name
+
+    # Signal wide threading
+    plugin.signals.register("threaded_signal_2", "threaded test signal", threaded=True)
+    plugin.signals.connect("inline_receiver_2", "threaded_signal_2", inline_receiver, "inline receiver")
+    answers = wait(plugin.signals.send("threaded_signal_2"), timeout=5)
+    assert answers[0][1] != threading.current_thread().name
+
+
+def test_signal_threaded_receivers_cancellation(EmptyPlugin, tmpdir):
+    import threading
+    from groundwork import App
+    from groundwork.signals import wait
+
+    config = tmpdir.join("config.py")
+    config.write("GROUNDWORK_SIGNALS_WORKERS = 1\n")
+    app = App([str(config)], strict=True)
+    assert app.signals.executor.max_workers == 1
+    plugin = EmptyPlugin(app=app, name="CancelPlugin")
+    plugin.activate()
+    plugin.signals.register("cancel_signal", "cancel test signal")
+
+    blocker = threading.Event()
+
+    def blocking_receiver(plugin, **kwargs):
+        blocker.wait(5)
+
+    def failing_receiver(plugin, **kwargs):
+        raise ValueError("failing receiver")
+
+    plugin.signals.connect("blocking_receiver", "cancel_signal", blocking_receiver, "blocking", threaded=True)
+    first = plugin.signals.send("cancel_signal")
+    second = plugin.signals.send("cancel_signal")
+    assert app.signals.executor.pending() == 2
+
+    # The single worker is blocked by the first send. So the second one is not started and gets cancelled.
+    plugin.deactivate()
+    assert second[0][1].cancelled()
+    blocker.set()
+    wait(first, timeout=5)
+    assert app.signals.executor.pending() == 0
+
+    plugin.activate()
+    plugin.signals.register("cancel_signal", "cancel test signal")
+    plugin.signals.connect("failing_receiver", "cancel_signal", failing_receiver, "failing", threaded=True)
+    with pytest.raises(ValueError):
+        wait(plugin.signals.send("cancel_signal"), timeout=5)
+    app.signals.shutdown()
+
+
+def test_signal_queued_delivery(basicApp, EmptyPlugin, monkeypatch):
+    import threading
+
+    plugin = EmptyPlugin(app=basicApp, name="QueuedPlugin")
+    plugin.activate()
+    plugin.signals.register("queued_signal", "queued test signal", queued=True, queue_size=2, overflow="drop_newest")
+
+    gate = threading.Event()
+    received = []
+
+    def receiver(plugin, **kwargs):
+        gate.wait(5)
+        received.append(kwargs["value"])
+
+    plugin.signals.connect("queued_receiver", "queued_signal", receiver, "queued receiver")
+
+    # The first signal gets taken by the dispatcher thread, which waits for the gate. Two more fit into the queue.
+    assert plugin.signals.send("queued_signal", value=0) == []
+    _wait_until(lambda: basicApp.signals.signals["queued_signal"].queue.depth == 0)
+    for value in range(1, 6):
+        plugin.signals.send("queued_signal", value=value)
+
+    stats = basicApp.signals.queue_stats()["queued_signal"]
+    assert stats["depth"] == 2
+    assert stats["max_depth"] == 2
+    assert stats["dropped"] == 3
+    assert stats["enqueued"] == 3
+
+    gate.set()
+    _wait_until(lambda: len(received) == 3)
+    assert received == [0, 1, 2]
+    _wait_until(lambda: basicApp.signals.queue_stats()["queued_signal"]["delivered"] == 3)
+
+    # drop_oldest keeps the newest signals
+    gate.clear()
+    del received[:]
+    plugin.signals.unregister("queued_signal")
+    plugin.signals.register("queued_signal", "queued test signal", queued=True, queue_size=2, overflow="drop_oldest")
+    plugin.signals.send("queued_signal", value=0)
+    _wait_until(lambda: basicApp.signals.signals["queued_signal"].queue.depth == 0)
+    for value in range(1, 6):
+        plugin.signals.send("queued_signal", value=value)
+    gate.set()
+    _wait_until(lambda: len(received) == 3)
+    assert received == [0, 4, 5]
+
+    # block lets the sender wait, until there is space in the queue
+    gate.clear()
+    del received[:]
+    plugin.signals.unregister("queued_signal")
+    plugin.signals.register("queued_signal", "queued test signal", queued=True, queue_size=1)
+    plugin.signals.send("queued_signal", value=0)
+    _wait_until(lambda: basicApp.signals.signals["queued_signal"].queue.depth == 0)
+    plugin.signals.send("queued_signal", value=1)
+
+    # The dispatcher calls wait() of its condition, if a sender has to wait for space in the queue
+    condition = basicApp.signals.queue_dispatcher._condition
+    condition_wait = condition.wait
+    blocked = threading.Event()
+
+    def wait(*args, **kwargs):
+        if threading.current_thread() is sender:
+            blocked.set()
+        return condition_wait(*args, **kwargs)
+
+    monkeypatch.setattr(condition, "wait", wait, raising=False)
+    sender = threading.Thread(target=plugin.signals.send, args=("queued_signal",), kwargs={"value": 2})
+    sender.start()
+    assert blocked.wait(5)
+    assert received == []
+    gate.set()
+    sender.join(5)
+    assert not sender.is_alive()
+
+    basicApp.signals.shutdown()
+    assert received == [0, 1, 2]
+    stats = basicApp.signals.queue_stats()["queued_signal"]
+    assert stats["dropped"] == 0
+    assert stats["max_depth"] == 1
+
+
+def _wait_until(condition, timeout=5):
+    import time
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end, "Condition not reached in %s seconds" % timeout
+        time.sleep(0.005)
+
+
+def test_signal_send_many(basicApp, EmptyPlugin):
+    from groundwork.signals import wait
+
+    plugin = EmptyPlugin(app=basicApp, name="BatchPlugin")
+    plugin.activate()
+    plugin.signals.register("batch_signal", "batch test signal")
+
+    batches = []
+
+    def item_receiver(plugin, **kwargs):
+        return kwargs["value"]
+
+    def batch_receiver(plugin, **kwargs):
+        raise AssertionError("Must not be called for send_many")
+
+    def batch_function(plugin, payloads):
+        batches.append(payloads)
+        return sum(payload["value"] for payload in payloads)
+
+    plugin.signals.connect("item_receiver", "batch_signal", item_receiver, "item receiver")
+    plugin.signals.connect("batch_receiver", "batch_signal", batch_receiver, "batch receiver",
+                           batch_function=batch_function)
+    plugin.signals.connect("threaded_receiver", "batch_signal", item_receiver, "threaded receiver", threaded=True,
+                           sender=plugin)
+
+    payloads = [{"value": value} for value in range(5)]
+    answers = wait(plugin.signals.send_many("batch_signal", payloads), timeout=5)
+    assert answers[0] == (item_receiver, [0, 1, 2, 3, 4])
+    assert answers[1] == (batch_function, 10)
+    assert len(answers) == 2  # item_receiver is connected twice, so it gets called only once per payload
+    assert batches == [payloads]
+
+    # Generators are accepted as well
+    answers = basicApp.signals.send_many("batch_signal", basicApp, ({"value": value} for value in range(3)))
+    assert answers == [(item_receiver, [0, 1, 2]), (batch_function, 3)]
+
+
+def test_signal_stats(basicApp, EmptyPlugin):
+    import time
+
+    plugin = EmptyPlugin(app=basicApp, name="StatsPlugin")
+    plugin.activate()
+    plugin.signals.register("stats_signal", "stats test signal")
+
+    def slow_receiver(plugin, **kwargs):
+        time.sleep(0.01)
+
+    def failing_receiver(plugin, **kwargs):
+        raise ValueError("failing receiver")
+
+    plugin.signals.connect("slow_receiver", "stats_signal", slow_receiver, "slow receiver")
+
+    # Disabled by default
+    assert basicApp.signals.stats_enabled is False
+    plugin.signals.send("stats_signal")
+    assert basicApp.signals.get_stats("stats_signal") is None
+
+    basicApp.signals.enable_stats()
+    for i in range(3):
+        plugin.signals.send("stats_signal")
+    plugin.signals.send_many("stats_signal", [{}, {}])
+
+    stats = basicApp.signals.get_stats("stats_signal")
+    assert stats["count"] == 5
+    assert stats["exceptions"] == 0
+    receiver_stats = basicApp.signals.get_receiver_stats("slow_receiver")
+    assert receiver_stats["count"] == 5
+    assert receiver_stats["total_time"] >= 0.05
+    # Percentiles are upper bounds of their histogram bucket, which are at most twice the real value
+    assert 0.01 <= receiver_stats["p50"] <= 0.04
+    assert receiver_stats["p99"] <= receiver_stats["max_time"]
+
+    plugin.signals.connect("failing_receiver", "stats_signal", failing_receiver, "failing receiver")
+    with pytest.raises(ValueError):
+        plugin.signals.send("stats_signal")
+    assert basicApp.signals.get_stats("stats_signal")["exceptions"] == 1
+    assert basicApp.signals.get_receiver_stats("failing_receiver")["exceptions"] == 1
+    assert "stats_signal" in basicApp.signals.get_stats()
+
+    basicApp.signals.disable_stats()
+    plugin.signals.disconnect("failing_receiver")
+    plugin.signals.send("stats_signal")
+    assert basicApp.signals.get_stats("stats_signal")["count"] == 6
+
+    basicApp.signals.reset_stats()
+    assert basicApp.signals.get_stats() == {}
+
+
+def test_latency_histogram():
+    from groundwork.signals_stats import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    assert histogram.percentile(99) == 0.0
+    for i in range(99):
+        histogram.add(0.000003)
+    histogram.add(0.5)
+    assert histogram.count == 100
+    assert 0.000003 <= histogram.percentile(50) <= 0.000006
+    assert 0.000003 <= histogram.percentile(99) <= 0.000006
+    assert histogram.percentile(100) == 0.5
+    assert abs(histogram.mean - (99 * 0.000003 + 0.5) / 100) < 1e-9
+
+
+def test_signal_history(basicApp, EmptyPlugin):
+    plugin = EmptyPlugin(app=basicApp, name="HistoryPlugin")
+    plugin.activate()
+    plugin.signals.register("history_signal", "history test signal", history=3)
+    plugin.signals.register("no_history_signal", "signal without history")
+
+    def failing_receiver(plugin, **kwargs):
+        if kwargs.get("fail", False):
+            raise ValueError("failing receiver")
+
+    plugin.signals.connect("history_receiver", "history_signal", failing_receiver, "history receiver")
+
+    assert basicApp.signals.get_history("history_signal") == []
+    assert basicApp.signals.get_history("no_history_signal") == []
+    from groundwork.signals import UnknownSignal
+    with pytest.raises(UnknownSignal):
+        basicApp.signals.get_history("unknown_signal")
+
+    for number in range(4):
+        plugin.signals.send("history_signal", number=number)
+    history = basicApp.signals.get_history("history_signal")
+    # Buffer keeps the last 3 sends only, oldest first
+    assert len(history) == 3
+    assert basicApp.signals.get("history_signal").history.total == 4
+    assert [entry.kwargs for entry in history] == [("number",)] * 3
+    # Entries are preallocated and the tuple of keyword names gets reused for sends with the same keywords
+    entry_ids = [id(entry) for entry in basicApp.signals.get("history_signal").history._entries]
+    assert history[0].kwargs is history[-1].kwargs
+    assert history[0].timestamp <= history[-1].timestamp
+    assert history[-1].plugin == "HistoryPlugin"
+    assert history[-1].receivers == 1
+    assert history[-1].duration >= 0
+    assert not history[-1].failed
+
+    with pytest.raises(ValueError):
+        plugin.signals.send("history_signal", fail=True)
+    assert basicApp.signals.get_history("history_signal")[-1].failed
+
+    plugin.signals.send_many("history_signal", [{"a": 1}, {"b": 2}])
+    history = basicApp.signals.get_history("history_signal")
+    assert [entry.kwargs for entry in history[-2:]] == [("a",), ("b",)]
+
+    assert [id(entry) for entry in basicApp.signals.get("history_signal").history._entries] == entry_ids
+    # Returned entries are copies, which do not change by later sends
+    plugin.signals.send("history_signal", c=3)
+    assert [entry.kwargs for entry in history[-2:]] == [("a",), ("b",)]
+
+    basicApp.signals.get("history_signal").history.clear()
+    assert basicApp.signals.get_history("history_signal") == []
+
+
+def test_signal_pattern_receivers(basicApp, EmptyPlugin):
+    plugin = EmptyPlugin(app=basicApp, name="PatternPlugin")
+    plugin.activate()
+    calls = []
+
+    def db_receiver(plugin, **kwargs):
+        calls.append("db")
+
+    def insert_receiver(plugin, **kwargs):
+        calls.append("insert")
+
+    def exact_receiver(plugin, **kwargs):
+        calls.append("exact")
+
+    plugin.signals.register("db.insert", "insert signal")
+    plugin.signals.connect("db_receiver", "db.*", db_receiver, "all db signals")
+    plugin.signals.connect("exact_receiver", "db.insert", exact_receiver, "exact receiver")
+    plugin.signals.connect("insert_receiver", "db.*.insert", insert_receiver, "all inserts of tables")
+
+    plugin.signals.send("db.insert")
+    assert calls == ["db", "exact"]
+
+    # Signals, which get registered later, pick up the pattern receivers
+    calls[:] = []
+    plugin.signals.register("db.table.insert", "table insert signal")
+    plugin.signals.register("dbx", "no db signal")
+    plugin.signals.send("db.table.insert")
+    plugin.signals.send("dbx")
+    assert calls == ["db", "insert"]
+
+    # Lifecycle signals of plugins
+    lifecycle = []
+    plugin.signals.connect("lifecycle_receiver", "plugin_*_post",
+                           lambda plugin, **kwargs: lifecycle.append(plugin.name), "lifecycle")
+    other = EmptyPlugin(app=basicApp, name="OtherPatternPlugin")
+    other.activate()
+    other.deactivate()
+    assert lifecycle == ["OtherPatternPlugin", "OtherPatternPlugin"]
+
+    # Unregistered signals drop the pattern receivers and pick them up again after a new registration
+    calls[:] = []
+    plugin.signals.unregister("db.table.insert")
+    plugin.signals.register("db.table.insert", "table insert signal")
+    plugin.signals.send("db.table.insert")
+    assert calls == ["db", "insert"]
+
+    calls[:] = []
+    plugin.signals.disconnect("db_receiver")
+    plugin.signals.send("db.insert")
+    plugin.signals.send("db.table.insert")
+    assert calls == ["exact", "insert"]
+
+
+def test_signal_pattern_trie():
+    from groundwork.signals import SignalPatternTrie, Receiver, is_pattern
+
+    assert is_pattern("db.*")
+    assert is_pattern("plugin_?ctivate")
+    assert not is_pattern("db.insert")
+
+    receivers = [Receiver(name, pattern, lambda plugin, **kwargs: None, None)
+                 for name, pattern in [("all", "*"), ("db", "db.*"), ("db_table", "db.table.*"), ("other", "x*")]]
+    trie = SignalPatternTrie()
+    for receiver in receivers:
+        trie.add(receiver)
+    assert [receiver.name for receiver in trie.match("db.table.insert")] == ["all", "db", "db_table"]
+    assert [receiver.name for receiver in trie.match("db")] == ["all"]
+    assert trie.remove(receivers[2])
+    assert not trie.remove(receivers[2])
+    assert [receiver.name for receiver in trie.match("db.table.insert")] == ["all", "db"]
+    # Empty nodes get removed
+    assert "t" not in trie._root.children["d"].children["b"].children["."].children
+
+
+def test_signal_weak_receivers(emptyApp, EmptyPlugin):
+    import gc
+
+    class Handler(object):
+        def __init__(self):
+            self.calls = 0
+
+        def handle(self, plugin, **kwargs):
+            self.calls += 1
+
+    plugin = EmptyPlugin(app=emptyApp, name="WeakPlugin")
+    plugin.activate()
+    plugin.signals.register("weak_signal", "weak test signal")
+    handler = Handler()
+    plugin.signals.connect("weak_receiver", "weak_signal", handler.handle, "weak receiver", weak=True)
+    plugin.signals.connect("strong_receiver", "weak_signal", Handler().handle, "strong receiver")
+
+    assert len(plugin.signals.send("weak_signal")) == 2
+    assert handler.calls == 1
+    assert emptyApp.signals.get_receiver("weak_receiver").function == handler.handle
+
+    # The receiver does not keep the handler alive and gets removed together with it
+    del handler
+    gc.collect()
+    assert emptyApp.signals.get_receiver("weak_receiver") is None
+    assert len(plugin.signals.send("weak_signal")) == 1
+
+    # A gone sender removes the receiver too
+    sender = EmptyPlugin(app=emptyApp, name="WeakSender")
+    handler = Handler()
+    plugin.signals.connect("sender_receiver", "weak_signal", handler.handle, "sender receiver", sender=sender,
+                           weak=True)
+    assert emptyApp.signals.get_receiver("sender_receiver") is not None
+    emptyApp.plugins.remove("WeakSender")
+    del sender
+    gc.collect()
+    assert emptyApp.signals.get_receiver("sender_receiver") is None
+    assert emptyApp.signals.get_receiver(plugin=plugin).keys() == {"strong_receiver"}
+
+
+def test_signal_weak_receivers_plugin_churn(emptyApp, EmptyCommandPlugin):
+    import gc
+    import weakref
+
+    class ChurnPlugin(EmptyCommandPlugin):
+        def __init__(self, *args, **kwargs):
+            super(ChurnPlugin, self).__init__(*args, **kwargs)
+            self.signals.connect("%s_tick" % self.name, "tick", self.tick, "tick receiver", weak=True)
+
+        def tick(self, plugin, **kwargs):
+            return self.name
+
+    app = emptyApp
+    app.signals.register("tick", app, "tick signal")
+    receivers = len(app.signals.receivers)
+    plugins = []
+    gc.collect()
+    objects = len(gc.get_objects())
+
+    for number in range(10000):
+        name = "churn_plugin_%s" % number
+        plugin = app.plugins.initialise(ChurnPlugin, name)
+        if number % 2:
+            plugin.activate()
+        assert name in [answer for function, answer in app.signals.send("tick", app)]
+        app.plugins.remove(name)
+        if number % 1000 == 0:
+            plugins.append(weakref.ref(plugin))
+        del plugin
+        if number % 500 == 0:
+            gc.collect()
+    gc.collect()
+
+    assert all(plugin() is None for plugin in plugins)
+    assert app.plugins.get() == {}
+    assert len(app.signals.receivers) == receivers
+    assert len(app.signals._dispatchers["tick"]) == 0
+    # Leaked plugins would leave dozens of objects each. Only the loggers of the plugin names are kept by logging.
+    assert len(gc.get_objects()) - objects < 10 * 10000
+
+
+def test_signal_receiver_priority(basicApp, EmptyPlugin):
+    from groundwork.signals import STOP
+
+    plugin = EmptyPlugin(app=basicApp, name="PriorityPlugin")
+    plugin.activate()
+    plugin.signals.register("priority_signal", "priority test signal")
+    calls = []
+
+    def receiver(name, result=None):
+        def function(plugin, **kwargs):
+            calls.append(name)
+            if kwargs.get("stop_at", None) == name:
+                return STOP
+            return result
+        return function
+
+    plugin.signals.connect("default_1", "priority_signal", receiver("default_1"), "default priority")
+    plugin.signals.connect("low", "priority_signal", receiver("low"), "low priority", priority=-10)
+    plugin.signals.connect("high", "priority_signal", receiver("high"), "high priority", priority=10)
+    plugin.signals.connect("default_2", "priority_signal", receiver("default_2"), "default priority")
+    plugin.signals.connect("pattern_high", "priority_*", receiver("pattern_high"), "pattern", priority=5)
+
+    answers = plugin.signals.send("priority_signal")
+    assert calls == ["high", "pattern_high", "default_1", "default_2", "low"]
+    assert len(answers) == 5
+
+    # A receiver stops the propagation
+    calls[:] = []
+    answers = plugin.signals.send("priority_signal", stop_at="default_1")
+    assert calls == ["high", "pattern_high", "default_1"]
+    assert answers[-1][1] is STOP
+
+    # Same for send_many: Stopped payloads do not reach the following receivers
+    calls[:] = []
+    answers = plugin.signals.send_many("priority_signal", [{"stop_at": "high"}, {"stop_at": "default_2"}, {}])
+    assert calls == ["high", "high", "high", "pattern_high", "pattern_high", "default_1", "default_1",
+                     "default_2", "default_2", "low"]
+    assert [len(results) for function, results in answers] == [3, 2, 2, 2, 1]
+
+    # Also with collected metrics
+    basicApp.signals.enable_stats()
+    calls[:] = []
+    plugin.signals.send("priority_signal", stop_at="high")
+    assert calls == ["high"]
+    basicApp.signals.disable_stats()
+
+
+def test_signal_coalescing(basicApp, EmptyPlugin):
+    import time
+
+    plugin = EmptyPlugin(app=basicApp, name="CoalescePlugin")
+    plugin.activate()
+    other_plugin = EmptyPlugin(app=basicApp, name="CoalesceOtherPlugin")
+    other_plugin.activate()
+    calls = []
+
+    def receiver(plugin, **kwargs):
+        calls.append((plugin.name, kwargs))
+
+    # Flushed on explicit request only
+    plugin.signals.register("config_changed", "coalesced signal", coalesce=True)
+    plugin.signals.connect("config_receiver", "config_changed", receiver, "coalesced receiver")
+    for number in range(5):
+        assert plugin.signals.send("config_changed", key=number) == []
+    other_plugin.signals.send("config_changed", key="other")
+    assert calls == []
+    assert len(plugin.signals.flush("config_changed")) == 2
+    assert calls == [("CoalescePlugin", {"key": 4}), ("CoalesceOtherPlugin", {"key": "other"})]
+    assert plugin.signals.flush() == []
+    coalescer = basicApp.signals.get("config_changed").coalescer
+    assert coalescer.stats()["coalesced"] == 4
+    assert coalescer.stats()["delivered"] == 2
+
+    # Merged by a merge function and delivered after a time window
+    calls[:] = []
+    plugin.signals.register("index_dirty", "coalesced signal", coalesce=0.05,
+                            merge=lambda previous, current: {"keys": previous["keys"] + current["keys"]})
+    plugin.signals.connect("index_receiver", "index_dirty", receiver, "coalesced receiver")
+    plugin.signals.send_many("index_dirty", [{"keys": [1]}, {"keys": [2]}])
+    plugin.signals.send("index_dirty", keys=[3])
+    end = time.time() + 5
+    while not calls and time.time() < end:
+        time.sleep(0.01)
+    assert calls == [("CoalescePlugin", {"keys": [1, 2, 3]})]
+
+    # Debounced signals get delivered after a quiet period
+    calls[:] = []
+    plugin.signals.register("debounced", "debounced signal", coalesce=0.2, debounce=True)
+    plugin.signals.connect("debounced_receiver", "debounced", receiver, "debounced receiver")
+    for number in range(5):
+        plugin.signals.send("debounced", key=number)
+        time.sleep(0.05)
+    assert calls == []
+    end = time.time() + 5
+    while not calls and time.time() < end:
+        time.sleep(0.01)
+    assert calls == [("CoalescePlugin", {"key": 4})]
+
+    # Pending sends get dropped by unregistering
+    calls[:] = []
+    plugin.signals.send("debounced", key="dropped")
+    plugin.signals.unregister("debounced")
+    time.sleep(0.3)
+    assert calls == []
+
+    # Pending sends get delivered by a shutdown
+    plugin.signals.send("config_changed", key="shutdown")
+    basicApp.signals.shutdown()
+    assert calls == [("CoalescePlugin", {"key": "shutdown"})]
+
+    # Slow receivers do not block the scheduler
+    import threading
+    release = threading.Event()
+    delivered = threading.Event()
+    scheduled = threading.Event()
+
+    def slow_receiver(plugin, **kwargs):
+        delivered.set()
+        release.wait(5)
+
+    plugin.signals.register("slow_coalesced", "coalesced signal", coalesce=0.01)
+    plugin.signals.connect("slow_receiver", "slow_coalesced", slow_receiver, "slow receiver")
+    plugin.signals.send("slow_coalesced")
+    assert delivered.wait(5)
+    basicApp.scheduler.schedule(0, scheduled.set)
+    assert scheduled.wait(1)
+    release.set()
+    basicApp.signals.shutdown()
@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+
+from groundwork.signals_bridge import SignalBridge, RemoteSender, encode_frame, decode_frame, BridgeProtocolError
+
+
+def _wait_until(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition():
+        if time.time() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _bridge_app(results=None):
+    from groundwork import App
+    app = App(plugins=[], strict=True)
+    app.signals.register("cache_invalidate", app, "cache invalidation")
+
+    def invalidate(plugin, **kwargs):
+        if results is not None:
+            results.put((os.getpid(), kwargs["key"], isinstance(plugin, RemoteSender)))
+
+    app.signals.connect("invalidate", "cache_invalidate", invalidate, app, "invalidation")
+    return app
+
+
+def _worker(address, results, commands):
+    # Runs in a separate process
+    app = _bridge_app(results)
+    bridge = SignalBridge(app, ["cache_invalidate"])
+    bridge.connect(address)
+    _wait_until(lambda: bridge.peers == 1)
+    results.put((os.getpid(), "connected", False))
+    while True:
+        command = commands.get()
+        if command is None:
+            break
+        app.signals.send("cache_invalidate", app, key=command)
+    bridge.close()
+
+
+def test_bridge_frames():
+    messages = [b"first", b"", b"x" * 1000]
+    assert decode_frame(encode_frame(messages)) == messages
+    assert decode_frame(encode_frame([])) == []
+    with pytest.raises(BridgeProtocolError):
+        decode_frame(encode_frame(messages) + b"garbage")
+    with pytest.raises(BridgeProtocolError):
+        decode_frame(b"\x99" + encode_frame(messages)[1:])
+
+
+def test_bridge_pipe():
+    received_a = []
+    received_b = []
+    app_a = _bridge_app()
+    app_b = _bridge_app()
+    app_a.signals.connect("record", "cache_invalidate", lambda plugin, **kwargs: received_a.append(kwargs["key"]),
+                          app_a, "record")
+    app_b.signals.connect("record", "cache_invalidate", lambda plugin, **kwargs: received_b.append(kwargs["key"]),
+                          app_b, "record")
+    bridge_a = SignalBridge(app_a, ["cache_invalidate"], batch_size=10)
+    bridge_b = SignalBridge(app_b, ["cache_invalidate"])
+    connection_a, connection_b = multiprocessing.Pipe()
+    bridge_a.attach(connection_a)
+    bridge_b.attach(connection_b)
+
+    for number in range(25):
+        app_a.signals.send("cache_invalidate", app_a, key=number)
+    assert _wait_until(lambda: len(received_b) == 25)
+    assert received_b == list(range(25))
+    assert bridge_a.sent == 25
+    assert bridge_b.received == 25
+
+    app_b.signals.send("cache_invalidate", app_b, key="back")
+    assert _wait_until(lambda: received_a[-1:] == ["back"])
+    # Received signals are not sent back
+    time.sleep(0.1)
+    assert received_b.count("back") == 1
+    assert received_a.count("back") == 1
+    assert bridge_b.received == 25
+
+    # Not picklable arguments are dropped
+    app_a.signals.send("cache_invalidate", app_a, key="lambda", data=lambda: None)
+    assert bridge_a.dropped == 1
+
+    bridge_a.close()
+    bridge_b.close()
+    assert app_a.signals.get_receiver("signal_bridge_%s_cache_invalidate" % bridge_a.id) is None
+    assert _wait_until(lambda: bridge_b.peers == 0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses Unix domain sockets")
+def test_bridge_processes(tmpdir):
+    address = str(tmpdir.join("bridge.sock"))
+    results = multiprocessing.Queue()
+    commands = [multiprocessing.Queue() for number in range(3)]
+    workers = [multiprocessing.Process(target=_worker, args=(address, results, commands[number]))
+               for number in range(3)]
+    # Workers get started before the main process listens, so they must reconnect
+    for worker in workers:
+        worker.start()
+    try:
+        time.sleep(0.2)
+        local = []
+        app = _bridge_app()
+        app.signals.connect("record", "cache_invalidate", lambda plugin, **kwargs: local.append(kwargs["key"]),
+                            app, "record")
+        bridge = SignalBridge(app, ["cache_invalidate"])
+        bridge.listen(address)
+        pids = set(results.get(timeout=20)[0] for worker in workers)
+        assert pids == set(worker.pid for worker in workers)
+        assert _wait_until(lambda: bridge.peers == 3)
+
+        # From the listening process to all workers
+        app.signals.send("cache_invalidate", app, key="main")
+        received = [results.get(timeout=10) for worker in workers]
+        assert sorted(received) == sorted((worker.pid, "main", True) for worker in workers)
+
+        # From a worker to the listening process and all other workers. The sending worker gets it locally only.
+        commands[0].put("worker")
+        received = [results.get(timeout=10) for worker in workers]
+        assert sorted(received) == sorted([(workers[0].pid, "worker", False), (workers[1].pid, "worker", True),
+                                           (workers[2].pid, "worker", True)])
+        assert _wait_until(lambda: local == ["main", "worker"])
+        time.sleep(0.2)
+        assert results.empty()
+
+        bridge.close()
+    finally:
+        for command in commands:
+            command.put(None)
+        for worker in workers:
+            worker.join(10)
+            if worker.is_alive():
+                worker.terminate()
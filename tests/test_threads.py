@@ -1,5 +1,6 @@
 import pytest
 from groundwork.patterns.gw_threads_pattern import ThreadExistsException
+from groundwork.scheduler import ScheduledCall
 
 
 def test_thread_plugin_activation(basicApp):
@@ -22,3 +23,392 @@ def test_thread_exists(basicApp):
     plugin = basicApp.plugins.get("ThreadPlugin")
     with pytest.raises(ThreadExistsException):
         plugin.threads.register("test_thread", None)
+
+
+def test_thread_run_multiple_times(basicApp):
+    plugin = basicApp.plugins.get("ThreadPlugin")
+    calls = []
+
+    def thread_function(plugin, number=None):
+        calls.append(number)
+        return number * 2
+
+    thread = plugin.threads.register("test_thread_multiple", thread_function, "runs multiple times")
+    futures = [thread.run(number=number) for number in range(3)]
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4]
+    assert sorted(calls) == [0, 1, 2]
+    for future in futures:
+        assert future.thread is thread
+        assert future.time_start <= future.time_end
+    assert thread.running is False
+
+
+def test_thread_executor_backend(basicApp):
+    import threading
+
+    plugin = basicApp.plugins.get("ThreadPlugin")
+    event = threading.Event()
+
+    def thread_function(plugin, fail=False):
+        event.wait(5)
+        if fail:
+            raise ValueError("failed")
+        return threading.current_thread().name
+
+    thread = plugin.threads.register("test_thread_executor", thread_function, "executor thread", backend="executor")
+    futures = [thread.run() for number in range(10)]
+    failed = thread.run(fail=True)
+    # running gets set, before run() returns
+    assert thread.running is True
+    event.set()
+    names = set(future.result(timeout=5) for future in futures)
+    assert len(names) <= basicApp.threads.max_workers
+    with pytest.raises(ValueError):
+        failed.result(timeout=5)
+    assert failed.time_end is not None
+    assert thread.running is False
+    basicApp.threads.shutdown()
+
+    with pytest.raises(ValueError):
+        plugin.threads.register("test_thread_unknown", thread_function, backend="unknown")
+
+
+def _process_function(number, fail=False):
+    # Module level, so that it can be pickled for the process pool
+    import os
+    if fail:
+        raise ValueError("failed")
+    return os.getpid(), number * number
+
+
+def test_thread_process_backend(basicApp):
+    import os
+
+    plugin = basicApp.plugins.get("ThreadPlugin")
+    completed = []
+    thread = plugin.threads.register("test_thread_process", _process_function, "process thread", backend="process",
+                                     completion_signal="test_thread_process_done")
+    plugin.signals.connect("test_thread_process_receiver", "test_thread_process_done",
+                           lambda plugin, thread, future: completed.append(future), "completion receiver")
+
+    futures = [thread.run(number=number) for number in range(5)]
+    results = [future.result(timeout=30) for future in futures]
+    assert [result for pid, result in results] == [0, 1, 4, 9, 16]
+    assert os.getpid() not in set(pid for pid, result in results)
+    assert futures[0].time_start <= futures[0].time_end
+
+    failed = thread.run(number=1, fail=True)
+    with pytest.raises(ValueError):
+        failed.result(timeout=30)
+    assert failed.time_start is not None
+
+    # Not picklable functions fail via the future
+    not_picklable = plugin.threads.register("test_thread_process_lambda", lambda number: number, backend="process")
+    with pytest.raises(Exception):
+        not_picklable.run(number=1).result(timeout=30)
+
+    # The completion signal gets sent after the result is set
+    import time
+    end = time.time() + 5
+    while len(completed) < 6 and time.time() < end:
+        time.sleep(0.01)
+    assert len(completed) == 6
+    assert thread.running is False
+    basicApp.threads.shutdown()
+
+
+class _ManualScheduler(object):
+    """
+    Scheduler with a manual clock. Scheduled calls get executed by :func:`advance` only.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.calls = []
+
+    def clock(self):
+        return self.now
+
+    def schedule(self, delay, function, args=(), kwargs=None):
+        call = ScheduledCall(self.now + delay, function, args, kwargs or {})
+        self.calls.append(call)
+        return call
+
+    def cancel(self, call):
+        if call.state != ScheduledCall.PENDING:
+            return False
+        call.state = ScheduledCall.CANCELLED
+        return True
+
+    def pending(self):
+        return [call for call in self.calls if call.state == ScheduledCall.PENDING]
+
+    def advance(self, seconds):
+        """
+        Moves the clock forward and executes all calls, which are due. Without any delay of the scheduler.
+        """
+        self.now += seconds
+        while True:
+            due = [call for call in self.pending() if call.when <= self.now]
+            if not due:
+                return
+            call = min(due, key=lambda call: call.when)
+            call.state = ScheduledCall.RUNNING
+            call.function(*call.args, **call.kwargs)
+            call.state = ScheduledCall.DONE
+
+
+def _wait_until_idle(*threads):
+    # The schedule gets idle by a callback of the future, which may be called after the function has returned.
+    import time
+    end = time.time() + 5
+    while any(thread.schedule._running for thread in threads):
+        assert time.time() < end, "Scheduled runs did not finish in 5 seconds"
+        time.sleep(0.001)
+
+
+def _create_schedule_plugin(app):
+    from groundwork.patterns import GwThreadsPattern
+
+    class SchedulePlugin(GwThreadsPattern):
+        def __init__(self, *args, **kwargs):
+            self.name = "SchedulePlugin"
+            super(SchedulePlugin, self).__init__(*args, **kwargs)
+
+        def activate(self):
+            pass
+
+        def deactivate(self):
+            pass
+
+    plugin = SchedulePlugin(app=app)
+    plugin.activate()
+    return plugin
+
+
+def test_thread_schedule(basicApp):
+    import threading
+
+    plugin = _create_schedule_plugin(basicApp)
+    calls = threading.Semaphore(0)
+
+    def heartbeat(plugin):
+        calls.release()
+
+    # Runs get started by the scheduler of the application
+    thread = plugin.threads.schedule("heartbeat", heartbeat, 0.02, initial_delay=0, jitter=0.005)
+    assert thread.schedule.next_run is not None
+    for run in range(5):
+        assert calls.acquire(timeout=5)
+    assert thread.schedule.runs >= 5
+
+    with pytest.raises(ValueError):
+        plugin.threads.schedule("invalid", heartbeat, 1, missed="unknown")
+    with pytest.raises(ValueError):
+        plugin.threads.schedule("invalid", heartbeat, "61 * * * *")
+    assert plugin.threads.get("invalid") is None
+
+    # Schedules get cancelled on deactivation
+    plugin.deactivate()
+    assert thread.schedule.cancelled
+    assert thread.schedule.next_run is None
+    assert plugin.threads.get() == {}
+
+
+def test_thread_schedule_missed_runs(basicApp, monkeypatch):
+    import threading
+
+    scheduler = _ManualScheduler()
+    monkeypatch.setattr(basicApp, "scheduler", scheduler)
+    plugin = _create_schedule_plugin(basicApp)
+    block = threading.Event()
+    started = threading.Semaphore(0)
+    finished = threading.Semaphore(0)
+
+    def slow(plugin):
+        started.release()
+        block.wait(5)
+        finished.release()
+
+    def quick(plugin):
+        started.release()
+        finished.release()
+
+    quick_thread = plugin.threads.schedule("quick", quick, 1)
+    scheduler.advance(0.5)
+    assert quick_thread.schedule.runs == 0
+    for run in range(3):
+        scheduler.advance(1)
+        assert started.acquire(timeout=5) and finished.acquire(timeout=5)
+        _wait_until_idle(quick_thread)
+    assert quick_thread.schedule.runs == 3
+    assert quick_thread.schedule.missed_runs == 0
+    quick_thread.schedule.cancel()
+
+    # Overlapping runs are missed
+    skipped = plugin.threads.schedule("slow_skip", slow, 1, missed="skip")
+    once = plugin.threads.schedule("slow_once", slow, 1, missed="run_once")
+    every = plugin.threads.schedule("slow_all", slow, 1, missed="run_all")
+    scheduler.advance(1)
+    for run in range(3):
+        assert started.acquire(timeout=5)
+    for tick in range(3):
+        scheduler.advance(1)
+    assert [thread.schedule.runs for thread in [skipped, once, every]] == [1, 1, 1]
+    assert [thread.schedule.missed_runs for thread in [skipped, once, every]] == [3, 2, 0]
+
+    # Finished runs start the kept missed runs one after another
+    block.set()
+    for run in range(1 + 2 + 4):
+        assert finished.acquire(timeout=5)
+    _wait_until_idle(skipped, once, every)
+    assert [thread.schedule.runs for thread in [skipped, once, every]] == [1, 2, 4]
+
+    # A late scheduler misses all slots, which have passed: The next slot starts a run, the two slots after it
+    # have passed too.
+    scheduler.advance(3.5)
+    for run in range(1 + 2 + 3):
+        assert finished.acquire(timeout=5)
+    _wait_until_idle(skipped, once, every)
+    assert [thread.schedule.runs for thread in [skipped, once, every]] == [2, 4, 7]
+    assert [thread.schedule.missed_runs for thread in [skipped, once, every]] == [5, 3, 0]
+
+    # Schedules get cancelled on deactivation
+    plugin.deactivate()
+    assert scheduler.pending() == []
+    scheduler.advance(10)
+    assert [thread.schedule.runs for thread in [skipped, once, every]] == [2, 4, 7]
+
+
+def test_thread_cancellation(basicApp):
+    import threading
+    from groundwork.patterns import GwThreadsPattern
+
+    stopped = []
+    release = threading.Event()
+    # Released by each started worker run. Not yet started runs would get cancelled only.
+    started = threading.Semaphore(0)
+
+    class WorkerPlugin(GwThreadsPattern):
+        def __init__(self, *args, **kwargs):
+            self.name = kwargs.pop("name")
+            super(WorkerPlugin, self).__init__(*args, **kwargs)
+
+        def activate(self):
+            self.threads.register("%s_worker" % self.name, self.worker, "cooperative worker", backend="executor")
+            self.threads.register("%s_stubborn" % self.name, self.stubborn, "ignores cancellation")
+
+        def worker(self, plugin, cancel_token):
+            started.release()
+            while not cancel_token.wait(5):
+                pass
+            stopped.append(plugin.name)
+
+        def stubborn(self, plugin):
+            release.wait(5)
+
+        def deactivate(self):
+            pass
+
+    first = WorkerPlugin(app=basicApp, name="FirstWorkerPlugin")
+    first.activate()
+    second = WorkerPlugin(app=basicApp, name="SecondWorkerPlugin")
+    second.activate()
+    for plugin in [first, second]:
+        plugin.threads.get("%s_worker" % plugin.name).run()
+    assert started.acquire(timeout=5) and started.acquire(timeout=5)
+
+    # Deactivation stops the threads of the plugin and unregisters them
+    first.deactivate()
+    assert stopped == ["FirstWorkerPlugin"]
+    assert first.threads.get() == {}
+
+    # Threads, which ignore the token, get reported
+    second.threads.get("SecondWorkerPlugin_stubborn").run()
+    first.activate()
+    first.threads.get("FirstWorkerPlugin_worker").run()
+    assert started.acquire(timeout=5)
+    not_stopped = basicApp.shutdown(timeout=0.2)
+    assert not_stopped == ["SecondWorkerPlugin_stubborn"]
+    # Reverse activation order
+    assert stopped == ["FirstWorkerPlugin", "FirstWorkerPlugin", "SecondWorkerPlugin"]
+    release.set()
+
+    # Threads can be run again after a shutdown and get a new token
+    thread = second.threads.get("SecondWorkerPlugin_worker")
+    future = thread.run()
+    assert not thread.cancel_token.cancelled
+    assert thread.stop(timeout=5)
+    assert future.done()
+    assert thread.running is False
+
+    # Deactivation unregisters threads, which did not stop, too
+    release.clear()
+    stubborn = second.threads.get("SecondWorkerPlugin_stubborn")
+    future = stubborn.run()
+    basicApp.threads.stop_timeout = 0.1
+    second.deactivate()
+    assert second.threads.get() == {}
+    assert not future.done()
+    release.set()
+    assert future.result(timeout=5) is None
+
+
+def _square(number):
+    # Module level, so that it can be pickled for the process pool
+    return number * number
+
+
+def test_thread_map(basicApp):
+    import time
+
+    plugin = basicApp.plugins.get("ThreadPlugin")
+
+    # Ordered, lazily reading the items
+    consumed = []
+
+    def items():
+        for number in range(100):
+            consumed.append(number)
+            yield number
+
+    results = plugin.threads.map(_square, items(), chunksize=5, max_in_flight=2)
+    assert consumed == []
+    assert next(results) == 0
+    # At most max_in_flight chunks are submitted
+    assert len(consumed) <= 2 * 5 + 1
+    assert [0] + list(results) == [number * number for number in range(100)]
+    assert len(results.chunks) == 20
+    assert sorted(chunk.index for chunk in results.chunks) == list(range(20))
+    assert all(chunk.size == 5 and chunk.duration >= 0 for chunk in results.chunks)
+
+    # Unordered results are returned as soon as they are ready
+    def slow_first(number):
+        if number == 0:
+            time.sleep(0.2)
+        return number
+
+    results = list(plugin.threads.map(slow_first, range(10), ordered=False))
+    assert sorted(results) == list(range(10))
+    assert results[-1] == 0
+
+    # Process pool
+    assert list(plugin.threads.map(_square, range(20), chunksize=3, backend="process")) == \
+        [number * number for number in range(20)]
+
+    # Exceptions get raised by the iterator
+    def fail(number):
+        if number == 3:
+            raise ValueError("failed")
+        return number
+
+    results = plugin.threads.map(fail, range(10))
+    assert [next(results) for number in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError):
+        next(results)
+    with pytest.raises(StopIteration):
+        next(results)
+
+    with pytest.raises(ValueError):
+        plugin.threads.map(_square, range(10), chunksize=0)
+    basicApp.threads.shutdown()
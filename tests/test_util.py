@@ -0,0 +1,120 @@
+from groundwork.util import Registry, gw_get
+
+
+class RegistryObject:
+    def __init__(self, name, plugin):
+        self.name = name
+        self.plugin = plugin
+
+
+def test_registry_find():
+    registry = Registry()
+    plugin_a = object()
+    plugin_b = object()
+    registry["a1"] = RegistryObject("a1", plugin_a)
+    registry["a2"] = RegistryObject("a2", plugin_a)
+    registry["b1"] = RegistryObject("b1", plugin_b)
+
+    assert registry.find() is registry
+    assert registry.find("a1").name == "a1"
+    assert registry.find("unknown") is None
+    assert sorted(registry.find(plugin=plugin_a).keys()) == ["a1", "a2"]
+    assert registry.find("a1", plugin_a).name == "a1"
+    assert registry.find("a1", plugin_b) is None
+    assert registry.find(plugin=object()) == {}
+
+    # gw_get must return the same results for registries and normal dictionaries
+    for name, plugin in [(None, None), ("a1", None), (None, plugin_a), ("a1", plugin_b), ("x", plugin_a)]:
+        assert gw_get(registry, name, plugin) == gw_get(dict(registry), name, plugin)
+
+
+def test_registry_index_update():
+    registry = Registry()
+    plugin_a = object()
+    plugin_b = object()
+    registry["a1"] = RegistryObject("a1", plugin_a)
+    registry["a2"] = RegistryObject("a2", plugin_a)
+
+    # Result must be a copy, so that objects can be unregistered during iteration
+    for name in registry.find(plugin=plugin_a).keys():
+        del registry[name]
+    assert len(registry) == 0
+    assert registry.find(plugin=plugin_a) == {}
+
+    registry["x"] = RegistryObject("x", plugin_a)
+    registry["x"] = RegistryObject("x", plugin_b)
+    assert registry.find(plugin=plugin_a) == {}
+    assert list(registry.find(plugin=plugin_b).keys()) == ["x"]
+
+    assert registry.pop("x").plugin is plugin_b
+    assert registry.pop("x", None) is None
+    registry.update({"y": RegistryObject("y", plugin_a)}, z=RegistryObject("z", plugin_a))
+    registry.setdefault("y", RegistryObject("y", plugin_b))
+    assert sorted(registry.find(plugin=plugin_a).keys()) == ["y", "z"]
+    registry.clear()
+    assert registry.find(plugin=plugin_a) == {}
+
+
+def test_registry_index_dict_functions():
+    plugin_a = object()
+    plugin_b = object()
+
+    registry = Registry()
+    registry |= {"a1": RegistryObject("a1", plugin_a)}
+    assert list(registry.find(plugin=plugin_a).keys()) == ["a1"]
+
+    merged = registry | {"b1": RegistryObject("b1", plugin_b)}
+    assert isinstance(merged, Registry)
+    assert list(merged.find(plugin=plugin_b).keys()) == ["b1"]
+    assert registry.find(plugin=plugin_b) == {}
+    merged = {"b1": RegistryObject("b1", plugin_b)} | registry
+    assert isinstance(merged, Registry)
+    assert sorted(merged.keys()) == ["a1", "b1"]
+
+    copied = registry.copy()
+    del copied["a1"]
+    assert list(registry.find(plugin=plugin_a).keys()) == ["a1"]
+    assert copied.find(plugin=plugin_a) == {}
+
+    import copy
+    for copied in [copy.copy(registry), copy.deepcopy(registry)]:
+        assert isinstance(copied, Registry)
+        assert len(copied.find(plugin=copied["a1"].plugin)) == 1
+
+    keys = Registry.fromkeys(["x", "y"])
+    assert isinstance(keys, Registry)
+    del keys["x"]
+    assert list(keys.keys()) == ["y"]
+    assert keys._plugin_index == {id(None): {"y": None}}
+
+    registry.setdefault("a2", RegistryObject("a2", plugin_a))
+    registry.popitem()
+    assert len(registry.find(plugin=plugin_a)) == len(registry)
+
+
+def test_registry_reused_plugin_id(monkeypatch):
+    import builtins
+    from groundwork import util
+
+    gone_plugin = object()
+    new_plugin = object()
+    # The id of a garbage collected plugin can be reused by a new plugin
+    monkeypatch.setattr(util, "id", lambda obj: 1 if obj in (gone_plugin, new_plugin) else builtins.id(obj),
+                        raising=False)
+    registry = Registry()
+    registry["gone"] = RegistryObject("gone", gone_plugin)
+    assert registry.find(plugin=new_plugin) == {}
+    assert registry.find("gone", new_plugin) is None
+    registry["new"] = RegistryObject("new", new_plugin)
+    assert list(registry.find(plugin=new_plugin).keys()) == ["new"]
+
+
+def test_registry_plugin_deactivation(basicApp):
+    plugin = basicApp.plugins.get("BasicPlugin")
+    registries = [basicApp.signals.signals, basicApp.signals.receivers, basicApp.commands._commands,
+                  basicApp.documents.documents, basicApp.threads.threads, basicApp.shared_objects._shared_objects,
+                  basicApp.recipes.recipes]
+    assert any(id(plugin) in registry._plugin_index for registry in registries)
+    plugin.deactivate()
+    for registry in registries:
+        assert id(plugin) not in registry._plugin_index